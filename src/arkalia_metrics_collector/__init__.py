@@ -28,7 +28,7 @@ __email__ = "arkalia.luna.system@gmail.com"
 __license__ = "MIT"
 
 from .collectors.github_collector import GitHubCollector
-from .collectors.metrics_collector import MetricsCollector
+from .collectors.metrics_collector import MetricsCollector, collect_many
 from .collectors.multi_project_aggregator import MultiProjectAggregator
 from .exporters.badges_generator import BadgesGenerator
 from .exporters.external_exporters import (
@@ -44,6 +44,7 @@ from .validators.metrics_validator import MetricsValidator
 
 __all__ = [
     "MetricsCollector",
+    "collect_many",
     "GitHubCollector",
     "MultiProjectAggregator",
     "MetricsExporter",
@@ -5,6 +5,7 @@ Arkalia Metrics Collector - Interface en ligne de commande.
 Interface CLI principale pour utiliser le collecteur de métriques.
 """
 
+import json
 import sys
 from pathlib import Path
 from typing import Any
@@ -26,22 +27,136 @@ try:
     )
     from arkalia_metrics_collector.collectors.github_issues import GitHubIssues
     from arkalia_metrics_collector.collectors.metrics_alerts import MetricsAlerts
+    from arkalia_metrics_collector.collectors.metrics_collector import PHASES
+    from arkalia_metrics_collector.instrumentation import format_timings
+    from arkalia_metrics_collector.instrumentation.profiling import (
+        DEFAULT_PROFILE_TOP,
+        PROFILE_MODES,
+        create_profile,
+    )
+    from arkalia_metrics_collector.instrumentation.tracing import (
+        start_tracing,
+        stop_tracing,
+    )
 except ImportError as e:
     print(f"❌ Erreur d'import: {e}")
     print("📍 Assurez-vous que le package est installé correctement.")
     sys.exit(1)
 
 
+def _parse_phase_timeouts(
+    ctx: click.Context, param: click.Parameter, values: tuple[str, ...]
+) -> dict[str, float]:
+    """Convertit les options PHASE=SECONDES en dictionnaire."""
+    timeouts: dict[str, float] = {}
+    for value in values:
+        phase, _, seconds = value.partition("=")
+        phase = phase.strip()
+        if phase not in PHASES:
+            raise click.BadParameter(f"{value!r} (phases: {', '.join(PHASES)})")
+        try:
+            timeouts[phase] = float(seconds)
+        except ValueError:
+            raise click.BadParameter(
+                f"{value!r} (format attendu: PHASE=SECONDES)"
+            ) from None
+    return timeouts
+
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0}
+
+
+def _parse_deadline(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> float | None:
+    """Convertit une durée (5s, 500ms, 2m ou secondes) en secondes."""
+    if value is None:
+        return None
+    text = value.strip().lower()
+    number, factor = text, 1.0
+    for unit in ("ms", "s", "m"):
+        if text.endswith(unit):
+            number, factor = text[: -len(unit)], _DURATION_UNITS[unit]
+            break
+    try:
+        seconds = float(number) * factor
+    except ValueError:
+        raise click.BadParameter(f"{value!r} (ex: 5s, 500ms, 2m)") from None
+    if seconds <= 0:
+        raise click.BadParameter(f"{value!r} (durée positive attendue)")
+    return seconds
+
+
 @click.group()
 @click.version_option(version="1.1.0", prog_name="arkalia-metrics")
-def cli():
+@click.option(
+    "--profile",
+    type=click.Choice(PROFILE_MODES),
+    default=None,
+    help="Profiler la commande : cpu (cProfile, fichier .pstats) ou memory "
+    "(tracemalloc, pic et allocations par phase)",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Fichier du profil (défaut: arkalia-metrics.pstats ou "
+    "arkalia-metrics-memory.json)",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PROFILE_TOP,
+    show_default=True,
+    help="Lignes du résumé du profil",
+)
+@click.option(
+    "--trace",
+    "trace_output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Écrire une trace Chrome (chrome://tracing, ui.perfetto.dev) : "
+    "un span par phase, commande, requête et lot, une piste par worker",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    profile: str | None,
+    profile_output: str | None,
+    profile_top: int,
+    trace_output: str | None,
+):
     """
     Arkalia Metrics Collector - Outil professionnel de métriques Python.
 
     Collecte des métriques fiables sur vos projets Python en excluant
     automatiquement les venv, cache et dépendances.
     """
-    pass
+    if trace_output is not None:
+
+        def save_trace() -> None:
+            tracer = stop_tracing()
+            if tracer is not None:
+                path = tracer.save(trace_output)
+                click.echo(
+                    f"🧭 Trace ({len(tracer.spans)} spans) écrite dans: {path}",
+                    err=True,
+                )
+
+        start_tracing()
+        ctx.call_on_close(save_trace)
+    if profile is None:
+        return
+    profiler = create_profile(profile, profile_output, profile_top)
+
+    def finish() -> None:
+        # Sur la sortie d'erreur : la sortie standard reste exploitable
+        summary = profiler.stop()
+        click.echo(f"🔬 Profil {profile} écrit dans: {profiler.output}", err=True)
+        click.echo(summary, err=True)
+
+    profiler.start()
+    ctx.call_on_close(finish)
 
 
 @cli.command()
@@ -59,8 +174,143 @@ def cli():
     help="Format d'export (défaut: all)",
 )
 @click.option("--validate", "-v", is_flag=True, help="Valider les métriques collectées")
+@click.option(
+    "--config",
+    "config_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="Configuration YAML du projet (exclusions ajoutées aux exclusions par défaut)",
+)
+@click.option(
+    "--enumeration",
+    type=click.Choice(["auto", "git", "filesystem"]),
+    default="auto",
+    help="Moteur d'énumération des fichiers (défaut: auto, git ls-files si dépôt Git)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Workers pour l'analyse des fichiers (défaut: 1, 0 = un par CPU)",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Réutiliser les métriques des fichiers inchangés (.arkalia_cache)",
+)
+@click.option(
+    "--content-store",
+    type=click.Path(file_okay=False, dir_okay=True),
+    envvar="ARKALIA_CONTENT_STORE",
+    help="Dossier partagé des métriques adressées par contenu (SHA Git/blake2b)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Ne réexaminer que les fichiers modifiés depuis le dernier commit collecté",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Avec --incremental, forcer une collecte complète (réconciliation)",
+)
+@click.option(
+    "--test-counter",
+    type=click.Choice(["static", "pytest", "pytest-pool"]),
+    default="static",
+    help="Comptage des tests : analyse ast (défaut), pytest --collect-only ou "
+    "workers pytest persistants avec cache par fichier",
+)
+@click.option(
+    "--test-python",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Interpréteur du projet pour les moteurs pytest (défaut: venv détecté)",
+)
+@click.option(
+    "--code-structure",
+    is_flag=True,
+    help="Compter fonctions, classes et méthodes et mesurer la complexité "
+    "cyclomatique (section code_structure)",
+)
+@click.option(
+    "--sloc",
+    is_flag=True,
+    help="Répartir les lignes Python en code, commentaires, docstrings et "
+    "lignes vides (une passe tokenize par module)",
+)
+@click.option(
+    "--languages",
+    is_flag=True,
+    help="Compter fichiers et lignes par langage (section languages ; lit "
+    "chaque fichier non .py d'un langage connu)",
+)
+@click.option(
+    "--phase-timeout",
+    "phase_timeouts",
+    multiple=True,
+    callback=_parse_phase_timeouts,
+    metavar="PHASE=SECONDES",
+    help=f"Délai d'une phase ({', '.join(PHASES)}) ; "
+    "répétable, résultats partiels conservés",
+)
+@click.option(
+    "--file-lists",
+    type=click.Choice(["legacy", "compact"]),
+    default="legacy",
+    help="Listes de fichiers : chemins complets (défaut) ou table en colonnes "
+    "compacte (section file_table)",
+)
+@click.option(
+    "--directory-depth",
+    type=click.IntRange(min=0),
+    default=2,
+    show_default=True,
+    help="Profondeur de l'arbre des cumuls par dossier (section directories)",
+)
+@click.option(
+    "--deadline",
+    callback=_parse_deadline,
+    metavar="DURÉE",
+    help="Durée visée (ex: 5s, 500ms) : lignes estimées sur un échantillon "
+    "stratifié, avec intervalle de confiance",
+)
+@click.option(
+    "--sample-seed",
+    type=int,
+    default=None,
+    help="Graine de l'échantillonnage de --deadline (résultats reproductibles)",
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Afficher le temps, le CPU et le débit de chaque phase",
+)
 @click.option("--verbose", is_flag=True, help="Mode verbeux")
-def collect(project_path: str, output: str, format: str, validate: bool, verbose: bool):
+def collect(
+    project_path: str,
+    output: str,
+    format: str,
+    validate: bool,
+    config_file: str | None,
+    enumeration: str,
+    jobs: int,
+    cache: bool,
+    content_store: str | None,
+    incremental: bool,
+    full: bool,
+    test_counter: str,
+    test_python: str | None,
+    code_structure: bool,
+    sloc: bool,
+    languages: bool,
+    phase_timeouts: dict[str, float],
+    file_lists: str,
+    directory_depth: int,
+    deadline: float | None,
+    sample_seed: int | None,
+    timings: bool,
+    verbose: bool,
+):
     """
     Collecte les métriques d'un projet Python.
 
@@ -73,11 +323,108 @@ def collect(project_path: str, output: str, format: str, validate: bool, verbose
 
     try:
         # Collecter les métriques
-        collector = MetricsCollector(project_path)
-        metrics_data = collector.collect_all_metrics()
+        collector = MetricsCollector(
+            project_path,
+            config_file=config_file,
+            enumeration=enumeration,
+            jobs=jobs,
+            cache=cache,
+            content_store=content_store,
+            incremental=incremental,
+            test_counter=test_counter,
+            test_python=test_python,
+            code_structure=code_structure,
+            sloc=sloc,
+            languages=languages,
+            phase_timeouts=phase_timeouts,
+            file_lists=file_lists,
+            directory_depth=directory_depth,
+            deadline=deadline,
+            sample_seed=sample_seed,
+        )
+        metrics_data = collector.collect_all_metrics(full=full)
 
         if verbose:
             click.echo("✅ Métriques collectées avec succès")
+            enum_info = metrics_data["collection_info"].get("file_enumeration", {})
+            click.echo(
+                f"📂 Énumération: {enum_info.get('backend')} "
+                f"({enum_info.get('files', 0):,} fichiers en "
+                f"{enum_info.get('duration_seconds', 0):.3f}s)"
+            )
+            cache_info = metrics_data["collection_info"].get("cache", {})
+            if cache_info.get("enabled"):
+                click.echo(
+                    f"🗄️  Cache: {cache_info['hits']} réutilisés, "
+                    f"{cache_info['misses']} analysés, "
+                    f"{cache_info['deleted']} supprimés"
+                )
+            store_info = metrics_data["collection_info"].get("content_store")
+            if store_info:
+                click.echo(
+                    f"📦 Stockage partagé: {store_info['hits']} réutilisés, "
+                    f"{store_info['misses']} analysés"
+                )
+            incremental_info = metrics_data["collection_info"].get("incremental")
+            if incremental_info:
+                if incremental_info["mode"] == "incremental":
+                    click.echo(
+                        f"♻️  Collecte incrémentale depuis "
+                        f"{incremental_info['base'][:12]} "
+                        f"({incremental_info['changed_paths']} chemins modifiés)"
+                    )
+                else:
+                    click.echo(f"♻️  Collecte complète ({incremental_info['reason']})")
+            structure = metrics_data.get("code_structure")
+            if structure:
+                complexity = structure["complexity"]
+                click.echo(
+                    f"🧩 Structure: {structure['functions']} fonctions, "
+                    f"{structure['classes']} classes, {structure['methods']} méthodes "
+                    f"(complexité moy. {complexity['average']}, "
+                    f"p95 {complexity['p95']}, max {complexity['max']})"
+                )
+            language_table = metrics_data.get("languages")
+            if language_table:
+                click.echo(
+                    "🌐 Langages: "
+                    + ", ".join(
+                        f"{name} ({info['lines']:,} lignes)"
+                        for name, info in list(language_table.items())[:5]
+                    )
+                )
+            directories = metrics_data.get("directories")
+            if directories and directories["tree"].get("children"):
+                largest = sorted(
+                    directories["tree"]["children"], key=lambda d: -d["lines"]
+                )[:3]
+                click.echo(
+                    "🗂️  Dossiers: "
+                    + ", ".join(f"{d['name']} ({d['lines']:,} lignes)" for d in largest)
+                )
+            sampling = metrics_data["collection_info"].get("sampling")
+            if sampling:
+                estimate = metrics_data["python_files"].get("estimates", {})
+                interval = estimate.get("total_lines")
+                click.echo(
+                    f"⏱️  Échantillon: {sampling['sampled_files']:,}/"
+                    f"{sampling['population_files']:,} modules"
+                    + (
+                        f", lignes entre {interval['low']:,} et "
+                        f"{interval['high']:,} (95 %)"
+                        if interval
+                        else " (collecte exacte)"
+                    )
+                )
+            phases_info = metrics_data["collection_info"].get("phases", {})
+            for name, phase in phases_info.items():
+                status = "✅" if phase["status"] == "ok" else "⚠️ "
+                click.echo(
+                    f"{status} Phase {name}: {phase['status']} "
+                    f"({phase['duration_seconds']:.3f}s)"
+                )
+        if timings:
+            click.echo(format_timings(metrics_data["collection_info"]["timings"]))
 
         # Valider si demandé
         if validate:
@@ -146,6 +493,44 @@ def collect(project_path: str, output: str, format: str, validate: bool, verbose
         sys.exit(1)
 
 
+@cli.command()
+@click.argument(
+    "project_path", type=click.Path(exists=True, file_okay=False, dir_okay=True)
+)
+@click.option(
+    "--kind",
+    "kinds",
+    type=click.Choice(["core", "test", "documentation"]),
+    multiple=True,
+    help="Types de fichiers à produire (répétable, défaut: tous)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Workers pour l'analyse des fichiers (défaut: 1, 0 = un par CPU)",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Réutiliser les métriques des fichiers inchangés (.arkalia_cache)",
+)
+def files(project_path: str, kinds: tuple[str, ...], jobs: int, cache: bool):
+    """
+    Produit les métriques par fichier au fil du parcours (JSON Lines).
+
+    PROJECT_PATH: Chemin vers le projet à analyser
+    """
+    try:
+        collector = MetricsCollector(project_path, jobs=jobs, cache=cache)
+        for record in collector.iter_files(kinds=kinds or None):
+            click.echo(json.dumps(record.to_dict(), ensure_ascii=False))
+    except Exception as e:
+        click.echo(f"❌ Erreur lors du parcours: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument(
     "project_path", type=click.Path(exists=True, file_okay=False, dir_okay=True)
@@ -373,6 +758,17 @@ def github(
     is_flag=True,
     help="Charger les métriques depuis un fichier JSON existant au lieu de collecter",
 )
+@click.option(
+    "--content-store",
+    type=click.Path(file_okay=False, dir_okay=True),
+    envvar="ARKALIA_CONTENT_STORE",
+    help="Dossier partagé des métriques adressées par contenu (SHA Git/blake2b)",
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Afficher le temps, le CPU et le débit des collectes",
+)
 @click.option("--verbose", is_flag=True, help="Mode verbeux")
 def aggregate(
     projects_file: str,
@@ -383,6 +779,8 @@ def aggregate(
     no_history: bool,
     github_api: bool,
     load_from_json: bool,
+    content_store: str | None,
+    timings: bool,
     verbose: bool,
 ):
     """
@@ -397,7 +795,9 @@ def aggregate(
 
     try:
         aggregator = MultiProjectAggregator(
-            enable_history=not no_history, enable_github=github_api
+            enable_history=not no_history,
+            enable_github=github_api,
+            content_store=content_store,
         )
 
         # Si on charge depuis JSON, utiliser load_from_json
@@ -429,6 +829,7 @@ def aggregate(
                 name = project.get("name", "")
                 path = project.get("path", "")
                 github_url = project.get("github", "")
+                config_file = project.get("config")
 
                 if not name or not path:
                     continue
@@ -438,29 +839,19 @@ def aggregate(
                     if github_api and github_url:
                         click.echo(f"      🔗 GitHub: {github_url}")
 
-                metrics = aggregator.collect_project(name, path, github_url)
+                metrics = aggregator.collect_project(
+                    name, path, github_url, config_file=config_file
+                )
                 if metrics is None:
                     click.echo(f"   ⚠️  Impossible de collecter {name}")
                     continue
 
-        # Collecter les métriques de chaque projet
-        for project in projects:
-            name = project.get("name", "")
-            path = project.get("path", "")
-            github_url = project.get("github", "")
-
-            if not name or not path:
-                continue
-
-            if verbose:
-                click.echo(f"   📦 Collecte de {name}...")
-                if github_api and github_url:
-                    click.echo(f"      🔗 GitHub: {github_url}")
-
-            metrics = aggregator.collect_project(name, path, github_url)
-            if metrics is None:
-                click.echo(f"   ⚠️  Impossible de collecter {name}")
-                continue
+            if verbose and aggregator.content_store is not None:
+                store_info = aggregator.content_store.stats()
+                click.echo(
+                    f"📦 Stockage partagé: {store_info['hits']} réutilisés, "
+                    f"{store_info['misses']} analysés"
+                )
 
         # Agréger les métriques
         aggregated = aggregator.aggregate_metrics()
@@ -472,6 +863,8 @@ def aggregate(
             click.echo(f"   🐍 Modules: {agg_data.get('total_modules', 0):,}")
             click.echo(f"   📝 Lignes: {agg_data.get('total_lines_of_code', 0):,}")
             click.echo(f"   🧪 Tests: {agg_data.get('total_tests', 0):,}")
+        if timings and aggregated:
+            click.echo(format_timings(aggregated["collection_info"]["timings"]))
 
         # Exporter
         output_path = Path(output)
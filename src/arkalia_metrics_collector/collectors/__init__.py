@@ -7,16 +7,23 @@ des différentes métriques de vos projets Python.
 """
 
 from .coverage_parser import CoverageParser
+from .directory_rollup import DirectoryRollup
+from .exclusion_matcher import ExclusionMatcher
+from .file_stream import FileStreamReducer, StreamedFile
+from .file_table import FileTable, expand_file_lists
+from .file_walker import FileWalker
 from .git_contributions import GitContributions
 from .github_collector import GitHubCollector
 from .github_issues import GitHubIssues
 from .metrics_alerts import MetricsAlerts
-from .metrics_collector import MetricsCollector
+from .metrics_collector import MetricsCollector, collect_many
 from .metrics_history import MetricsHistory
 from .multi_project_aggregator import MultiProjectAggregator
+from .sampling import StratifiedEstimator
 
 __all__ = [
     "MetricsCollector",
+    "collect_many",
     "MultiProjectAggregator",
     "GitHubCollector",
     "CoverageParser",
@@ -24,4 +31,12 @@ __all__ = [
     "MetricsAlerts",
     "GitHubIssues",
     "GitContributions",
+    "FileWalker",
+    "FileTable",
+    "expand_file_lists",
+    "StreamedFile",
+    "FileStreamReducer",
+    "DirectoryRollup",
+    "StratifiedEstimator",
+    "ExclusionMatcher",
 ]
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Pool d'analyse parallèle des fichiers.
+
+Répartit le travail par fichier en lots équilibrés par taille :
+- pool de threads pour le travail limité par les E/S (comptage de lignes)
+- pool de processus pour le travail limité par le CPU (analyse syntaxique)
+
+Les résultats sont toujours renvoyés dans l'ordre des entrées, quel que
+soit l'ordre de fin des lots, pour que la sortie reste stable.
+"""
+
+import functools
+import heapq
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from arkalia_metrics_collector.collectors.phases import (
+    PhaseCancelled,
+    check_cancelled,
+)
+from arkalia_metrics_collector.instrumentation.tracing import (
+    current_tracer,
+    remote_span_record,
+    span,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Nombre de lots par worker : assez pour absorber les écarts de durée
+BATCHES_PER_WORKER = 4
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """
+    Normalise un nombre de workers.
+
+    Args:
+        jobs: Nombre demandé (0 ou None : un par CPU)
+
+    Returns:
+        Nombre de workers effectif (au moins 1)
+    """
+    if not jobs or jobs < 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def make_batches(weights: Sequence[int], batch_count: int) -> list[list[int]]:
+    """
+    Répartit des éléments pondérés en lots de poids total équilibré.
+
+    Algorithme glouton LPT : les éléments les plus lourds sont placés en
+    premier, chacun dans le lot le plus léger. Les indices de chaque lot
+    sont ensuite triés pour préserver la localité.
+
+    Args:
+        weights: Poids de chaque élément (ex: taille du fichier)
+        batch_count: Nombre de lots souhaité
+
+    Returns:
+        Listes d'indices, une par lot non vide
+    """
+    batch_count = max(1, min(batch_count, len(weights)))
+    heap = [(0, i) for i in range(batch_count)]
+    batches: list[list[int]] = [[] for _ in range(batch_count)]
+
+    for index in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        total, batch = heapq.heappop(heap)
+        batches[batch].append(index)
+        # Poids minimal de 1 : les fichiers vides coûtent quand même un open()
+        heapq.heappush(heap, (total + max(weights[index], 1), batch))
+
+    return [sorted(batch) for batch in batches if batch]
+
+
+def _span_batch(func: Callable[[list[T]], list[R]], items: list[T]) -> list[R]:
+    """Traite un lot dans un span du thread courant (trace active)."""
+    with span(getattr(func, "__name__", "batch"), "analysis", files=len(items)):
+        return func(items)
+
+
+def _remote_batch(
+    func: Callable[[list[T]], list[R]], items: list[T]
+) -> tuple[list[R], dict[str, Any]]:
+    """Traite un lot dans un processus worker et renvoie aussi son span."""
+    start = time.time_ns()
+    results = func(items)
+    record = remote_span_record(
+        getattr(func, "__name__", "batch"),
+        "analysis",
+        start,
+        time.time_ns(),
+        files=len(items),
+    )
+    return results, record
+
+
+class AnalysisPool:
+    """
+    Couche d'exécution pour l'analyse par fichier.
+
+    Avec jobs=1, tout s'exécute dans le thread appelant, sans surcoût. Les
+    exécuteurs sont créés à la demande puis réutilisés jusqu'à close().
+
+    Attributes:
+        jobs: Nombre de workers
+    """
+
+    def __init__(self, jobs: int | None = 1) -> None:
+        """
+        Initialise le pool.
+
+        Args:
+            jobs: Nombre de workers (0 ou None : un par CPU)
+        """
+        self.jobs = resolve_jobs(jobs)
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "AnalysisPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Arrête les exécuteurs créés."""
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown()
+            self._processes = None
+
+    def _executor(self, kind: str) -> Executor:
+        """Retourne (en le créant au besoin) l'exécuteur demandé."""
+        if kind == "process":
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.jobs)
+            return self._processes
+        if kind != "thread":
+            raise ValueError(f"Type de pool inconnu: {kind}")
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.jobs, thread_name_prefix="arkalia-analysis"
+            )
+        return self._threads
+
+    def map_batches(
+        self,
+        func: Callable[[list[T]], list[R]],
+        items: Sequence[T],
+        weights: Sequence[int] | None = None,
+        kind: str = "thread",
+    ) -> list[R]:
+        """
+        Applique une fonction par lots et fusionne les résultats dans l'ordre.
+
+        Avec une trace active, chaque lot devient un span sur la piste de
+        son worker (thread ou processus).
+
+        Args:
+            func: Fonction traitant un lot et renvoyant un résultat par
+                élément (fonction de module si kind="process")
+            items: Éléments à traiter
+            weights: Poids des éléments pour équilibrer les lots (tailles de
+                fichiers) ; lots de même cardinal si absent
+            kind: "thread" (E/S) ou "process" (CPU)
+
+        Returns:
+            Résultats dans l'ordre de items
+        """
+        if not items:
+            return []
+        tracer = current_tracer()
+        if self.jobs == 1 or len(items) == 1:
+            if tracer is not None:
+                return _span_batch(func, list(items))
+            return func(list(items))
+
+        if weights is None:
+            weights = [1] * len(items)
+        batches = make_batches(weights, self.jobs * BATCHES_PER_WORKER)
+
+        executor = self._executor(kind)
+        runner: Callable[..., Any] = func
+        if tracer is not None:
+            runner = functools.partial(
+                _remote_batch if kind == "process" else _span_batch, func
+            )
+        futures = [
+            (batch, executor.submit(runner, [items[i] for i in batch]))
+            for batch in batches
+        ]
+
+        results: list[Any] = [None] * len(items)
+        for batch, future in futures:
+            try:
+                check_cancelled()
+            except PhaseCancelled:
+                # Phase hors délai : les lots non démarrés sont abandonnés
+                for _, pending in futures:
+                    pending.cancel()
+                raise
+            values = future.result()
+            if tracer is not None and kind == "process":
+                values, record = values
+                tracer.add_remote_span(record)
+            for index, value in zip(batch, values, strict=True):
+                results[index] = value
+        return results
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Métriques de structure du code par analyse syntaxique (ast).
+
+Chaque module est analysé une seule fois pour produire :
+- le nombre de fonctions (hors méthodes), de classes et de méthodes
+- la complexité cyclomatique de McCabe de chaque fonction ou méthode
+
+La complexité vaut 1 plus le nombre de points de décision : ``if``/``elif``,
+expressions conditionnelles, boucles ``for``/``while`` (et leur ``else``),
+``except``, ``assert``, ``case``, clauses ``for``/``if`` des compréhensions
+et chaque opérande supplémentaire d'un ``and``/``or``. Les fonctions
+imbriquées sont mesurées séparément ; les lambdas comptent dans la fonction
+qui les contient.
+"""
+
+import ast
+import math
+import os
+from typing import Any
+
+# Nombre de fonctions les plus complexes reportées par défaut
+DEFAULT_TOP_N = 10
+
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """Compte les points de décision d'un corps de fonction."""
+
+    def __init__(self) -> None:
+        self.complexity = 1
+
+    def _decision(self, node: ast.AST) -> None:
+        self.complexity += 1
+        self.generic_visit(node)
+
+    visit_If = _decision
+    visit_IfExp = _decision
+    visit_ExceptHandler = _decision
+    visit_Assert = _decision
+
+    def visit_For(self, node: ast.For | ast.AsyncFor | ast.While) -> None:
+        # Le "else" d'une boucle est une branche supplémentaire
+        self.complexity += 1 + bool(node.orelse)
+        self.generic_visit(node)
+
+    visit_AsyncFor = visit_For
+    visit_While = visit_For
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension) -> None:
+        self.complexity += 1 + len(node.ifs)
+        self.generic_visit(node)
+
+    def visit_match_case(self, node: ast.match_case) -> None:
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # Fonction imbriquée : mesurée séparément
+        return
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.visit_FunctionDef(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        return
+
+
+def cyclomatic_complexity(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+    """
+    Complexité de McCabe d'une fonction (fonctions imbriquées exclues).
+
+    Args:
+        node: Définition de fonction
+
+    Returns:
+        Complexité cyclomatique (au moins 1)
+    """
+    visitor = _ComplexityVisitor()
+    for stmt in node.body:
+        visitor.visit(stmt)
+    return visitor.complexity
+
+
+class _StructureVisitor(ast.NodeVisitor):
+    """Recense fonctions, classes et méthodes d'un module."""
+
+    def __init__(self) -> None:
+        self.functions = 0
+        self.classes = 0
+        self.methods = 0
+        self.complexity: list[list[Any]] = []
+        self._scope: list[str] = []
+        self._in_class: list[bool] = [False]
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes += 1
+        self._scope.append(node.name)
+        self._in_class.append(True)
+        self.generic_visit(node)
+        self._in_class.pop()
+        self._scope.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        if self._in_class[-1]:
+            self.methods += 1
+        else:
+            self.functions += 1
+        qualname = ".".join([*self._scope, node.name])
+        self.complexity.append([qualname, node.lineno, cyclomatic_complexity(node)])
+        self._scope.append(node.name)
+        self._in_class.append(False)
+        self.generic_visit(node)
+        self._in_class.pop()
+        self._scope.pop()
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.visit_FunctionDef(node)
+
+
+def analyze_source(
+    source: str | bytes, filename: str = "<module>"
+) -> dict[str, Any] | None:
+    """
+    Analyse la structure d'un module.
+
+    Args:
+        source: Code source du module
+        filename: Nom du fichier (messages d'erreur)
+
+    Returns:
+        Dictionnaire functions/classes/methods et complexity (liste de
+        [nom qualifié, ligne, complexité]), ou None si le module est
+        syntaxiquement invalide
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return None
+    visitor = _StructureVisitor()
+    visitor.visit(tree)
+    return {
+        "functions": visitor.functions,
+        "classes": visitor.classes,
+        "methods": visitor.methods,
+        "complexity": visitor.complexity,
+    }
+
+
+def analyze_file(path: str | os.PathLike[str]) -> dict[str, Any] | None:
+    """
+    Analyse la structure d'un fichier Python.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Voir analyze_source
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    with open(path, "rb") as f:
+        return analyze_source(f.read(), str(path))
+
+
+def percentile(values: list[int], fraction: float) -> int:
+    """
+    Percentile par la méthode du rang le plus proche.
+
+    Args:
+        values: Valeurs triées par ordre croissant (non vide)
+        fraction: Percentile voulu entre 0 et 1 (ex: 0.95)
+
+    Returns:
+        Plus petite valeur dont le rang couvre la fraction demandée
+    """
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[rank - 1]
+
+
+def aggregate_structure(
+    files: dict[str, dict[str, Any] | None], top_n: int = DEFAULT_TOP_N
+) -> dict[str, Any]:
+    """
+    Agrège les métriques de structure de plusieurs fichiers.
+
+    Args:
+        files: Résultat d'analyze_source par chemin relatif (None si le
+            fichier n'a pas pu être analysé)
+        top_n: Nombre de fonctions les plus complexes à reporter
+
+    Returns:
+        Totaux, statistiques de complexité et détail par fichier
+    """
+    totals = {"functions": 0, "classes": 0, "methods": 0}
+    per_file: dict[str, dict[str, Any]] = {}
+    measured: list[tuple[int, str, str, int]] = []
+    errors = 0
+
+    for rel_path, data in files.items():
+        if data is None:
+            errors += 1
+            continue
+        for key in totals:
+            totals[key] += data[key]
+        complexities = [cc for _, _, cc in data["complexity"]]
+        per_file[rel_path] = {
+            "functions": data["functions"],
+            "classes": data["classes"],
+            "methods": data["methods"],
+            "max_complexity": max(complexities, default=0),
+        }
+        measured.extend(
+            (cc, rel_path, name, line) for name, line, cc in data["complexity"]
+        )
+
+    values = sorted(cc for cc, _, _, _ in measured)
+    # Les plus complexes d'abord, puis ordre stable par fichier et ligne
+    top = sorted(measured, key=lambda item: (-item[0], item[1], item[3]))[:top_n]
+    complexity: dict[str, Any] = {
+        "average": round(sum(values) / len(values), 2) if values else 0.0,
+        "p95": percentile(values, 0.95) if values else 0,
+        "max": values[-1] if values else 0,
+        "top": [
+            {"file": rel_path, "function": name, "line": line, "complexity": cc}
+            for cc, rel_path, name, line in top
+        ],
+    }
+    return {
+        "files_analyzed": len(per_file),
+        "files_with_errors": errors,
+        **totals,
+        "complexity": complexity,
+        "files": per_file,
+    }
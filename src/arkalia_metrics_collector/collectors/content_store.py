@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Stockage des métriques par fichier adressé par contenu.
+
+Contrairement au cache par signature stat (metrics_cache), la clé ne dépend
+que du contenu du fichier : SHA du blob Git dans un dépôt, blake2b sinon.
+Le résultat survit donc aux clones neufs de la CI (mtime différents) et est
+partagé par tous les projets qui embarquent les mêmes fichiers.
+
+Disposition sur disque, compatible avec un volume partagé entre runners :
+``<dossier>/v<ANALYSIS_VERSION>/<algo>/<2 caractères>/<reste>.json``. Chaque
+entrée est écrite dans un fichier temporaire puis renommée (atomique).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from arkalia_metrics_collector.collectors.file_analysis import ANALYSIS_VERSION
+
+logger = logging.getLogger(__name__)
+
+_READ_SIZE = 1 << 16
+
+
+def _digest_file(path: str, hasher: Any, header: bytes = b"") -> str:
+    """Empreinte d'un fichier lu par blocs dans un tampon réutilisé."""
+    hasher.update(header)
+    buffer = bytearray(_READ_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def git_blob_sha(path: str) -> str:
+    """
+    Calcule l'identifiant de blob Git d'un fichier (comme git hash-object).
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        SHA-1 hexadécimal du blob
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    size = os.stat(path).st_size
+    # SHA-1 imposé par le format des objets Git, pas un usage cryptographique
+    hasher = hashlib.sha1(usedforsecurity=False)  # nosec B324
+    return _digest_file(path, hasher, b"blob %d\0" % size)
+
+
+def blake2b_digest(path: str) -> str:
+    """
+    Calcule l'empreinte blake2b (128 bits) d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Empreinte hexadécimale
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    return _digest_file(path, hashlib.blake2b(digest_size=16))
+
+
+def content_key_batch(items: list[tuple[str, str | None, bool]]) -> list[str | None]:
+    """
+    Calcule les clés de contenu d'un lot de fichiers.
+
+    Fonction de module pour rester utilisable par un pool de processus.
+
+    Args:
+        items: Triplets (chemin, blob Git déjà connu, projet sous Git)
+
+    Returns:
+        Clés "git/<sha>" ou "blake2b/<empreinte>" (None si illisible)
+    """
+    keys: list[str | None] = []
+    for path, blob_id, use_git in items:
+        try:
+            if blob_id is not None:
+                keys.append(f"git/{blob_id}")
+            elif use_git:
+                keys.append(f"git/{git_blob_sha(path)}")
+            else:
+                keys.append(f"blake2b/{blake2b_digest(path)}")
+        except OSError:
+            keys.append(None)
+    return keys
+
+
+class ContentStore:
+    """
+    Métriques par fichier indexées par empreinte du contenu.
+
+    Une même instance peut être partagée par plusieurs collecteurs (voir
+    MultiProjectAggregator) ; plusieurs processus peuvent utiliser le même
+    dossier simultanément.
+
+    Attributes:
+        root: Dossier des entrées pour la version d'analyse courante
+        hits: Nombre de fichiers servis par le stockage
+        misses: Nombre de fichiers absents du stockage
+        writes: Nombre d'entrées écrites
+    """
+
+    def __init__(self, store_dir: str | Path) -> None:
+        """
+        Initialise le stockage.
+
+        Args:
+            store_dir: Dossier du stockage (peut être sur un volume partagé)
+        """
+        self.store_dir = Path(store_dir)
+        self.root = self.store_dir / f"v{ANALYSIS_VERSION}"
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def record(self, hits: int = 0, misses: int = 0) -> None:
+        """
+        Comptabilise des fichiers servis ou absents (sûr entre threads).
+
+        Args:
+            hits: Fichiers servis par le stockage
+            misses: Fichiers absents du stockage
+        """
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _entry_path(self, key: str) -> Path:
+        """Chemin du fichier d'une clé "<algo>/<empreinte>"."""
+        algo, _, digest = key.partition("/")
+        return self.root / algo / digest[:2] / f"{digest[2:]}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Lit les métriques associées à une clé de contenu.
+
+        Args:
+            key: Clé renvoyée par content_key_batch
+
+        Returns:
+            Métriques stockées ou None
+        """
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Entrée illisible dans le stockage ({key}): {e}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        """
+        Enregistre les métriques d'un contenu (écriture atomique).
+
+        Les métriques d'autres analyseurs déjà stockées pour ce contenu sont
+        conservées.
+
+        Args:
+            key: Clé renvoyée par content_key_batch
+            data: Métriques du fichier
+        """
+        path = self._entry_path(key)
+        with self._write_lock:
+            self._write(key, path, data)
+
+    def _write(self, key: str, path: Path, data: dict[str, Any]) -> None:
+        """Fusionne puis écrit une entrée (appelé sous le verrou d'écriture)."""
+        previous = self.get(key)
+        if previous is not None:
+            data = {**previous, **data}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            with self._lock:
+                self.writes += 1
+        except OSError as e:
+            logger.warning(f"Écriture dans le stockage impossible ({key}): {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Statistiques d'utilisation du stockage.
+
+        Returns:
+            Dictionnaire hits/misses/writes et dossier du stockage
+        """
+        return {
+            "enabled": True,
+            "path": str(self.store_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
@@ -33,12 +33,20 @@ class CoverageParser:
     """
 
     @staticmethod
-    def parse_coverage_xml(coverage_path: str | Path) -> dict[str, Any] | None:
+    def parse_coverage_xml(
+        coverage_path: str | Path, per_file: bool = False
+    ) -> dict[str, Any] | None:
         """
         Parse un fichier coverage.xml et extrait les métriques.
 
+        Le fichier est lu en flux (iterparse) : sans détail par fichier, la
+        lecture s'arrête dès l'élément racine <coverage>, dont les attributs
+        portent les totaux ; avec détail, les éléments <line> et <class> sont
+        libérés au fil de la lecture (mémoire constante).
+
         Args:
             coverage_path: Chemin vers le fichier coverage.xml
+            per_file: Ajoute le détail par fichier source (clé "files")
 
         Returns:
             Dictionnaire avec les métriques de coverage ou None si erreur
@@ -49,51 +57,152 @@ class CoverageParser:
             return None
 
         try:
-            tree = ET.parse(
-                coverage_file
-            )  # nosec B314  # nosemgrep: python.lang.security.use-defused-xml-parse.use-defused-xml-parse
-            root = tree.getroot()
-
-            # Extraire les métriques depuis l'élément racine <coverage>
-            line_rate = root.get("line-rate")
-            branch_rate = root.get("branch-rate")
-            lines_covered = root.get("lines-covered")
-            lines_valid = root.get("lines-valid")
-            branches_covered = root.get("branches-covered")
-            branches_valid = root.get("branches-valid")
-
-            # Convertir en float/int
-            coverage_percentage = None
-            if line_rate is not None:
-                try:
-                    coverage_percentage = float(line_rate) * 100
-                except (ValueError, TypeError):
-                    pass
-
-            branch_coverage = None
-            if branch_rate is not None:
-                try:
-                    branch_coverage = float(branch_rate) * 100
-                except (ValueError, TypeError):
-                    pass
-
-            return {
+            if per_file:
+                attributes, files = CoverageParser._stream_classes(coverage_file)
+            else:
+                attributes = CoverageParser._root_attributes(coverage_file)
+            if attributes is None:
+                return None
+            metrics = CoverageParser._summary(attributes, coverage_file)
+            if per_file:
+                metrics["files"] = files
+            return metrics
+
+        except (ET.ParseError, OSError, ValueError, TypeError):
+            # Erreur de lecture ou de parsing XML
+            return None
+
+    @staticmethod
+    def _root_attributes(coverage_file: Path) -> dict[str, str] | None:
+        """
+        Attributs de l'élément racine, sans lire la suite du fichier.
+
+        Args:
+            coverage_file: Fichier coverage.xml
+
+        Returns:
+            Attributs de la racine ou None si le document est vide
+        """
+        with open(coverage_file, "rb") as f:
+            # nosemgrep: python.lang.security.use-defused-xml-parse.use-defused-xml-parse
+            for _event, element in ET.iterparse(f, events=("start",)):  # nosec B314
+                return dict(element.attrib)
+        return None
+
+    @staticmethod
+    def _stream_classes(
+        coverage_file: Path,
+    ) -> tuple[dict[str, str] | None, dict[str, dict[str, Any]]]:
+        """
+        Lit en flux les éléments <class> et cumule leurs lignes par fichier.
+
+        Args:
+            coverage_file: Fichier coverage.xml
+
+        Returns:
+            Attributs de la racine et métriques par fichier source
+        """
+        attributes: dict[str, str] | None = None
+        counts: dict[str, list[int]] = {}
+        # Compteurs du fichier de la classe en cours :
+        # lignes valides, couvertes, branches valides, couvertes
+        current: list[int] | None = None
+        # Les <line> de <methods> répètent des lignes de la classe
+        in_method = False
+        with open(coverage_file, "rb") as f:
+            # nosemgrep: python.lang.security.use-defused-xml-parse.use-defused-xml-parse
+            events = ET.iterparse(f, events=("start", "end"))  # nosec B314
+            for event, element in events:
+                tag = element.tag
+                if event == "start":
+                    if attributes is None:
+                        attributes = dict(element.attrib)
+                    elif tag == "class":
+                        filename = element.get("filename") or element.get("name", "")
+                        current = counts.setdefault(filename, [0, 0, 0, 0])
+                    elif tag == "method":
+                        in_method = True
+                    continue
+                if tag == "line" and current is not None and not in_method:
+                    current[0] += 1
+                    if int(element.get("hits", "0")) > 0:
+                        current[1] += 1
+                    condition = element.get("condition-coverage")
+                    if element.get("branch") == "true" and condition:
+                        covered, _, valid = condition.partition("(")[2].partition("/")
+                        current[2] += int(valid.rstrip(")"))
+                        current[3] += int(covered)
+                    element.clear()
+                elif tag == "method":
+                    in_method = False
+                    element.clear()
+                elif tag == "class":
+                    current = None
+                    element.clear()
+                elif tag == "package":
+                    element.clear()
+
+        files: dict[str, dict[str, Any]] = {}
+        for filename, (lines, covered, branches, branches_covered) in counts.items():
+            files[filename] = {
                 "coverage_percentage": (
-                    round(coverage_percentage, 2) if coverage_percentage else None
+                    round(covered / lines * 100, 2) if lines else None
                 ),
                 "branch_coverage": (
-                    round(branch_coverage, 2) if branch_coverage else None
+                    round(branches_covered / branches * 100, 2) if branches else None
                 ),
-                "lines_covered": int(lines_covered) if lines_covered else None,
-                "lines_valid": int(lines_valid) if lines_valid else None,
-                "branches_covered": int(branches_covered) if branches_covered else None,
-                "branches_valid": int(branches_valid) if branches_valid else None,
-                "coverage_file": str(coverage_file),
+                "lines_covered": covered,
+                "lines_valid": lines,
+                "branches_covered": branches_covered,
+                "branches_valid": branches,
             }
+        return attributes, files
 
-        except (ET.ParseError, ValueError, TypeError):
-            # Erreur de parsing XML
-            return None
+    @staticmethod
+    def _summary(attributes: dict[str, str], coverage_file: Path) -> dict[str, Any]:
+        """
+        Métriques globales depuis les attributs de l'élément <coverage>.
+
+        Args:
+            attributes: Attributs de la racine
+            coverage_file: Fichier lu
+
+        Returns:
+            Dictionnaire des métriques de coverage
+        """
+        line_rate = attributes.get("line-rate")
+        branch_rate = attributes.get("branch-rate")
+        lines_covered = attributes.get("lines-covered")
+        lines_valid = attributes.get("lines-valid")
+        branches_covered = attributes.get("branches-covered")
+        branches_valid = attributes.get("branches-valid")
+
+        # Convertir en float/int
+        coverage_percentage = None
+        if line_rate is not None:
+            try:
+                coverage_percentage = float(line_rate) * 100
+            except (ValueError, TypeError):
+                pass
+
+        branch_coverage = None
+        if branch_rate is not None:
+            try:
+                branch_coverage = float(branch_rate) * 100
+            except (ValueError, TypeError):
+                pass
+
+        return {
+            "coverage_percentage": (
+                round(coverage_percentage, 2) if coverage_percentage else None
+            ),
+            "branch_coverage": (round(branch_coverage, 2) if branch_coverage else None),
+            "lines_covered": int(lines_covered) if lines_covered else None,
+            "lines_valid": int(lines_valid) if lines_valid else None,
+            "branches_covered": int(branches_covered) if branches_covered else None,
+            "branches_valid": int(branches_valid) if branches_valid else None,
+            "coverage_file": str(coverage_file),
+        }
 
     @staticmethod
     def find_coverage_file(project_root: str | Path) -> Path | None:
@@ -133,12 +242,15 @@ class CoverageParser:
         return None
 
     @staticmethod
-    def get_coverage_for_project(project_root: str | Path) -> dict[str, Any] | None:
+    def get_coverage_for_project(
+        project_root: str | Path, per_file: bool = False
+    ) -> dict[str, Any] | None:
         """
         Récupère le coverage pour un projet en cherchant coverage.xml.
 
         Args:
             project_root: Racine du projet
+            per_file: Ajoute le détail par fichier source (clé "files")
 
         Returns:
             Dictionnaire avec les métriques de coverage ou None
@@ -148,4 +260,4 @@ class CoverageParser:
         if coverage_file is None:
             return None
 
-        return CoverageParser.parse_coverage_xml(coverage_file)
+        return CoverageParser.parse_coverage_xml(coverage_file, per_file)
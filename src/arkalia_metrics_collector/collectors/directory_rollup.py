@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Cumuls par dossier des fichiers collectés.
+
+Les compteurs (fichiers, lignes, fichiers de test, fichiers de
+documentation) sont mis à jour fichier par fichier pendant le flux de la
+collecte : chaque fichier incrémente ses dossiers parents jusqu'à la
+profondeur maximale, les dossiers plus profonds étant repliés sur leur
+ancêtre. Le résultat est un arbre compact, directement exploitable pour un
+treemap sans repasser sur les fichiers.
+"""
+
+from typing import Any
+
+from arkalia_metrics_collector.collectors.file_stream import StreamedFile
+
+# Profondeur par défaut de l'arbre (racine = 0)
+DEFAULT_ROLLUP_DEPTH = 2
+
+# Compteurs de chaque dossier, dans l'ordre de stockage
+ROLLUP_FIELDS = ("files", "lines", "test_files", "doc_files")
+
+
+class DirectoryRollup:
+    """
+    Compteurs cumulés par dossier.
+
+    Attributes:
+        max_depth: Profondeur maximale des dossiers détaillés
+    """
+
+    def __init__(self, max_depth: int = DEFAULT_ROLLUP_DEPTH) -> None:
+        """
+        Initialise des compteurs vides.
+
+        Args:
+            max_depth: Profondeur maximale (0 : racine seule)
+
+        Raises:
+            ValueError: Si max_depth est négatif
+        """
+        if max_depth < 0:
+            raise ValueError(f"Profondeur invalide: {max_depth}")
+        self.max_depth = max_depth
+        self._counters: dict[str, list[int]] = {"": [0, 0, 0, 0]}
+        # Dossier du fichier précédent -> dossiers à incrémenter (le flux
+        # suit l'ordre du parcours : les fichiers d'un dossier se suivent)
+        self._last_dir: str | None = None
+        self._last_targets: list[list[int]] = []
+
+    def _targets(self, directory: str) -> list[list[int]]:
+        """Compteurs de la racine et des ancêtres détaillés d'un dossier."""
+        if directory == self._last_dir:
+            return self._last_targets
+        targets = [self._counters[""]]
+        if directory:
+            parts = directory.split("/")[: self.max_depth]
+            for depth in range(1, len(parts) + 1):
+                key = "/".join(parts[:depth])
+                counters = self._counters.get(key)
+                if counters is None:
+                    counters = self._counters[key] = [0, 0, 0, 0]
+                targets.append(counters)
+        self._last_dir, self._last_targets = directory, targets
+        return targets
+
+    def add(self, record: StreamedFile) -> None:
+        """
+        Ajoute un fichier à ses dossiers.
+
+        Args:
+            record: Fichier du flux (lines à None : non compté en lignes)
+        """
+        lines = record.lines or 0
+        is_test = record.kind == "test"
+        is_doc = record.kind == "documentation"
+        for counters in self._targets(record.rel_path.rpartition("/")[0]):
+            counters[0] += 1
+            counters[1] += lines
+            counters[2] += is_test
+            counters[3] += is_doc
+
+    def get(self, directory: str = "") -> dict[str, int] | None:
+        """
+        Compteurs d'un dossier détaillé.
+
+        Args:
+            directory: Chemin relatif du dossier ("" : racine)
+
+        Returns:
+            Compteurs par champ, ou None si le dossier n'est pas détaillé
+        """
+        counters = self._counters.get(directory)
+        if counters is None:
+            return None
+        return dict(zip(ROLLUP_FIELDS, counters, strict=True))
+
+    def to_tree(self) -> dict[str, Any]:
+        """
+        Arbre compact des dossiers.
+
+        Returns:
+            Dictionnaire max_depth et tree ; chaque nœud porte name, les
+            compteurs de ROLLUP_FIELDS et, s'il en a, ses sous-dossiers dans
+            children (triés par nom)
+        """
+        nodes: dict[str, dict[str, Any]] = {}
+        for path in sorted(self._counters):
+            node: dict[str, Any] = {
+                "name": path.rpartition("/")[2],
+                **dict(zip(ROLLUP_FIELDS, self._counters[path], strict=True)),
+            }
+            nodes[path] = node
+            if path:
+                parent = nodes[path.rpartition("/")[0]]
+                parent.setdefault("children", []).append(node)
+        return {"max_depth": self.max_depth, "tree": nodes[""]}
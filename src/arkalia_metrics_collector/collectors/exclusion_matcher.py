@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Matcher d'exclusions compilé, style gitignore.
+
+Compile une liste de globs (``**/build/**``, ``**/*.egg-info/**``,
+``**/*.bak``...) une seule fois :
+- les segments littéraux (``**/node_modules/**``) deviennent des ensembles
+  de noms testés en O(1)
+- les segments avec jokers (``**/*.bak``) sont réunis dans une regex unique
+  appliquée au seul nom de l'entrée
+- les globs multi-segments (``**/data/archive/**``) sont réunis dans une
+  regex unique appliquée au chemin relatif
+
+Un test coûte donc au plus O(profondeur du chemin).
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+try:
+    import yaml  # type: ignore[import-untyped]
+except ImportError:
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _has_wildcard(segment: str) -> bool:
+    """Indique si un segment de glob contient un joker."""
+    return any(c in _WILDCARD_CHARS for c in segment)
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Traduit un glob style gitignore en expression régulière.
+
+    - ``**/`` en tête ou au milieu : zéro ou plusieurs dossiers
+    - ``/**`` en fin : tout le contenu du dossier
+    - ``*`` et ``?`` ne franchissent pas les ``/``
+
+    Args:
+        pattern: Glob relatif (sans ``/`` initial)
+
+    Returns:
+        Expression régulière (à utiliser avec fullmatch)
+    """
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape("["))
+                i += 1
+                continue
+            content = pattern[i + 1 : end]
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            out.append(f"[{content}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def _combine(regexes: list[str]) -> re.Pattern[str] | None:
+    """Réunit plusieurs regex en une alternative compilée unique."""
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{r})" for r in regexes))
+
+
+def load_exclusions(config_file: str | Path) -> list[str]:
+    """
+    Lit la section ``exclusions`` d'un fichier de configuration YAML.
+
+    Args:
+        config_file: Chemin vers le fichier YAML
+
+    Returns:
+        Liste des globs d'exclusion (vide si absente ou illisible)
+    """
+    if yaml is None:
+        logger.warning(
+            "PyYAML n'est pas installé : configuration %s ignorée", config_file
+        )
+        return []
+
+    try:
+        with open(config_file, encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Configuration illisible {config_file}: {e}")
+        return []
+
+    exclusions = config.get("exclusions", []) if isinstance(config, dict) else []
+    return [str(p) for p in exclusions if p]
+
+
+# Configuration par défaut livrée avec le paquet
+DEFAULT_CONFIG_FILE = Path(__file__).parent.parent / "config" / "default.yaml"
+
+DEFAULT_EXCLUSIONS: list[str] = load_exclusions(DEFAULT_CONFIG_FILE)
+
+
+class ExclusionMatcher:
+    """
+    Matcher d'exclusions compilé une seule fois et partageable.
+
+    Les chemins testés sont relatifs à la racine du projet, avec des
+    séparateurs POSIX.
+
+    Attributes:
+        patterns: Globs d'origine, dans l'ordre
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Compile les globs d'exclusion.
+
+        Args:
+            patterns: Globs style gitignore
+        """
+        self.patterns: list[str] = list(dict.fromkeys(patterns))
+
+        # Noms littéraux : dossiers seulement (``X/**``) ou toute entrée (``X``)
+        self._dir_names: set[str] = set()
+        self._names: set[str] = set()
+        dir_name_globs: list[str] = []
+        name_globs: list[str] = []
+        path_globs: list[str] = []
+        dir_path_globs: list[str] = []
+
+        for raw in self.patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+
+            dir_only = pattern.endswith("/") and not pattern.endswith("/**/")
+            pattern = pattern.rstrip("/") if dir_only else pattern
+            anchored = pattern.startswith("/")
+            pattern = pattern.lstrip("/")
+            if not anchored and "/" not in pattern:
+                # Sans "/", gitignore fait correspondre le nom à tout niveau
+                pattern = f"**/{pattern}"
+
+            inner = pattern[3:] if pattern.startswith("**/") else None
+            contents = inner is not None and inner.endswith("/**")
+            segment = inner[:-3] if contents and inner else inner
+
+            if segment is not None and segment and "/" not in segment:
+                # Pattern portant sur un seul nom d'entrée
+                is_dir_pattern = contents or dir_only
+                if _has_wildcard(segment):
+                    target = dir_name_globs if is_dir_pattern else name_globs
+                    target.append(glob_to_regex(segment))
+                else:
+                    target_set = self._dir_names if is_dir_pattern else self._names
+                    target_set.add(segment)
+            elif dir_only:
+                dir_path_globs.append(glob_to_regex(pattern))
+            else:
+                path_globs.append(glob_to_regex(pattern))
+
+        self._dir_name_re = _combine(dir_name_globs)
+        self._name_re = _combine(name_globs)
+        self._path_re = _combine(path_globs)
+        self._dir_path_re = _combine(dir_path_globs)
+
+    @classmethod
+    def from_config(
+        cls,
+        config_files: Iterable[str | Path] = (),
+        extra_patterns: Iterable[str] = (),
+        include_defaults: bool = True,
+    ) -> "ExclusionMatcher":
+        """
+        Construit un matcher depuis les exclusions par défaut et des configs.
+
+        Les exclusions des fichiers de configuration (ex: fichiers de
+        config/project_configs/) s'ajoutent aux exclusions par défaut.
+
+        Args:
+            config_files: Fichiers YAML dont lire la section ``exclusions``
+            extra_patterns: Globs supplémentaires
+            include_defaults: Inclure DEFAULT_EXCLUSIONS (config/default.yaml
+                du paquet)
+
+        Returns:
+            Matcher compilé
+        """
+        patterns: list[str] = list(DEFAULT_EXCLUSIONS) if include_defaults else []
+        for config_file in config_files:
+            patterns.extend(load_exclusions(config_file))
+        patterns.extend(extra_patterns)
+        return cls(patterns)
+
+    def match_dir(self, rel_path: str, name: str) -> bool:
+        """
+        Indique si un dossier (et donc tout son contenu) est exclu.
+
+        Args:
+            rel_path: Chemin relatif du dossier
+            name: Nom du dossier
+
+        Returns:
+            True si le dossier doit être élagué
+        """
+        if name in self._dir_names or name in self._names:
+            return True
+        if self._dir_name_re is not None and self._dir_name_re.fullmatch(name):
+            return True
+        if self._name_re is not None and self._name_re.fullmatch(name):
+            return True
+        if self._dir_path_re is not None and self._dir_path_re.fullmatch(rel_path):
+            return True
+        if self._path_re is not None and (
+            self._path_re.fullmatch(rel_path) or self._path_re.fullmatch(f"{rel_path}/")
+        ):
+            return True
+        return False
+
+    def match_file(self, rel_path: str, name: str) -> bool:
+        """
+        Indique si un fichier est exclu (ses dossiers parents sont supposés
+        déjà testés, comme lors d'un parcours avec élagage).
+
+        Args:
+            rel_path: Chemin relatif du fichier
+            name: Nom du fichier
+
+        Returns:
+            True si le fichier doit être ignoré
+        """
+        if name in self._names:
+            return True
+        if self._name_re is not None and self._name_re.fullmatch(name):
+            return True
+        if self._path_re is not None and self._path_re.fullmatch(rel_path):
+            return True
+        return False
+
+    def is_excluded(self, rel_path: str) -> bool:
+        """
+        Teste un chemin relatif complet, dossiers parents compris.
+
+        Le dernier composant est testé à la fois comme fichier et comme
+        dossier, puisque son type n'est pas connu sans appel système.
+
+        Args:
+            rel_path: Chemin relatif (séparateurs POSIX)
+
+        Returns:
+            True si le chemin ou l'un de ses parents est exclu
+        """
+        parts = [p for p in rel_path.split("/") if p and p != "."]
+        prefix = ""
+        for part in parts:
+            prefix = f"{prefix}/{part}" if prefix else part
+            if self.match_dir(prefix, part):
+                return True
+        return bool(parts) and self.match_file(prefix, parts[-1])
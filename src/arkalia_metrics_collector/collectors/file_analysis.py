@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Analyse par fichier.
+
+Point d'entrée unique du travail réalisé sur le contenu d'un fichier : chaque
+analyseur ("lines", ...) produit une entrée du dictionnaire de métriques du
+fichier. Ces dictionnaires sont ce que stockent les caches et ce que
+calculent les workers du pool d'analyse.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from arkalia_metrics_collector.collectors.code_structure import analyze_file
+from arkalia_metrics_collector.collectors.languages import detect_shebang
+from arkalia_metrics_collector.collectors.line_counter import LineCounter
+from arkalia_metrics_collector.collectors.phases import check_cancelled
+from arkalia_metrics_collector.collectors.sloc_counter import count_sloc_file
+from arkalia_metrics_collector.collectors.test_counter import count_tests_in_file
+
+logger = logging.getLogger(__name__)
+
+# Version des analyseurs : à incrémenter quand un résultat change, pour
+# invalider les caches existants
+ANALYSIS_VERSION = 1
+
+# Analyseurs limités par le CPU (exécutés dans un pool de processus)
+CPU_BOUND_ANALYZERS: frozenset[str] = frozenset({"tests", "structure", "sloc"})
+
+
+def _analyze_lines(path: str, counter: LineCounter) -> int:
+    """Nombre de lignes physiques."""
+    return counter.count_file(path)
+
+
+def _analyze_sloc(path: str, counter: LineCounter) -> dict[str, Any] | None:
+    """Lignes de code, commentaires, docstrings et vides (voir sloc_counter)."""
+    return count_sloc_file(path)
+
+
+def _analyze_tests(path: str, counter: LineCounter) -> int:
+    """Nombre de tests collectables (analyse statique, voir test_counter)."""
+    return count_tests_in_file(path)
+
+
+def _analyze_structure(path: str, counter: LineCounter) -> dict[str, Any] | None:
+    """Fonctions, classes, méthodes et complexités (voir code_structure)."""
+    return analyze_file(path)
+
+
+def _analyze_shebang(path: str, counter: LineCounter) -> str | None:
+    """Langage désigné par la ligne shebang (voir languages)."""
+    return detect_shebang(path)
+
+
+# Analyseur -> fonction (chemin, compteur de lignes du worker) -> résultat
+ANALYZERS: dict[str, Callable[[str, LineCounter], Any]] = {
+    "lines": _analyze_lines,
+    "sloc": _analyze_sloc,
+    "tests": _analyze_tests,
+    "structure": _analyze_structure,
+    "shebang": _analyze_shebang,
+}
+
+
+def pool_kind(analyzers: tuple[str, ...]) -> str:
+    """
+    Choisit le type de pool adapté à un ensemble d'analyseurs.
+
+    Args:
+        analyzers: Noms des analyseurs à exécuter
+
+    Returns:
+        "process" si un analyseur est limité par le CPU, sinon "thread"
+    """
+    return "process" if CPU_BOUND_ANALYZERS.intersection(analyzers) else "thread"
+
+
+def analyze_batch(
+    items: list[tuple[str, tuple[str, ...]]],
+) -> list[dict[str, Any] | None]:
+    """
+    Analyse un lot de fichiers.
+
+    Fonction de module pour rester utilisable par un pool de processus ; un
+    seul compteur de lignes (et donc un seul tampon) sert à tout le lot.
+
+    Args:
+        items: Couples (chemin, analyseurs à exécuter)
+
+    Returns:
+        Métriques par fichier (None si le fichier est illisible ou si un
+        analyseur échoue : l'erreur n'interrompt pas le reste du lot)
+    """
+    counter = LineCounter()
+    results: list[dict[str, Any] | None] = []
+    for path, analyzers in items:
+        # Lot exécuté dans le thread d'une phase (jobs=1) : interruptible
+        check_cancelled()
+        try:
+            results.append({name: ANALYZERS[name](path, counter) for name in analyzers})
+        except Exception as e:
+            logger.debug(f"Analyse impossible de {path}: {e}")
+            results.append(None)
+    return results
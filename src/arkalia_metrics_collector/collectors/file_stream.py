@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Flux des fichiers collectés.
+
+MetricsCollector.iter_files() produit un StreamedFile par fichier classé au
+fil du parcours, par paquets analysés ensemble ; la mémoire ne dépend que de
+la taille des paquets. Les sections de collect_all_metrics (fichiers Python,
+tests, documentation) sont des réductions de ce flux par FileStreamReducer.
+"""
+
+from typing import Any
+
+from arkalia_metrics_collector.collectors.file_table import (
+    FLAG_CORE,
+    FLAG_DOCUMENTATION,
+    FLAG_PYTHON,
+    FLAG_TEST,
+)
+
+# Types de fichiers du flux (un seul par fichier)
+FILE_KINDS = ("core", "test", "documentation")
+
+# Indicateurs de la table des fichiers par type
+KIND_FLAGS = {
+    "core": FLAG_PYTHON | FLAG_CORE,
+    "test": FLAG_PYTHON | FLAG_TEST,
+    "documentation": FLAG_DOCUMENTATION,
+}
+
+# Taille par défaut des paquets analysés ensemble
+STREAM_CHUNK_SIZE = 1024
+
+# Répartition des lignes Python (voir sloc_counter)
+SLOC_FIELDS = ("sloc", "comment_lines", "docstring_lines", "blank_lines")
+
+
+def line_values(lines: int, sloc: dict[str, int] | None) -> dict[str, int]:
+    """
+    Compteurs de lignes d'un module Python.
+
+    Args:
+        lines: Nombre de lignes physiques
+        sloc: Répartition issue de sloc_counter (None si non tokenisable)
+
+    Returns:
+        total_lines et les champs de SLOC_FIELDS
+    """
+    if sloc is None:
+        # Non tokenisable : toutes ses lignes comptent comme du code
+        return {"total_lines": lines, **dict.fromkeys(SLOC_FIELDS, 0), "sloc": lines}
+    return {"total_lines": lines, **{field: sloc[field] for field in SLOC_FIELDS}}
+
+
+class StreamedFile:
+    """
+    Fichier produit par MetricsCollector.iter_files().
+
+    Attributes:
+        rel_path: Chemin relatif (séparateurs POSIX)
+        kind: "core", "test" ou "documentation"
+        size: Taille en octets
+        lines: Nombre de lignes (None si non analysé ou illisible)
+        sloc: Répartition des lignes (voir sloc_counter ; None si non
+            analysé, non demandé ou non tokenisable)
+        cached: True si les métriques proviennent d'un cache (instantané,
+            cache par fichier ou stockage par contenu)
+    """
+
+    __slots__ = ("rel_path", "kind", "size", "lines", "sloc", "cached")
+
+    def __init__(
+        self,
+        rel_path: str,
+        kind: str,
+        size: int,
+        lines: int | None = None,
+        sloc: dict[str, int] | None = None,
+        cached: bool = False,
+    ) -> None:
+        self.rel_path = rel_path
+        self.kind = kind
+        self.size = size
+        self.lines = lines
+        self.sloc = sloc
+        self.cached = cached
+
+    @property
+    def is_python(self) -> bool:
+        """True pour un module Python (code ou test)."""
+        return self.kind != "documentation"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Représentation sérialisable (une ligne JSON par fichier)."""
+        return {
+            "path": self.rel_path,
+            "kind": self.kind,
+            "size": self.size,
+            "lines": self.lines,
+            "cached": self.cached,
+        }
+
+    def __repr__(self) -> str:
+        return f"StreamedFile({self.rel_path!r}, {self.kind!r})"
+
+
+class FileStreamReducer:
+    """
+    Agrège un flux de StreamedFile en métriques de collecte.
+
+    Attributes:
+        counts: Nombre de fichiers par type
+        total_lines: Lignes des modules Python analysés
+        breakdown: Répartition SLOC cumulée (vide sans sloc)
+        cached: Nombre de fichiers servis par un cache
+    """
+
+    def __init__(self, sloc: bool = False) -> None:
+        """
+        Initialise le cumul.
+
+        Args:
+            sloc: Cumuler la répartition SLOC des fichiers (analyse "sloc")
+        """
+        self.counts = dict.fromkeys(FILE_KINDS, 0)
+        self.total_lines = 0
+        self.breakdown = dict.fromkeys(SLOC_FIELDS, 0) if sloc else {}
+        self.cached = 0
+        self._test_directories: set[str] = set()
+
+    def add(self, record: StreamedFile) -> None:
+        """
+        Ajoute un fichier au cumul.
+
+        Args:
+            record: Fichier du flux
+        """
+        self.counts[record.kind] += 1
+        self.cached += record.cached
+        if record.kind == "test":
+            self._test_directories.add(record.rel_path.rpartition("/")[0])
+        if record.lines is None:
+            return
+        self.total_lines += record.lines
+        if self.breakdown:
+            values = line_values(record.lines, record.sloc)
+            for field in SLOC_FIELDS:
+                self.breakdown[field] += values[field]
+
+    def python_metrics(self) -> dict[str, Any]:
+        """Section python_files (sans liste de fichiers)."""
+        return {
+            "count": self.counts["core"] + self.counts["test"],
+            "core_files": self.counts["core"],
+            "test_files": self.counts["test"],
+            "total_lines": self.total_lines,
+            **self.breakdown,
+        }
+
+    def test_files_metrics(self) -> dict[str, Any]:
+        """Comptes de fichiers et dossiers de test."""
+        return {
+            "test_files_count": self.counts["test"],
+            "test_directories_count": len(self._test_directories),
+        }
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Table en colonnes des fichiers collectés.
+
+Remplace les listes de chemins (``files_list``, ``test_files_list``,
+``documentation_list``) qui répètent chaque chemin complet : les dossiers
+sont stockés une seule fois dans une table d'indices, et chaque fichier
+n'occupe qu'une entrée dans des colonnes ``array`` (dossier, taille,
+lignes, indicateurs). L'itération se fait par des enregistrements légers
+(FileRecord) créés à la demande.
+
+L'encodage JSON reprend les mêmes colonnes (indice de dossier + nom) ; les
+listes historiques restent disponibles via paths() et expand_file_lists().
+"""
+
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+# Indicateurs par fichier (combinables)
+FLAG_PYTHON = 1
+FLAG_TEST = 2
+FLAG_CORE = 4
+FLAG_DOCUMENTATION = 8
+
+FLAG_BITS = {
+    "python": FLAG_PYTHON,
+    "test": FLAG_TEST,
+    "core": FLAG_CORE,
+    "documentation": FLAG_DOCUMENTATION,
+}
+
+# Version de l'encodage JSON
+FILE_TABLE_VERSION = 1
+
+# Listes historiques : section -> (clé, indicateur)
+LEGACY_LISTS = {
+    "python_files": ("files_list", FLAG_PYTHON),
+    "test_metrics": ("test_files_list", FLAG_TEST),
+    "documentation_metrics": ("documentation_list", FLAG_DOCUMENTATION),
+}
+
+
+class FileRecord:
+    """
+    Vue d'une ligne de la table.
+
+    Attributes:
+        index: Indice du fichier dans la table
+        directory: Dossier relatif ("" pour la racine)
+        name: Nom du fichier
+        size: Taille en octets
+        lines: Nombre de lignes (-1 si non mesuré)
+        flags: Indicateurs FLAG_*
+    """
+
+    __slots__ = ("index", "directory", "name", "size", "lines", "flags")
+
+    def __init__(
+        self, index: int, directory: str, name: str, size: int, lines: int, flags: int
+    ) -> None:
+        self.index = index
+        self.directory = directory
+        self.name = name
+        self.size = size
+        self.lines = lines
+        self.flags = flags
+
+    @property
+    def rel_path(self) -> str:
+        """Chemin relatif (séparateurs POSIX)."""
+        return f"{self.directory}/{self.name}" if self.directory else self.name
+
+    def __repr__(self) -> str:
+        return f"FileRecord({self.rel_path!r})"
+
+
+class FileTable:
+    """
+    Fichiers collectés stockés en colonnes.
+
+    Attributes:
+        dirs: Dossiers relatifs distincts (indice -> chemin)
+    """
+
+    def __init__(self) -> None:
+        self.dirs: list[str] = []
+        self._dir_ids: dict[str, int] = {}
+        self._dir = array("I")
+        self._names: list[str] = []
+        self._sizes = array("q")
+        self._lines = array("q")
+        self._flags = array("B")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, rel_path: str, size: int = 0, flags: int = 0) -> int:
+        """
+        Ajoute un fichier.
+
+        Args:
+            rel_path: Chemin relatif (séparateurs POSIX)
+            size: Taille en octets
+            flags: Indicateurs FLAG_*
+
+        Returns:
+            Indice du fichier
+        """
+        directory, _, name = rel_path.rpartition("/")
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            dir_id = self._dir_ids[directory] = len(self.dirs)
+            self.dirs.append(directory)
+        self._dir.append(dir_id)
+        # Les mêmes noms (__init__.py, README.md...) reviennent souvent
+        self._names.append(sys.intern(name))
+        self._sizes.append(size)
+        self._lines.append(-1)
+        self._flags.append(flags)
+        return len(self._names) - 1
+
+    def set_lines(self, index: int, lines: int) -> None:
+        """
+        Renseigne le nombre de lignes d'un fichier.
+
+        Args:
+            index: Indice du fichier
+            lines: Nombre de lignes
+        """
+        self._lines[index] = lines
+
+    def indices(self, flag: int = 0) -> list[int]:
+        """
+        Indices des fichiers portant un indicateur.
+
+        Args:
+            flag: Indicateur FLAG_* (0 : tous les fichiers)
+
+        Returns:
+            Indices dans l'ordre de la table
+        """
+        if not flag:
+            return list(range(len(self._names)))
+        return [i for i, flags in enumerate(self._flags) if flags & flag]
+
+    def count(self, flag: int = 0) -> int:
+        """Nombre de fichiers portant un indicateur (0 : tous)."""
+        if not flag:
+            return len(self._names)
+        return sum(1 for flags in self._flags if flags & flag)
+
+    def rel_path(self, index: int) -> str:
+        """Chemin relatif du fichier d'indice index."""
+        directory = self.dirs[self._dir[index]]
+        name = self._names[index]
+        return f"{directory}/{name}" if directory else name
+
+    def record(self, index: int) -> FileRecord:
+        """Enregistrement du fichier d'indice index."""
+        return FileRecord(
+            index,
+            self.dirs[self._dir[index]],
+            self._names[index],
+            self._sizes[index],
+            self._lines[index],
+            self._flags[index],
+        )
+
+    def records(self, flag: int = 0) -> Iterator[FileRecord]:
+        """
+        Itère sur les fichiers portant un indicateur.
+
+        Args:
+            flag: Indicateur FLAG_* (0 : tous les fichiers)
+
+        Yields:
+            Enregistrements créés à la demande
+        """
+        for index in self.indices(flag):
+            yield self.record(index)
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        return self.records()
+
+    def paths(self, flag: int = 0) -> list[str]:
+        """
+        Liste historique des chemins relatifs (construite à la demande).
+
+        Args:
+            flag: Indicateur FLAG_* (0 : tous les fichiers)
+
+        Returns:
+            Chemins relatifs dans l'ordre de la table
+        """
+        return [self.rel_path(i) for i in self.indices(flag)]
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Encodage compact en colonnes.
+
+        Returns:
+            Dictionnaire sérialisable : table des dossiers, puis une liste
+            par colonne (indice de dossier, nom, taille, lignes ou None,
+            indicateurs)
+        """
+        return {
+            "version": FILE_TABLE_VERSION,
+            "flag_bits": FLAG_BITS,
+            "dirs": self.dirs,
+            "dir": self._dir.tolist(),
+            "name": self._names,
+            "size": self._sizes.tolist(),
+            "lines": [n if n >= 0 else None for n in self._lines],
+            "flags": self._flags.tolist(),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "FileTable":
+        """
+        Reconstruit une table depuis son encodage compact.
+
+        Args:
+            data: Résultat de to_json()
+
+        Returns:
+            Table reconstruite
+
+        Raises:
+            ValueError: Si l'encodage est invalide ou d'une autre version
+        """
+        if data.get("version") != FILE_TABLE_VERSION:
+            raise ValueError(f"Version de table inconnue: {data.get('version')}")
+        table = cls()
+        try:
+            table.dirs = list(data["dirs"])
+            table._dir_ids = {d: i for i, d in enumerate(table.dirs)}
+            table._dir = array("I", data["dir"])
+            table._names = [sys.intern(name) for name in data["name"]]
+            table._sizes = array("q", data["size"])
+            table._lines = array("q", (-1 if n is None else n for n in data["lines"]))
+            table._flags = array("B", data["flags"])
+        except (KeyError, TypeError, OverflowError) as e:
+            raise ValueError(f"Table de fichiers invalide: {e}") from e
+        if not (
+            len(table._dir)
+            == len(table._names)
+            == len(table._sizes)
+            == len(table._lines)
+            == len(table._flags)
+        ):
+            raise ValueError("Colonnes de longueurs différentes")
+        return table
+
+
+def expand_file_lists(metrics_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Restaure les listes historiques de chemins d'une collecte compacte.
+
+    Args:
+        metrics_data: Métriques contenant une section ``file_table``
+
+    Returns:
+        Les mêmes métriques, avec files_list, test_files_list et
+        documentation_list ajoutées (sans effet si elles sont déjà là ou si
+        la table est absente)
+
+    Raises:
+        ValueError: Si la table est invalide
+    """
+    encoded = metrics_data.get("file_table")
+    if not encoded:
+        return metrics_data
+    table = FileTable.from_json(encoded)
+    for section, (key, flag) in LEGACY_LISTS.items():
+        target = metrics_data.get(section)
+        if isinstance(target, dict) and key not in target:
+            target[key] = table.paths(flag)
+    return metrics_data
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Parcours unique de l'arborescence d'un projet.
+
+Énumère les fichiers une seule fois et les classe par catégorie (Python,
+tests, documentation...) pour que tous les collecteurs partagent le même
+résultat au lieu de relancer chacun un rglob.
+
+Deux moteurs d'énumération sont disponibles :
+- "git" : ``git ls-files`` (rapide, respecte .gitignore) pour les dépôts Git
+- "filesystem" : parcours os.scandir avec élagage des dossiers exclus
+"""
+
+import logging
+import os
+import subprocess  # nosec B404
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors.phases import check_cancelled
+from arkalia_metrics_collector.instrumentation.calls import open_command, run_command
+from arkalia_metrics_collector.instrumentation.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Modes Git des fichiers ordinaires (normal et exécutable)
+_REGULAR_FILE_MODES = ("100644", "100755")
+
+# Mode Git d'un sous-module (gitlink : un commit, pas un fichier)
+_GITLINK_MODE = "160000"
+
+# Moteurs d'énumération acceptés
+ENUMERATION_BACKENDS = ("auto", "git", "filesystem")
+
+
+class GitListingError(Exception):
+    """Erreur lors de l'énumération des fichiers via Git."""
+
+
+class WalkEntry:
+    """
+    Fichier rencontré lors du parcours.
+
+    Attributes:
+        path: Chemin absolu du fichier (str)
+        rel_path: Chemin relatif à la racine du projet (séparateurs POSIX)
+        name: Nom du fichier
+        suffix: Extension du fichier (avec le point, ex: ".py")
+    """
+
+    __slots__ = ("path", "rel_path", "name", "suffix", "_stat")
+
+    def __init__(self, path: str, rel_path: str, name: str) -> None:
+        self.path = path
+        self.rel_path = rel_path
+        self.name = name
+        dot = name.rfind(".")
+        self.suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+        self._stat: os.stat_result | None | bool = False
+
+    def stat(self) -> os.stat_result | None:
+        """
+        Résultat stat du fichier, calculé une seule fois à la demande.
+
+        Returns:
+            Résultat de os.stat ou None si le fichier est inaccessible
+        """
+        if self._stat is False:
+            try:
+                self._stat = os.stat(self.path)
+            except OSError:
+                self._stat = None
+        return self._stat  # type: ignore[return-value]
+
+    @property
+    def size(self) -> int:
+        """Taille du fichier en octets (0 si inaccessible)."""
+        st = self.stat()
+        return st.st_size if st is not None else 0
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Composants du chemin relatif."""
+        return tuple(self.rel_path.split("/"))
+
+    def __repr__(self) -> str:
+        return f"WalkEntry({self.rel_path!r})"
+
+
+class ProjectScan:
+    """
+    Résultat classé d'un parcours de projet.
+
+    Chaque catégorie contient la liste des fichiers qui lui correspondent,
+    dans l'ordre du parcours (trié par nom à chaque niveau) ; paths liste
+    tous les fichiers non exclus, classés ou non.
+    """
+
+    def __init__(self, categories: list[str]) -> None:
+        """
+        Initialise un résultat vide.
+
+        Args:
+            categories: Noms des catégories à remplir
+        """
+        self.categories: dict[str, list[WalkEntry]] = {name: [] for name in categories}
+        self.paths: list[str] = []
+        self.total_files = 0
+        self.pruned_dirs = 0
+        self.backend = "filesystem"
+        self.duration_seconds = 0.0
+
+    def get(self, category: str) -> list[WalkEntry]:
+        """
+        Retourne les fichiers d'une catégorie.
+
+        Args:
+            category: Nom de la catégorie
+
+        Returns:
+            Liste des fichiers (vide si la catégorie est inconnue)
+        """
+        return self.categories.get(category, [])
+
+
+class FileWalker:
+    """
+    Moteur de parcours de fichiers basé sur os.scandir.
+
+    Visite chaque entrée une seule fois et laisse des classificateurs
+    décider des catégories auxquelles appartient chaque fichier. Les
+    dossiers exclus sont élagués avant la descente : leur contenu n'est
+    jamais énuméré ni stat'é.
+
+    En mode "auto", l'index Git est utilisé si la racine est dans un dépôt
+    et que git est disponible, sinon le système de fichiers est parcouru.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        is_excluded: Callable[[WalkEntry], bool] | None = None,
+        is_dir_excluded: Callable[[str, str], bool] | None = None,
+        backend: str = "auto",
+    ) -> None:
+        """
+        Initialise le moteur de parcours.
+
+        Args:
+            root: Racine à parcourir
+            is_excluded: Prédicat d'exclusion appliqué à chaque fichier
+            is_dir_excluded: Prédicat (chemin relatif, nom) appliqué à chaque
+                dossier avant d'y descendre
+            backend: Moteur d'énumération ("auto", "git" ou "filesystem")
+        """
+        if backend not in ENUMERATION_BACKENDS:
+            raise ValueError(
+                f"Moteur d'énumération inconnu: {backend} "
+                f"(attendu: {', '.join(ENUMERATION_BACKENDS)})"
+            )
+        self.root = Path(root)
+        self.is_excluded = is_excluded
+        self.is_dir_excluded = is_dir_excluded
+        self.backend = backend
+        self.active_backend = backend
+        self.pruned_dirs = 0
+
+    def is_git_repository(self) -> bool:
+        """
+        Indique si la racine est dans un dépôt Git exploitable.
+
+        Returns:
+            True si git est disponible et la racine dans un arbre de travail
+        """
+        try:
+            result = run_command(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+    def _git_ls_files(self, *args: str) -> Iterator[str]:
+        """
+        Lit en flux la sortie NUL-séparée de ``git ls-files -z``.
+
+        Args:
+            *args: Options supplémentaires de git ls-files
+
+        Yields:
+            Chemins relatifs à la racine (séparateurs POSIX)
+
+        Raises:
+            GitListingError: Si git échoue
+        """
+        # Span et hook sur toute la lecture (coût de l'énumération)
+        try:
+            with open_command(
+                ["git", "ls-files", "-z", *args],
+                cwd=self.root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ) as proc:
+                if proc.stdout is None:
+                    raise GitListingError("Sortie de git ls-files indisponible")
+                pending = b""
+                while True:
+                    check_cancelled()
+                    chunk = proc.stdout.read(1 << 16)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    *paths, pending = pending.split(b"\0")
+                    for raw in paths:
+                        if raw:
+                            yield os.fsdecode(raw)
+        except OSError as e:
+            raise GitListingError(str(e)) from e
+
+        if proc.returncode != 0:
+            raise GitListingError(f"git ls-files a échoué (code {proc.returncode})")
+
+    def git_blob_ids(self) -> dict[str, str]:
+        """
+        Identifiants de blob Git des fichiers suivis et non modifiés.
+
+        Les fichiers modifiés dans l'arbre de travail sont omis : leur blob
+        dans l'index ne correspond plus à leur contenu.
+
+        Returns:
+            Chemin relatif -> SHA du blob (vide si git est indisponible)
+        """
+        try:
+            modified = set(self._git_ls_files("--modified"))
+            blobs: dict[str, str] = {}
+            for record in self._git_ls_files("--stage"):
+                # Format : "<mode> <sha> <étape>\t<chemin>" ; seuls les
+                # fichiers ordinaires (ni liens, ni sous-modules) sont gardés
+                meta, _, rel_path = record.partition("\t")
+                fields = meta.split()
+                if (
+                    len(fields) == 3
+                    and fields[0] in _REGULAR_FILE_MODES
+                    and fields[2] == "0"
+                    and rel_path not in modified
+                ):
+                    blobs[rel_path] = fields[1]
+        except GitListingError as e:
+            logger.debug(f"Blobs Git indisponibles: {e}")
+            return {}
+        return blobs
+
+    def walk_git(self) -> Iterator[WalkEntry]:
+        """
+        Énumère les fichiers suivis et non ignorés via l'index Git.
+
+        Les fichiers supprimés de l'arbre de travail sont retirés, de même
+        que les sous-modules (gitlinks) et les dépôts imbriqués non suivis,
+        qui ne sont pas des fichiers. Les exclusions sont appliquées aux
+        dossiers parents (résultat mis en cache par dossier). L'ordre
+        produit est identique à celui du parcours système de fichiers.
+
+        Yields:
+            Entrées de fichiers
+
+        Raises:
+            GitListingError: Si git échoue
+        """
+        deleted = set(self._git_ls_files("--deleted"))
+        # Un même chemin peut figurer à plusieurs étapes (conflit) ou être
+        # à la fois suivi et non suivi : l'ensemble le garde une fois
+        paths: set[str] = set()
+        for record in self._git_ls_files("--cached", "--stage"):
+            # Format : "<mode> <sha> <étape>\t<chemin>"
+            meta, _, rel_path = record.partition("\t")
+            if not meta.startswith(_GITLINK_MODE) and rel_path not in deleted:
+                paths.add(rel_path)
+        for rel_path in self._git_ls_files("--others", "--exclude-standard"):
+            # Un dépôt imbriqué non suivi est listé "dossier/"
+            if not rel_path.endswith("/"):
+                paths.add(rel_path)
+        yield from self.walk_paths(paths)
+
+    def walk_paths(self, rel_paths: Iterable[str]) -> Iterator[WalkEntry]:
+        """
+        Produit les entrées d'une liste de chemins connue à l'avance.
+
+        Les exclusions sont appliquées aux dossiers parents (résultat mis
+        en cache par dossier) puis au fichier. L'ordre produit est
+        identique à celui du parcours système de fichiers.
+
+        Args:
+            rel_paths: Chemins relatifs à la racine (séparateurs POSIX), supposés
+                exister
+
+        Yields:
+            Entrées de fichiers
+        """
+        root = str(self.root)
+        is_dir_excluded = self.is_dir_excluded
+        dir_excluded: dict[str, bool] = {"": False}
+        pruned: set[str] = set()
+
+        def excluded_dir(rel_dir: str) -> bool:
+            cached = dir_excluded.get(rel_dir)
+            if cached is not None:
+                return cached
+            parent, _, name = rel_dir.rpartition("/")
+            result = excluded_dir(parent)
+            if not result and is_dir_excluded is not None:
+                result = is_dir_excluded(rel_dir, name)
+                if result:
+                    pruned.add(rel_dir)
+            dir_excluded[rel_dir] = result
+            return result
+
+        for rel_path in sorted(rel_paths, key=_walk_order_key):
+            check_cancelled()
+            rel_dir, _, name = rel_path.rpartition("/")
+            if excluded_dir(rel_dir):
+                continue
+            walk_entry = WalkEntry(os.path.join(root, rel_path), rel_path, name)
+            if self.is_excluded is not None and self.is_excluded(walk_entry):
+                continue
+            yield walk_entry
+
+        self.pruned_dirs = len(pruned)
+
+    def walk(self) -> Iterator[WalkEntry]:
+        """
+        Parcourt l'arborescence et produit les fichiers non exclus.
+
+        Les liens symboliques vers des dossiers ne sont pas suivis afin
+        d'éviter les cycles.
+
+        Yields:
+            Entrées de fichiers dans un ordre déterministe
+        """
+        root = str(self.root)
+        stack: list[tuple[str, str]] = [(root, "")]
+        is_dir_excluded = self.is_dir_excluded
+        self.pruned_dirs = 0
+
+        while stack:
+            check_cancelled()
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                # Dossier illisible ou supprimé pendant le parcours
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if is_dir_excluded is not None and is_dir_excluded(
+                            rel_path, entry.name
+                        ):
+                            self.pruned_dirs += 1
+                            continue
+                        subdirs.append((entry.path, f"{rel_path}/"))
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                walk_entry = WalkEntry(entry.path, rel_path, entry.name)
+                if self.is_excluded is not None and self.is_excluded(walk_entry):
+                    continue
+                yield walk_entry
+
+            # Empiler à l'envers pour visiter les sous-dossiers dans l'ordre
+            stack.extend(reversed(subdirs))
+
+    def entries(self) -> Iterator[WalkEntry]:
+        """
+        Produit les fichiers non exclus au fil de l'énumération.
+
+        Même choix de moteur que scan() (index Git en mode "auto" dans un
+        dépôt, repli sur le système de fichiers si git échoue ou ne liste
+        rien), sans conserver la liste des fichiers. Le moteur retenu est
+        disponible dans active_backend une fois le premier fichier produit.
+
+        Yields:
+            Entrées de fichiers dans l'ordre du parcours
+        """
+        use_git = self.backend == "git" or (
+            self.backend == "auto" and self.is_git_repository()
+        )
+        if use_git:
+            produced = False
+            self.active_backend = "git"
+            try:
+                # git ls-files est lu en entier avant le premier fichier :
+                # une erreur survient toujours avant toute production
+                for entry in self.walk_git():
+                    produced = True
+                    yield entry
+            except GitListingError as e:
+                logger.debug(f"Énumération Git impossible, repli sur scandir: {e}")
+            else:
+                # En mode "auto", une racine ignorée par Git ou un index vide
+                # ne liste rien de fiable : repli sur le système de fichiers
+                if produced or self.backend == "git":
+                    return
+
+        self.active_backend = "filesystem"
+        yield from self.walk()
+
+    def scan(self, classifiers: dict[str, Callable[[WalkEntry], bool]]) -> ProjectScan:
+        """
+        Parcourt le projet une fois et classe chaque fichier.
+
+        Args:
+            classifiers: Prédicats par catégorie (un fichier peut appartenir
+                à plusieurs catégories)
+
+        Returns:
+            Résultat classé du parcours (avec le moteur utilisé et la durée)
+        """
+        start = time.perf_counter()
+        with span("walk", "io") as walk_span:
+            result = self._classify(self.entries(), classifiers)
+            walk_span.set(backend=self.active_backend, files=result.total_files)
+        result.backend = self.active_backend
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    def scan_paths(
+        self,
+        rel_paths: Iterable[str],
+        classifiers: dict[str, Callable[[WalkEntry], bool]],
+    ) -> ProjectScan:
+        """
+        Classe une liste de fichiers connue sans parcourir le disque.
+
+        Args:
+            rel_paths: Chemins relatifs des fichiers existants
+            classifiers: Prédicats par catégorie
+
+        Returns:
+            Résultat classé (moteur "paths")
+        """
+        start = time.perf_counter()
+        result = self._classify(self.walk_paths(rel_paths), classifiers)
+        result.backend = "paths"
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    def _classify(
+        self,
+        entries: Iterator[WalkEntry],
+        classifiers: dict[str, Callable[[WalkEntry], bool]],
+    ) -> ProjectScan:
+        """Répartit les entrées dans les catégories des classificateurs."""
+        result = ProjectScan(list(classifiers))
+        buckets = [
+            (result.categories[name], predicate)
+            for name, predicate in classifiers.items()
+        ]
+
+        paths = result.paths
+        for entry in entries:
+            paths.append(entry.rel_path)
+            for bucket, predicate in buckets:
+                if predicate(entry):
+                    bucket.append(entry)
+
+        result.total_files = len(paths)
+        result.pruned_dirs = self.pruned_dirs
+        return result
+
+
+def _walk_order_key(rel_path: str) -> list[tuple[int, str]]:
+    """
+    Clé de tri reproduisant l'ordre du parcours scandir : à chaque niveau,
+    les fichiers (triés par nom) avant les sous-dossiers (triés par nom).
+    """
+    parts = rel_path.split("/")
+    key = [(1, part) for part in parts[:-1]]
+    key.append((0, parts[-1]))
+    return key
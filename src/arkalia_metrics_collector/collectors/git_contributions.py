@@ -11,11 +11,13 @@ Analyse l'historique Git pour calculer :
 """
 
 import logging
-import subprocess  # nosec B404
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from arkalia_metrics_collector.instrumentation.calls import run_command
+from arkalia_metrics_collector.instrumentation.timings import TimingRecorder
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,8 @@ class GitContributions:
             project_path: Chemin vers le projet
         """
         self.project_path = Path(project_path)
+        # Mesures de la dernière collecte (une phase par statistique)
+        self.timings = TimingRecorder()
 
     def collect_contributions(self, days: int = 30) -> dict[str, Any] | None:
         """
@@ -52,23 +56,25 @@ class GitContributions:
             return None
 
         try:
-            # Statistiques générales
-            total_commits = self._get_total_commits()
-            recent_commits = self._get_recent_commits(days)
-            contributors = self._get_contributors(days)
-            lines_stats = self._get_lines_stats(days)
-            files_changed = self._get_files_changed(days)
-            activity_by_day = self._get_activity_by_day(days)
+            self.timings = TimingRecorder()
+            steps = {
+                "total_commits": self._get_total_commits,
+                "recent_commits": lambda: self._get_recent_commits(days),
+                "contributors": lambda: self._get_contributors(days),
+                "lines": lambda: self._get_lines_stats(days),
+                "files_changed": lambda: self._get_files_changed(days),
+                "activity_by_day": lambda: self._get_activity_by_day(days),
+            }
+            result: dict[str, Any] = {}
+            for name, step in steps.items():
+                with self.timings.phase(name):
+                    result[name] = step()
 
             return {
-                "total_commits": total_commits,
-                "recent_commits": recent_commits,
-                "contributors": contributors,
-                "lines": lines_stats,
-                "files_changed": files_changed,
-                "activity_by_day": activity_by_day,
+                **result,
                 "period_days": days,
                 "collection_date": datetime.now().isoformat(),
+                "collection_info": {"timings": self.timings.to_dict()},
             }
 
         except Exception as e:
@@ -78,13 +84,14 @@ class GitContributions:
     def _run_git_command(self, command: list[str]) -> str | None:
         """Exécute une commande Git et retourne la sortie."""
         try:
-            result = subprocess.run(  # nosec B603
+            result = run_command(
                 ["git"] + command,
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
                 timeout=30,
             )
+            self.timings.add_input(size=len(result.stdout))
             if result.returncode == 0:
                 return result.stdout.strip()
             return None
@@ -186,6 +193,7 @@ class GitContributions:
 
         if output:
             files = {line.strip() for line in output.split("\n") if line.strip()}
+            self.timings.add_input(files=len(files))
             return len(files)
 
         return 0
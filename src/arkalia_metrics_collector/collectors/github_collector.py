@@ -18,6 +18,9 @@ from datetime import datetime
 from typing import Any
 
 from arkalia_metrics_collector import __version__
+from arkalia_metrics_collector.instrumentation.calls import http_request
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+from arkalia_metrics_collector.instrumentation.timings import TimingRecorder
 
 try:
     import requests  # type: ignore[import-untyped]
@@ -55,6 +58,8 @@ class GitHubCollector:
         self._cache: dict[str, tuple[float, Any]] = {}
         self._rate_limit_remaining = 5000
         self._rate_limit_reset = 0
+        # Mesures de la dernière collecte (une phase par appel d'API)
+        self.timings = TimingRecorder()
 
     def _create_session(self) -> requests.Session | None:
         """
@@ -117,7 +122,11 @@ class GitHubCollector:
         cached = self._get_cached(url)
         if cached is not None:
             logger.debug(f"Cache hit pour {url}")
+            if hooks.on_cache_hit:
+                hooks.emit("on_cache_hit", cache="github", key=url)
             return cached
+        if hooks.on_cache_miss:
+            hooks.emit("on_cache_miss", cache="github", key=url)
 
         # Vérifier le rate limiting
         if self._rate_limit_remaining <= 1 and time.time() < self._rate_limit_reset:
@@ -126,7 +135,10 @@ class GitHubCollector:
             time.sleep(wait_time)
 
         try:
-            response = self.session.get(url, timeout=timeout)
+            with http_request("GET", url) as call:
+                response = self.session.get(url, timeout=timeout)
+                call.status = response.status_code
+            self.timings.add_input(size=len(response.content))
 
             # Mettre à jour les informations de rate limiting
             self._rate_limit_remaining = int(
@@ -162,10 +174,12 @@ class GitHubCollector:
         if self.session is None:
             return None
 
+        self.timings = TimingRecorder()
         try:
             # Informations de base du dépôt
             repo_url = f"{self.base_url}/repos/{owner}/{repo}"
-            response = self._make_request(repo_url)
+            with self.timings.phase("repository"):
+                response = self._make_request(repo_url)
 
             if response is None or response.status_code != 200:
                 logger.error(f"Impossible de récupérer les données pour {owner}/{repo}")
@@ -174,13 +188,16 @@ class GitHubCollector:
             repo_data = response.json()
 
             # Collecter les issues
-            issues_data = self._collect_issues(owner, repo)
+            with self.timings.phase("issues"):
+                issues_data = self._collect_issues(owner, repo)
 
             # Collecter les pull requests
-            prs_data = self._collect_pull_requests(owner, repo)
+            with self.timings.phase("pull_requests"):
+                prs_data = self._collect_pull_requests(owner, repo)
 
             # Collecter les releases
-            releases_data = self._collect_releases(owner, repo)
+            with self.timings.phase("releases"):
+                releases_data = self._collect_releases(owner, repo)
 
             # Formater les métriques
             metrics = {
@@ -212,6 +229,7 @@ class GitHubCollector:
                 "releases": releases_data,
                 "last_update": repo_data.get("pushed_at", ""),
                 "collection_date": datetime.now().isoformat(),
+                "collection_info": {"timings": self.timings.to_dict()},
             }
 
             return metrics
@@ -431,6 +449,7 @@ class GitHubCollector:
             Dictionnaire avec les métriques agrégées
         """
         all_metrics = {}
+        timings = TimingRecorder()
         total_stars = 0
         total_forks = 0
         total_watchers = 0
@@ -441,7 +460,11 @@ class GitHubCollector:
             if not owner or not repo:
                 continue
 
-            metrics = self.collect_repo_metrics(owner, repo)
+            with timings.phase(f"{owner}/{repo}"):
+                downloaded = self.timings.total_bytes
+                metrics = self.collect_repo_metrics(owner, repo)
+                if metrics:
+                    timings.add_input(size=self.timings.total_bytes - downloaded)
             if metrics:
                 all_metrics[f"{owner}/{repo}"] = metrics
                 total_stars += metrics.get("stats", {}).get("stars", 0)
@@ -457,4 +480,5 @@ class GitHubCollector:
                 "total_watchers": total_watchers,
             },
             "collection_date": datetime.now().isoformat(),
+            "collection_info": {"timings": timings.to_dict()},
         }
@@ -14,6 +14,8 @@ try:
 except ImportError:
     requests = None
 
+from arkalia_metrics_collector.instrumentation.calls import http_request
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,7 +97,9 @@ class GitHubIssues:
             payload["assignees"] = assignees
 
         try:
-            response = self.session.post(url, json=payload, timeout=10)
+            with http_request("POST", url) as call:
+                response = self.session.post(url, json=payload, timeout=10)
+                call.status = response.status_code
 
             if response.status_code == 201:
                 issue_data = response.json()
@@ -141,7 +145,9 @@ class GitHubIssues:
         params = {"state": "open", "per_page": 100}
 
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            with http_request("GET", url) as call:
+                response = self.session.get(url, params=params, timeout=10)
+                call.status = response.status_code
 
             if response.status_code == 200:
                 issues = response.json()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Collecte incrémentale à partir du dernier commit collecté.
+
+Après chaque collecte d'un dépôt Git, un instantané est écrit dans
+``.arkalia_cache/snapshot.json`` : SHA de HEAD, liste des fichiers retenus,
+fichiers non suivis et métriques par fichier. Au run suivant, seuls les
+chemins renvoyés par ``git diff <ancien>`` (commits et modifications non
+commitées) et les fichiers non suivis sont réexaminés ; le reste est repris
+de l'instantané sans parcours du disque.
+
+Une collecte complète est refaite périodiquement (réconciliation) ou à la
+demande (``--full``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from arkalia_metrics_collector.collectors.file_analysis import ANALYSIS_VERSION
+from arkalia_metrics_collector.instrumentation.calls import run_command
+
+logger = logging.getLogger(__name__)
+
+# Nom de l'instantané dans le dossier de cache
+SNAPSHOT_FILE = "snapshot.json"
+
+# Format de l'instantané (à incrémenter si sa structure change)
+SNAPSHOT_VERSION = 1
+
+# Nombre de runs incrémentaux entre deux collectes complètes
+DEFAULT_FULL_EVERY = 20
+
+
+def _run_git_z(root: Path, args: list[str]) -> list[str] | None:
+    """
+    Exécute une commande Git à sortie NUL-séparée.
+
+    Args:
+        root: Dossier d'exécution
+        args: Arguments de la commande (sans "git")
+
+    Returns:
+        Éléments de la sortie, ou None si git échoue
+    """
+    try:
+        result = run_command(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Erreur commande Git: {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    return [os.fsdecode(item) for item in result.stdout.split(b"\0") if item]
+
+
+def git_head(root: Path) -> str | None:
+    """
+    Retourne le SHA du commit HEAD.
+
+    Args:
+        root: Dossier du projet
+
+    Returns:
+        SHA complet, ou None hors dépôt Git / dépôt sans commit
+    """
+    output = _run_git_z(root, ["rev-parse", "--verify", "-q", "HEAD"])
+    if not output:
+        return None
+    return output[0].strip() or None
+
+
+def git_untracked(root: Path) -> list[str] | None:
+    """
+    Liste les fichiers non suivis et non ignorés sous root.
+
+    Args:
+        root: Dossier du projet
+
+    Returns:
+        Chemins relatifs à root, ou None si git échoue
+    """
+    return _run_git_z(root, ["ls-files", "-z", "--others", "--exclude-standard"])
+
+
+def git_changed_paths(root: Path, base: str) -> set[str] | None:
+    """
+    Chemins modifiés depuis un commit, arbre de travail compris.
+
+    Couvre les commits entre base et HEAD, les modifications indexées ou
+    non et les fichiers non suivis. Les renommages apparaissent comme une
+    suppression et un ajout.
+
+    Args:
+        root: Dossier du projet
+        base: SHA du commit de référence
+
+    Returns:
+        Chemins relatifs à root, ou None si le diff est impossible (commit
+        disparu après un rebase, dépôt superficiel...)
+    """
+    changed = _run_git_z(
+        root, ["diff", "--name-only", "--no-renames", "--relative", "-z", base, "--"]
+    )
+    untracked = git_untracked(root)
+    if changed is None or untracked is None:
+        return None
+    return set(changed).union(untracked)
+
+
+def snapshot_fingerprint(exclusions: Iterable[str]) -> str:
+    """
+    Empreinte des réglages qui invalident un instantané.
+
+    Args:
+        exclusions: Globs d'exclusion appliqués
+
+    Returns:
+        Empreinte hexadécimale
+    """
+    payload = json.dumps(
+        {
+            "snapshot": SNAPSHOT_VERSION,
+            "analysis": ANALYSIS_VERSION,
+            "exclusions": list(exclusions),
+        }
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CollectionSnapshot:
+    """
+    État d'une collecte, base de la collecte incrémentale suivante.
+
+    Attributes:
+        head: SHA du commit collecté
+        fingerprint: Empreinte des réglages (voir snapshot_fingerprint)
+        files: Chemins relatifs de tous les fichiers retenus
+        untracked: Fichiers non suivis au moment de la collecte
+        analyses: Métriques par fichier (chemin relatif -> métriques)
+        incremental_runs: Runs incrémentaux depuis la dernière collecte complète
+    """
+
+    def __init__(
+        self,
+        head: str,
+        fingerprint: str,
+        files: list[str],
+        untracked: list[str],
+        analyses: dict[str, dict[str, Any]],
+        incremental_runs: int = 0,
+    ) -> None:
+        self.head = head
+        self.fingerprint = fingerprint
+        self.files = files
+        self.untracked = untracked
+        self.analyses = analyses
+        self.incremental_runs = incremental_runs
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CollectionSnapshot | None":
+        """
+        Charge un instantané.
+
+        Args:
+            path: Chemin du fichier JSON
+
+        Returns:
+            Instantané, ou None s'il est absent ou illisible
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return cls(
+                head=data["head"],
+                fingerprint=data["fingerprint"],
+                files=list(data["files"]),
+                untracked=list(data["untracked"]),
+                analyses=dict(data["analyses"]),
+                incremental_runs=int(data.get("incremental_runs", 0)),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Instantané de collecte illisible ({path}): {e}")
+            return None
+
+    def save(self, path: str | Path) -> bool:
+        """
+        Écrit l'instantané (écriture atomique).
+
+        Args:
+            path: Chemin du fichier JSON
+
+        Returns:
+            True si l'écriture a réussi
+        """
+        target = Path(path)
+        data = {
+            "head": self.head,
+            "fingerprint": self.fingerprint,
+            "incremental_runs": self.incremental_runs,
+            "files": self.files,
+            "untracked": self.untracked,
+            "analyses": self.analyses,
+        }
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_name, target)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            return True
+        except OSError as e:
+            logger.warning(f"Écriture de l'instantané impossible ({target}): {e}")
+            return False
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Détection du langage des fichiers d'un projet.
+
+Le langage est déduit du nom du fichier (extension ou nom connu comme
+``Makefile``) pendant le parcours, sans lecture. Seuls les fichiers sans
+extension sont ouverts, pour lire leur ligne shebang (``#!/usr/bin/env
+bash``...).
+"""
+
+import os
+import re
+from typing import Any
+
+# Extension (en minuscules) -> langage
+EXTENSION_LANGUAGES = {
+    ".py": "Python",
+    ".pyi": "Python",
+    ".pyx": "Cython",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".mts": "TypeScript",
+    ".cts": "TypeScript",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".zsh": "Shell",
+    ".ksh": "Shell",
+    ".fish": "Fish",
+    ".ps1": "PowerShell",
+    ".bat": "Batch",
+    ".cmd": "Batch",
+    ".sql": "SQL",
+    ".html": "HTML",
+    ".htm": "HTML",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".sass": "Sass",
+    ".less": "Less",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".toml": "TOML",
+    ".json": "JSON",
+    ".ini": "INI",
+    ".cfg": "INI",
+    ".xml": "XML",
+    ".c": "C",
+    ".h": "C",
+    ".cc": "C++",
+    ".cpp": "C++",
+    ".cxx": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".kts": "Kotlin",
+    ".scala": "Scala",
+    ".swift": "Swift",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".pl": "Perl",
+    ".pm": "Perl",
+    ".lua": "Lua",
+    ".r": "R",
+    ".jl": "Julia",
+    ".dart": "Dart",
+    ".tf": "Terraform",
+    ".proto": "Protocol Buffers",
+    ".graphql": "GraphQL",
+}
+
+# Noms de fichiers sans extension significative -> langage
+FILENAME_LANGUAGES = {
+    "Makefile": "Makefile",
+    "GNUmakefile": "Makefile",
+    "Dockerfile": "Dockerfile",
+    "Containerfile": "Dockerfile",
+    "Jenkinsfile": "Groovy",
+    "Vagrantfile": "Ruby",
+    "Rakefile": "Ruby",
+    "Gemfile": "Ruby",
+}
+
+# Interpréteur du shebang (sans numéro de version) -> langage
+SHEBANG_LANGUAGES = {
+    "python": "Python",
+    "pypy": "Python",
+    "sh": "Shell",
+    "bash": "Shell",
+    "dash": "Shell",
+    "zsh": "Shell",
+    "ksh": "Shell",
+    "fish": "Fish",
+    "node": "JavaScript",
+    "deno": "TypeScript",
+    "ts-node": "TypeScript",
+    "ruby": "Ruby",
+    "perl": "Perl",
+    "php": "PHP",
+    "lua": "Lua",
+    "Rscript": "R",
+}
+
+# Octets lus pour reconnaître un shebang
+SHEBANG_READ_SIZE = 256
+
+_VERSION_SUFFIX = re.compile(r"[\d.]+$")
+
+
+def language_for_name(name: str, suffix: str) -> str | None:
+    """
+    Langage d'un fichier d'après son nom, sans le lire.
+
+    Args:
+        name: Nom du fichier
+        suffix: Extension (avec le point, "" si aucune)
+
+    Returns:
+        Nom du langage, ou None s'il faut examiner le contenu (ou que le
+        fichier n'est pas du code reconnu)
+    """
+    language = FILENAME_LANGUAGES.get(name)
+    if language is None and suffix:
+        language = EXTENSION_LANGUAGES.get(suffix.lower())
+    return language
+
+
+def shebang_language(first_line: bytes) -> str | None:
+    """
+    Langage désigné par une ligne shebang.
+
+    Args:
+        first_line: Début du fichier (au moins sa première ligne)
+
+    Returns:
+        Nom du langage, ou None sans shebang reconnu
+    """
+    if not first_line.startswith(b"#!"):
+        return None
+    words = first_line[2:].split(b"\n", 1)[0].decode("utf-8", "replace").split()
+    if not words:
+        return None
+    interpreter = os.path.basename(words[0])
+    if interpreter == "env":
+        # #!/usr/bin/env [-S] [VAR=valeur] python3 -u
+        args = [w for w in words[1:] if not w.startswith("-") and "=" not in w]
+        if not args:
+            return None
+        interpreter = os.path.basename(args[0])
+    return SHEBANG_LANGUAGES.get(_VERSION_SUFFIX.sub("", interpreter) or interpreter)
+
+
+def detect_shebang(path: str | os.PathLike[str]) -> str | None:
+    """
+    Lit le shebang d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Voir shebang_language
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    with open(path, "rb") as f:
+        return shebang_language(f.read(SHEBANG_READ_SIZE))
+
+
+def language_table(counts: dict[str, list[int]]) -> dict[str, dict[str, Any]]:
+    """
+    Met en forme la section languages.
+
+    Args:
+        counts: Langage -> [fichiers, lignes]
+
+    Returns:
+        Langage -> {"files", "lines"}, par nombre de lignes décroissant
+        (langages sans fichier omis)
+    """
+    ordered = sorted(
+        ((language, c) for language, c in counts.items() if c[0] > 0),
+        key=lambda item: (-item[1][1], item[0]),
+    )
+    return {language: {"files": c[0], "lines": c[1]} for language, c in ordered}
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Compteur de lignes binaire à tampon réutilisable.
+
+Compte les ``b"\\n"`` directement dans les octets du fichier, sans décodage
+ni liste de lignes : un seul bytearray est alloué par compteur et rempli
+avec readinto, quelle que soit la taille du fichier (mmap n'offre pas de
+comptage sans copie préalable dans un tampon).
+
+Le résultat est indépendant de l'encodage : un fichier non UTF-8 est compté
+comme les autres. Une dernière ligne sans saut de ligne final est comptée,
+comme le faisait ``len(f.readlines())``.
+"""
+
+import os
+
+# Taille du tampon de lecture par défaut (64 Kio)
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+_NEWLINE = ord("\n")
+
+
+class LineCounter:
+    """
+    Compteur de lignes réutilisable.
+
+    Une instance possède son propre tampon : elle n'est pas partageable
+    entre threads (utiliser une instance par thread).
+
+    Attributes:
+        bytes_read: Nombre total d'octets lus depuis la création
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Initialise le compteur.
+
+        Args:
+            buffer_size: Taille du tampon de lecture en octets
+        """
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self.bytes_read = 0
+
+    def count_file(self, path: str | os.PathLike[str]) -> int:
+        """
+        Compte les lignes d'un fichier.
+
+        Args:
+            path: Chemin du fichier
+
+        Returns:
+            Nombre de lignes
+
+        Raises:
+            OSError: Si le fichier ne peut pas être lu
+        """
+        with open(path, "rb", buffering=0) as f:
+            return self._count_stream(f)
+
+    def _count_stream(self, f) -> int:
+        """Compte les lignes en remplissant le tampon avec readinto."""
+        buffer = self._buffer
+        lines = 0
+        last = _NEWLINE
+        while True:
+            n = f.readinto(self._view)
+            if not n:
+                break
+            lines += buffer.count(b"\n", 0, n)
+            last = buffer[n - 1]
+            self.bytes_read += n
+
+        if last != _NEWLINE:
+            # Dernière ligne sans saut de ligne final
+            lines += 1
+        return lines
+
+
+def count_lines(path: str | os.PathLike[str]) -> int:
+    """
+    Compte les lignes d'un fichier avec un compteur éphémère.
+
+    Pour de nombreux fichiers, préférer une instance de LineCounter
+    réutilisée afin de ne pas réallouer le tampon.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Nombre de lignes
+    """
+    return LineCounter().count_file(path)
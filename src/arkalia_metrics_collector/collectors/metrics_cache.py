@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Cache persistant des métriques par fichier.
+
+Stocke dans une base SQLite (``.arkalia_cache/file_metrics.sqlite``) les
+métriques de chaque fichier analysé, indexées par chemin relatif et
+validées par la signature stat (taille, mtime_ns, inode). Un fichier dont
+la signature n'a pas changé n'est pas relu.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from arkalia_metrics_collector.collectors.file_analysis import ANALYSIS_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Nom du dossier de cache créé à la racine du projet
+CACHE_DIR_NAME = ".arkalia_cache"
+
+Signature = tuple[int, int, int]
+
+
+def prepare_cache_dir(cache_dir: str | Path) -> Path:
+    """
+    Crée le dossier de cache, ignoré par Git (comme .pytest_cache).
+
+    Args:
+        cache_dir: Dossier du cache
+
+    Returns:
+        Chemin du dossier
+    """
+    path = Path(cache_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    gitignore = path / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Créé par arkalia-metrics-collector\n*\n")
+    return path
+
+
+def stat_signature(st: os.stat_result | None) -> Signature | None:
+    """
+    Calcule la signature d'un fichier depuis son résultat stat.
+
+    Args:
+        st: Résultat de os.stat (None si le fichier est inaccessible)
+
+    Returns:
+        (taille, mtime_ns, inode) ou None
+    """
+    if st is None:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class FileMetricsCache:
+    """
+    Cache SQLite des métriques par fichier, validé par signature stat.
+
+    Le contenu est chargé en mémoire à l'ouverture ; les écritures sont
+    regroupées dans une transaction par appel à commit(). Une instance peut
+    être utilisée depuis plusieurs threads.
+
+    Attributes:
+        db_path: Chemin de la base SQLite
+        hits: Nombre de fichiers servis par le cache
+        misses: Nombre de fichiers (ré)analysés
+        deleted: Nombre d'entrées supprimées (fichiers disparus)
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        Ouvre (ou crée) le cache.
+
+        Args:
+            cache_dir: Dossier du cache (ex: <projet>/.arkalia_cache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "file_metrics.sqlite"
+        self.hits = 0
+        self.misses = 0
+        self.deleted = 0
+        self._entries: dict[str, tuple[Signature, dict[str, Any]]] = {}
+        self._pending: dict[str, tuple[Signature, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        # Écritures dans l'ordre des prises : la plus récente gagne
+        self._commit_lock = threading.Lock()
+        self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Ouvre une connexion SQLite sur la base du cache."""
+        prepare_cache_dir(self.cache_dir)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "inode INTEGER, data TEXT)"
+        )
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Ouvre une connexion, valide la transaction puis la ferme."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _load(self) -> None:
+        """Charge toutes les entrées valides pour la version d'analyse."""
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'analysis_version'"
+                ).fetchone()
+                if row is None or row[0] != str(ANALYSIS_VERSION):
+                    # Résultats produits par d'autres analyseurs : on repart à zéro
+                    conn.execute("DELETE FROM files")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('analysis_version', ?)",
+                        (str(ANALYSIS_VERSION),),
+                    )
+                    return
+                for path, size, mtime_ns, inode, data in conn.execute(
+                    "SELECT path, size, mtime_ns, inode, data FROM files"
+                ):
+                    self._entries[path] = ((size, mtime_ns, inode), json.loads(data))
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Cache de métriques inutilisable ({self.db_path}): {e}")
+            self._entries = {}
+
+    def get(self, rel_path: str, signature: Signature | None) -> dict[str, Any] | None:
+        """
+        Retourne les métriques en cache si la signature correspond.
+
+        Args:
+            rel_path: Chemin relatif du fichier
+            signature: Signature stat actuelle
+
+        Returns:
+            Métriques en cache ou None
+        """
+        if signature is None:
+            return None
+        cached = self._entries.get(rel_path)
+        if cached is None or cached[0] != signature:
+            return None
+        return cached[1]
+
+    def put(self, rel_path: str, signature: Signature, data: dict[str, Any]) -> None:
+        """
+        Enregistre les métriques d'un fichier (écrites au prochain commit).
+
+        Les métriques d'autres analyseurs déjà en cache pour la même
+        signature sont conservées.
+
+        Args:
+            rel_path: Chemin relatif du fichier
+            signature: Signature stat au moment de l'analyse
+            data: Métriques du fichier
+        """
+        with self._lock:
+            previous = self._entries.get(rel_path)
+            if previous is not None and previous[0] == signature:
+                data = {**previous[1], **data}
+            self._entries[rel_path] = (signature, data)
+            self._pending[rel_path] = (signature, data)
+
+    def record(self, hits: int = 0, misses: int = 0) -> None:
+        """
+        Comptabilise des fichiers servis ou réanalysés (sûr entre threads).
+
+        Args:
+            hits: Fichiers servis par le cache
+            misses: Fichiers (ré)analysés
+        """
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def prune(self, live_paths: Iterable[str]) -> int:
+        """
+        Supprime les entrées des fichiers qui n'existent plus.
+
+        Args:
+            live_paths: Chemins relatifs encore présents dans le projet
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        live = set(live_paths)
+        with self._lock:
+            stale = [path for path in self._entries if path not in live]
+            for path in stale:
+                del self._entries[path]
+                self._pending.pop(path, None)
+
+        if stale:
+            try:
+                with self._transaction() as conn:
+                    conn.executemany(
+                        "DELETE FROM files WHERE path = ?", [(p,) for p in stale]
+                    )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Nettoyage du cache impossible: {e}")
+
+        self.deleted += len(stale)
+        return len(stale)
+
+    def commit(self) -> None:
+        """Écrit les entrées en attente dans une seule transaction."""
+        with self._commit_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            rows = [
+                (path, *signature, json.dumps(data, separators=(",", ":")))
+                for path, (signature, data) in pending.items()
+            ]
+            try:
+                with self._transaction() as conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", rows
+                    )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Écriture du cache impossible: {e}")
+                with self._lock:
+                    # Nouvel essai au prochain commit (entrées récentes gardées)
+                    self._pending = {**pending, **self._pending}
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Statistiques d'utilisation du cache.
+
+        Returns:
+            Dictionnaire hits/misses/deleted et chemin de la base
+        """
+        return {
+            "enabled": True,
+            "path": str(self.db_path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "deleted": self.deleted,
+        }
@@ -10,14 +10,187 @@ Collecte des métriques fiables sur :
 - Sécurité et qualité
 """
 
-import subprocess  # nosec B404
+import hashlib
+import logging
+import os
+import random
+import re
 import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from arkalia_metrics_collector import __version__
+from arkalia_metrics_collector.collectors.analysis_pool import (
+    AnalysisPool,
+    resolve_jobs,
+)
+from arkalia_metrics_collector.collectors.code_structure import aggregate_structure
+from arkalia_metrics_collector.collectors.content_store import (
+    ContentStore,
+    blake2b_digest,
+    content_key_batch,
+)
 from arkalia_metrics_collector.collectors.coverage_parser import CoverageParser
+from arkalia_metrics_collector.collectors.directory_rollup import (
+    DEFAULT_ROLLUP_DEPTH,
+    DirectoryRollup,
+)
+from arkalia_metrics_collector.collectors.exclusion_matcher import ExclusionMatcher
+from arkalia_metrics_collector.collectors.file_analysis import (
+    analyze_batch,
+    pool_kind,
+)
+from arkalia_metrics_collector.collectors.file_stream import (
+    FILE_KINDS,
+    KIND_FLAGS,
+    SLOC_FIELDS,
+    STREAM_CHUNK_SIZE,
+    FileStreamReducer,
+    StreamedFile,
+    line_values,
+)
+from arkalia_metrics_collector.collectors.file_table import (
+    FLAG_DOCUMENTATION,
+    FLAG_PYTHON,
+    FLAG_TEST,
+    FileTable,
+)
+from arkalia_metrics_collector.collectors.file_walker import (
+    FileWalker,
+    ProjectScan,
+    WalkEntry,
+)
+from arkalia_metrics_collector.collectors.incremental import (
+    DEFAULT_FULL_EVERY,
+    SNAPSHOT_FILE,
+    CollectionSnapshot,
+    git_changed_paths,
+    git_head,
+    git_untracked,
+    snapshot_fingerprint,
+)
+from arkalia_metrics_collector.collectors.languages import (
+    language_for_name,
+    language_table,
+)
+from arkalia_metrics_collector.collectors.metrics_cache import (
+    CACHE_DIR_NAME,
+    FileMetricsCache,
+    prepare_cache_dir,
+    stat_signature,
+)
+from arkalia_metrics_collector.collectors.phases import (
+    Phase,
+    PhaseResult,
+    check_cancelled,
+    publishing,
+    run_phases,
+)
+from arkalia_metrics_collector.collectors.pytest_workers import (
+    PYTEST_CACHE_DIR,
+    PYTEST_COLLECTION_VERSION,
+    PYTEST_CONFIG_FILES,
+    detect_project_python,
+    shared_pool,
+)
+from arkalia_metrics_collector.collectors.sampling import (
+    CONFIDENCE,
+    StratifiedEstimator,
+    sample_order,
+    stratum_key,
+)
+from arkalia_metrics_collector.collectors.test_counter import is_test_module
+from arkalia_metrics_collector.instrumentation.calls import run_command
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+from arkalia_metrics_collector.instrumentation.timings import TimingRecorder
+
+logger = logging.getLogger(__name__)
+
+# Moteurs de comptage des tests
+TEST_COUNTERS = ("static", "pytest", "pytest-pool")
+
+# Phases d'une collecte complète (délais configurables via phase_timeouts)
+PHASES = (
+    "python",
+    "tests",
+    "coverage",
+    "documentation",
+    "languages",
+    "code_structure",
+)
+
+# Encodage des listes de fichiers dans les métriques (voir file_table)
+FILE_LISTS = ("legacy", "compact")
+
+# Extensions considérées comme de la documentation
+DOC_EXTENSIONS = {".md", ".rst", ".txt", ".html", ".pdf"}
+
+# Modules analysés entre deux vérifications de l'échéance (collecte bornée)
+SAMPLE_BATCH_SIZE = 64
+
+# Champs du résumé estimés par une collecte échantillonnée
+ESTIMATED_FIELDS = ("lines_of_code", *SLOC_FIELDS)
+
+# Sections et champs du résumé alimentés par chaque phase : ceux d'une phase
+# en échec ou hors délai sont signalés incomplets
+PHASE_OUTPUTS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "python": (
+        ("python_files", "languages"),
+        ("total_python_files", "lines_of_code", *SLOC_FIELDS),
+    ),
+    "tests": (("test_metrics",), ("collected_tests",)),
+    "coverage": (("test_metrics",), ()),
+    "documentation": (("documentation_metrics",), ("documentation_files",)),
+    "languages": (("languages",), ()),
+    "code_structure": (("code_structure",), ()),
+}
+
+
+# Résumé de pytest --collect-only : "12 tests collected", "2/5 tests
+# collected (3 deselected)" en mode -q, "collected 12 items" sinon
+_COLLECTED_SUMMARY = re.compile(
+    r"^(?:(\d+)(?:/\d+)? tests? collected|collected (\d+) items?)\b", re.MULTILINE
+)
+
+
+def parse_collected_count(output: str) -> int | None:
+    """
+    Nombre de tests d'une sortie de ``pytest --collect-only``.
+
+    Args:
+        output: Sortie standard de pytest
+
+    Returns:
+        Nombre de tests du résumé, à défaut nombre de lignes "chemin::test" ;
+        None si la sortie ne permet pas de compter
+    """
+    match = _COLLECTED_SUMMARY.search(output)
+    if match:
+        return int(match.group(1) or match.group(2))
+    if re.search(r"^no tests collected\b", output, re.MULTILINE):
+        return 0
+    nodeids = sum(1 for line in output.splitlines() if "::" in line)
+    return nodeids or None
+
+
+def _emit_cache(cache: str, key: str, hit: bool) -> None:
+    """Émet on_cache_hit ou on_cache_miss pour un fichier."""
+    hooks.emit("on_cache_hit" if hit else "on_cache_miss", cache=cache, key=key)
+
+
+def _emit_analyzed(
+    entries: list[WalkEntry], results: list[dict[str, Any] | None], reused: list[bool]
+) -> None:
+    """Émet on_file_analyzed pour chaque fichier d'un lot (si abonnés)."""
+    if not hooks.on_file_analyzed:
+        return
+    for entry, data, cached in zip(entries, results, reused, strict=True):
+        hooks.emit("on_file_analyzed", path=entry.rel_path, metrics=data, cached=cached)
 
 
 class MetricsCollector:
@@ -33,18 +206,148 @@ class MetricsCollector:
 
     Attributes:
         project_root: Chemin racine du projet
-        exclude_patterns: Patterns de fichiers/dossiers à exclure
+        exclude_patterns: Noms de fichiers/dossiers toujours exclus
+        config_file: Configuration YAML dont la section ``exclusions``
+            complète les exclusions par défaut (config/default.yaml du paquet)
+        enumeration: Moteur d'énumération des fichiers ("auto", "git" ou
+            "filesystem")
+        jobs: Nombre de workers pour l'analyse par fichier
+        cache: Cache persistant des métriques par fichier (None si désactivé)
+        content_store: Stockage des métriques adressé par contenu (None si
+            désactivé)
+        incremental: Collecte incrémentale depuis le dernier commit collecté
+        test_counter: Moteur de comptage des tests ("static", "pytest" ou
+            "pytest-pool")
+        test_python: Interpréteur du projet utilisé par les moteurs pytest
+        code_structure: Collecte des métriques de structure du code
+        sloc: Collecte de la répartition SLOC des modules Python
+        languages: Collecte des fichiers et lignes par langage
+        phase_timeouts: Délai maximal par phase de collecte (secondes)
+        deadline: Durée visée de collect_all_metrics (secondes ; None :
+            collecte exacte)
+        sample_seed: Graine de l'échantillonnage (None : aléatoire)
+        concurrent_phases: Exécuter les phases de collecte en parallèle
         metrics_data: Données des métriques collectées
+
+    Le projet n'est parcouru qu'une seule fois par instance : le résultat
+    classé du parcours est partagé par toutes les méthodes collect_*.
+    Appeler refresh() pour forcer un nouveau parcours.
+
+    Le collecteur ne change jamais le répertoire courant du processus :
+    plusieurs instances peuvent collecter en parallèle dans des threads (voir
+    collect_many), et les appels concurrents à collect_all_metrics sur une
+    même instance sont sérialisés.
     """
 
-    def __init__(self, project_root: str = ".") -> None:
+    def __init__(
+        self,
+        project_root: str | Path = ".",
+        config_file: str | Path | None = None,
+        exclusion_matcher: ExclusionMatcher | None = None,
+        enumeration: str = "auto",
+        jobs: int | None = 1,
+        cache: bool = False,
+        cache_dir: str | Path | None = None,
+        content_store: ContentStore | str | Path | None = None,
+        incremental: bool = False,
+        full_every: int = DEFAULT_FULL_EVERY,
+        test_counter: str = "static",
+        test_python: str | None = None,
+        code_structure: bool = False,
+        sloc: bool = False,
+        languages: bool = False,
+        phase_timeouts: dict[str, float] | None = None,
+        concurrent_phases: bool = True,
+        file_lists: str = "legacy",
+        directory_depth: int = DEFAULT_ROLLUP_DEPTH,
+        deadline: float | None = None,
+        sample_seed: int | None = None,
+    ) -> None:
         """
         Initialise le collecteur de métriques.
 
         Args:
             project_root: Chemin racine du projet (défaut: répertoire courant)
+            config_file: Configuration du projet (ex:
+                config/project_configs/athalia.yaml) dont les exclusions
+                s'ajoutent aux exclusions par défaut
+            exclusion_matcher: Matcher déjà compilé à partager entre
+                plusieurs collecteurs (prioritaire sur config_file)
+            enumeration: "auto" utilise ``git ls-files`` dans un dépôt Git
+                (respecte .gitignore) et le parcours du système de fichiers
+                sinon ; "git" ou "filesystem" forcent un moteur
+            jobs: Nombre de workers pour l'analyse par fichier (1 : séquentiel,
+                0 ou None : un par CPU)
+            cache: Réutilise les métriques des fichiers inchangés (taille,
+                mtime, inode) d'un run à l'autre
+            cache_dir: Dossier du cache (défaut: <projet>/.arkalia_cache)
+            content_store: Stockage adressé par contenu (SHA du blob Git ou
+                blake2b), ou son dossier ; partageable entre projets,
+                checkouts et runners CI
+            incremental: Dans un dépôt Git, ne réexaminer que les chemins
+                modifiés depuis le commit de la collecte précédente
+                (instantané dans cache_dir)
+            full_every: Nombre de runs incrémentaux avant une collecte
+                complète de réconciliation
+            test_counter: "static" analyse les modules de test avec ast
+                (sans importer le code du projet) ; "pytest" lance
+                ``pytest --collect-only`` ; "pytest-pool" utilise des workers
+                pytest persistants et un cache par fichier de test
+            test_python: Interpréteur du projet pour les moteurs pytest
+                (défaut: virtualenv détecté à la racine, sinon l'interpréteur
+                courant)
+            code_structure: Ajoute la section ``code_structure`` (fonctions,
+                classes, méthodes, complexité cyclomatique) à
+                collect_all_metrics ; analyse mise en cache comme les autres
+            sloc: Ajoute la répartition SLOC (code, commentaires, docstrings,
+                lignes vides) aux métriques Python ; coûte une passe
+                ``tokenize`` par module (CPU), mise en cache comme les autres
+            languages: Ajoute la section ``languages`` (fichiers et lignes
+                par langage) à collect_all_metrics ; coûte une lecture de
+                chaque fichier non .py d'un langage connu, plus l'en-tête
+                (shebang) des fichiers sans extension
+            phase_timeouts: Délai maximal (secondes) des phases de
+                collect_all_metrics ("python", "tests", "coverage",
+                "documentation", "languages", "code_structure") ; une
+                phase hors délai reçoit un résultat vide sans invalider les
+                autres
+            concurrent_phases: Exécuter les phases en parallèle (le comptage
+                des tests par sous-processus recouvre l'analyse des fichiers)
+            file_lists: "legacy" produit les listes de chemins
+                (files_list, test_files_list, documentation_list) ;
+                "compact" les remplace par la section ``file_table``
+                (table en colonnes, voir expand_file_lists)
+            directory_depth: Profondeur de l'arbre des cumuls par dossier
+                (section ``directories``, 0 : racine seule)
+            deadline: Durée visée (secondes) de collect_all_metrics ; les
+                modules Python sont alors énumérés sans lecture puis
+                analysés par échantillon stratifié jusqu'à l'échéance, et
+                les totaux de lignes extrapolés avec un intervalle de
+                confiance (voir sampling). Les autres phases reçoivent ce
+                délai sauf délai explicite dans phase_timeouts
+            sample_seed: Graine de l'ordre d'échantillonnage (résultats
+                reproductibles à échantillon égal)
+
+        Raises:
+            ValueError: Si test_counter, file_lists ou une phase de
+                phase_timeouts est inconnu, directory_depth négatif ou
+                deadline non positif
         """
+        if test_counter not in TEST_COUNTERS:
+            raise ValueError(f"Moteur de comptage des tests inconnu: {test_counter}")
+        if file_lists not in FILE_LISTS:
+            raise ValueError(f"Encodage des listes de fichiers inconnu: {file_lists}")
+        if directory_depth < 0:
+            raise ValueError(f"Profondeur invalide: {directory_depth}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"Échéance invalide: {deadline}")
+        unknown_phases = set(phase_timeouts or {}) - set(PHASES)
+        if unknown_phases:
+            raise ValueError(f"Phases inconnues: {', '.join(sorted(unknown_phases))}")
         self.project_root = Path(project_root).resolve()
+        self.config_file = Path(config_file) if config_file else None
+        self.enumeration = enumeration
+        self.jobs = resolve_jobs(jobs)
         self.exclude_patterns: set[str] = {
             "__pycache__",
             ".venv",
@@ -62,87 +365,818 @@ class MetricsCollector:
             "._*",  # AppleDouble files
         }
         self.metrics_data: dict[str, Any] = {}
+        self._shared_matcher = exclusion_matcher
+        self._matcher: ExclusionMatcher | None = exclusion_matcher
+        self._scan: ProjectScan | None = None
+        self._file_table: FileTable | None = None
+        self._rollup: DirectoryRollup | None = None
+        # Échantillonnage de la dernière collecte bornée (None : exacte)
+        self._sampling: dict[str, Any] | None = None
+        self._deadline_at: float | None = None
+        # Mesures des phases du dernier collect_all_metrics
+        self._timings = TimingRecorder()
+        self.cache_dir = Path(cache_dir or self.project_root / CACHE_DIR_NAME)
+        self.cache: FileMetricsCache | None = None
+        if cache:
+            self.cache = FileMetricsCache(self.cache_dir)
+        if content_store is not None and not isinstance(content_store, ContentStore):
+            content_store = ContentStore(content_store)
+        self.content_store: ContentStore | None = content_store
+        self._blob_ids: dict[str, str] | None = None
+        self.incremental = incremental
+        self.test_counter = test_counter
+        self.test_python = test_python or detect_project_python(self.project_root)
+        self.full_every = full_every
+        self.code_structure = code_structure
+        self.sloc = sloc
+        self.languages = languages
+        self.phase_timeouts: dict[str, float] = dict(phase_timeouts or {})
+        self.concurrent_phases = concurrent_phases
+        self.file_lists = file_lists
+        self.directory_depth = directory_depth
+        self.deadline = deadline
+        self.sample_seed = sample_seed
+        # Chemins connus sans parcours et métriques reprises de l'instantané
+        self._scan_paths: list[str] | None = None
+        self._known_analyses: dict[str, dict[str, Any]] = {}
+        # Métriques par fichier du run courant (base du prochain instantané)
+        self._analyses: dict[str, dict[str, Any]] = {}
+        # Un seul collect_all_metrics à la fois par instance
+        self._run_lock = threading.RLock()
+        # Protège l'état partagé par les phases (parcours, métriques du run)
+        self._lock = threading.RLock()
+
+    @property
+    def exclusion_matcher(self) -> ExclusionMatcher:
+        """
+        Matcher d'exclusions compilé (une fois par instance).
+
+        Combine les exclusions par défaut, celles de config_file et les noms
+        de exclude_patterns.
+        """
+        if self._matcher is None:
+            self._matcher = ExclusionMatcher.from_config(
+                config_files=[self.config_file] if self.config_file else [],
+                extra_patterns=[f"**/{name}" for name in sorted(self.exclude_patterns)],
+            )
+        return self._matcher
+
+    def _file_classifiers(self) -> dict[str, Callable[[WalkEntry], bool]]:
+        """
+        Retourne les classificateurs utilisés lors du parcours unique.
+
+        Les sous-classes peuvent ajouter leurs propres catégories ici pour
+        profiter du même parcours.
+
+        Returns:
+            Prédicats par catégorie de fichiers
+        """
+        return {
+            "python": lambda entry: entry.suffix == ".py",
+            "test": lambda entry: entry.suffix == ".py" and self._is_test_file(entry),
+            "documentation": lambda entry: entry.suffix in DOC_EXTENSIONS,
+            # Autres langages : reconnus par le nom, ou shebang à lire
+            "language": lambda entry: entry.suffix != ".py"
+            and (
+                not entry.suffix
+                or language_for_name(entry.name, entry.suffix) is not None
+            ),
+        }
+
+    def _walker(self) -> FileWalker:
+        """Moteur de parcours appliquant les exclusions du projet."""
+        # Les dossiers exclus sont élagués avant la descente
+        matcher = self.exclusion_matcher
+        return FileWalker(
+            self.project_root,
+            is_excluded=lambda entry: matcher.match_file(entry.rel_path, entry.name),
+            is_dir_excluded=matcher.match_dir,
+            backend=self.enumeration,
+        )
+
+    def scan_project(self) -> ProjectScan:
+        """
+        Parcourt le projet une seule fois et classe les fichiers.
+
+        Le résultat est mis en cache sur l'instance et réutilisé par
+        toutes les méthodes collect_*.
+
+        Returns:
+            Résultat classé du parcours
+        """
+        with self._lock:
+            if self._scan is None:
+                walker = self._walker()
+                if self._scan_paths is not None:
+                    # Collecte incrémentale : liste déjà connue, pas de parcours
+                    scan = walker.scan_paths(self._scan_paths, self._file_classifiers())
+                else:
+                    scan = walker.scan(self._file_classifiers())
+                with publishing():
+                    self._scan = scan
+            return self._scan
+
+    def file_table(self) -> FileTable:
+        """
+        Table en colonnes des fichiers classés (Python, tests, documentation).
+
+        Construite une fois par parcours, dans l'ordre du parcours ; la
+        colonne des lignes est renseignée par collect_python_metrics.
+
+        Returns:
+            Table des fichiers du parcours courant
+        """
+        with self._lock:
+            if self._file_table is None:
+                self.scan_project()
+                table = FileTable()
+                for record in self.iter_files(analyze=False):
+                    table.add(record.rel_path, record.size, KIND_FLAGS[record.kind])
+                with publishing():
+                    self._file_table = table
+            return self._file_table
+
+    def _classified_entries(
+        self, kinds: frozenset[str]
+    ) -> Iterator[tuple[WalkEntry, str]]:
+        """
+        Fichiers classés, dans l'ordre du parcours, avec leur type.
+
+        Réutilise le parcours courant s'il existe ; sinon énumère le projet
+        au fil de l'eau sans conserver la liste des fichiers.
+
+        Args:
+            kinds: Types de fichiers voulus (voir FILE_KINDS)
+
+        Yields:
+            Couples (entrée, type)
+        """
+        with self._lock:
+            scan = self._scan
+            if scan is None and self._scan_paths is not None:
+                scan = self.scan_project()
+
+        if scan is not None:
+            tests = {entry.rel_path for entry in scan.get("test")}
+            classified: dict[str, tuple[WalkEntry, str]] = {}
+            if kinds & {"core", "test"}:
+                for entry in scan.get("python"):
+                    kind = "test" if entry.rel_path in tests else "core"
+                    classified[entry.rel_path] = (entry, kind)
+            if "documentation" in kinds:
+                for entry in scan.get("documentation"):
+                    classified[entry.rel_path] = (entry, "documentation")
+            for rel_path in scan.paths:
+                item = classified.get(rel_path)
+                if item is not None and item[1] in kinds:
+                    yield item
+            return
+
+        classifiers = self._file_classifiers()
+        is_python = classifiers["python"]
+        is_test = classifiers["test"]
+        is_documentation = classifiers["documentation"]
+        for entry in self._walker().entries():
+            if is_python(entry):
+                kind = "test" if is_test(entry) else "core"
+            elif is_documentation(entry):
+                kind = "documentation"
+            else:
+                continue
+            if kind in kinds:
+                yield entry, kind
+
+    def iter_files(
+        self,
+        kinds: Iterable[str] | None = None,
+        analyze: bool = True,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[StreamedFile]:
+        """
+        Produit les fichiers classés au fil du parcours.
+
+        Les modules Python sont analysés par paquets de chunk_size fichiers
+        (caches et pool d'analyse comme collect_python_metrics) ; la mémoire
+        utilisée ne dépend que de la taille des paquets. Sans parcours en
+        cache (scan_project), le projet est énuméré au fil de l'eau.
+
+        Args:
+            kinds: Types à produire parmi "core", "test" et "documentation"
+                (défaut: tous)
+            analyze: False pour ne pas lire les fichiers (lines et sloc
+                valent alors None ; sloc vaut toujours None sans l'option
+                sloc)
+            chunk_size: Nombre de fichiers par paquet analysé
+
+        Yields:
+            Un StreamedFile par fichier, dans l'ordre du parcours
+
+        Raises:
+            ValueError: Si un type est inconnu ou chunk_size < 1
+        """
+        wanted = frozenset(kinds if kinds is not None else FILE_KINDS)
+        unknown = wanted - set(FILE_KINDS)
+        if unknown:
+            raise ValueError(
+                f"Types de fichiers inconnus: {', '.join(sorted(unknown))}"
+            )
+        if chunk_size < 1:
+            raise ValueError(f"Taille de paquet invalide: {chunk_size}")
+
+        # Un seul pool pour tout le flux (fermé à l'arrêt du générateur)
+        with AnalysisPool(self.jobs) as pool:
+            chunk: list[tuple[WalkEntry, str]] = []
+            for item in self._classified_entries(wanted):
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    yield from self._stream_chunk(chunk, analyze, pool)
+                    chunk = []
+            if chunk:
+                yield from self._stream_chunk(chunk, analyze, pool)
+
+    def _stream_chunk(
+        self,
+        chunk: list[tuple[WalkEntry, str]],
+        analyze: bool,
+        pool: AnalysisPool,
+    ) -> Iterator[StreamedFile]:
+        """Analyse un paquet de fichiers et produit leurs enregistrements."""
+        analyses: dict[int, tuple[dict[str, Any] | None, bool]] = {}
+        if analyze:
+            python = [i for i, (_, kind) in enumerate(chunk) if kind != "documentation"]
+            results, reused = self._analyze_entries(
+                [chunk[i][0] for i in python], self._line_analyzers, pool
+            )
+            analyses = dict(zip(python, zip(results, reused, strict=True), strict=True))
+
+        for index, (entry, kind) in enumerate(chunk):
+            data, cached = analyses.get(index, (None, False))
+            yield StreamedFile(
+                entry.rel_path,
+                kind,
+                entry.size,
+                data["lines"] if data is not None else None,
+                data.get("sloc") if data is not None else None,
+                cached,
+            )
+
+    @property
+    def _line_analyzers(self) -> tuple[str, ...]:
+        """Analyses des passes de lignes (sloc seulement sur demande)."""
+        return ("lines", "sloc") if self.sloc else ("lines",)
+
+    def refresh(self) -> None:
+        """Oublie le parcours en cache pour refléter les changements disque."""
+        with self._lock:
+            self._scan = None
+            self._file_table = None
+            self._rollup = None
+            self._sampling = None
+            self._blob_ids = None
+            self._scan_paths = None
+            self._known_analyses = {}
+            self._analyses = {}
+            self._matcher = self._shared_matcher
 
     def _is_excluded(self, path: Path) -> bool:
         """
         Vérifie si un chemin doit être exclu de l'analyse.
 
+        Le chemin, relatif à la racine du projet, est testé par le matcher
+        d'exclusions compilé. Aucun appel système n'est effectué.
+
         Args:
             path: Chemin à vérifier
 
         Returns:
             True si le chemin doit être exclu
         """
-        path_str = str(path)
-        path_parts = path.parts
-
-        # Exclusion intelligente : seulement les dossiers système et cache
-        for pattern in self.exclude_patterns:
-            # Pattern avec wildcard (ex: ._*)
-            if pattern.startswith("*") and path_str.endswith(pattern[1:]):
-                return True
-
-            # Exclusion des dossiers système uniquement (pas des fichiers Python dans ces dossiers)
-            if pattern in path_parts:
-                # Si c'est un dossier système, exclure
-                if path.is_dir():
-                    return True
-                # Si c'est un fichier Python dans un dossier système, vérifier plus précisément
-                elif path.is_file() and path.suffix == ".py":
-                    # Ne pas exclure les fichiers Python dans .github, archive, etc.
-                    if pattern in [".github", "archive", "build", "dist"]:
-                        return False
-                    # Exclure seulement les vrais dossiers système
-                    if pattern in [
-                        "__pycache__",
-                        ".venv",
-                        "venv",
-                        ".git",
-                        ".pytest_cache",
-                    ]:
-                        return True
-
-        return False
+        try:
+            rel_path = path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            rel_path = path.as_posix()
+
+        return self.exclusion_matcher.is_excluded(rel_path)
+
+    def _content_blob_ids(self) -> dict[str, str] | None:
+        """
+        Identifiants de blob Git des fichiers du parcours courant.
+
+        Returns:
+            Chemin relatif -> SHA du blob, ou None hors dépôt Git
+        """
+        if self.scan_project().backend not in ("git", "paths"):
+            return None
+        with self._lock:
+            if self._blob_ids is None:
+                blob_ids = FileWalker(self.project_root).git_blob_ids()
+                with publishing():
+                    self._blob_ids = blob_ids
+            return self._blob_ids
+
+    def _analyze_files(
+        self, entries: list[WalkEntry], analyzers: tuple[str, ...]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Analyse des fichiers en réutilisant les caches actifs.
+
+        Args:
+            entries: Fichiers issus du parcours
+            analyzers: Analyseurs à exécuter (voir file_analysis.ANALYZERS)
+
+        Returns:
+            Métriques par fichier, dans l'ordre de entries (None si illisible)
+        """
+        with AnalysisPool(self.jobs) as pool:
+            return self._analyze_entries(entries, analyzers, pool)[0]
+
+    def _analyze_entries(
+        self,
+        entries: list[WalkEntry],
+        analyzers: tuple[str, ...],
+        pool: AnalysisPool,
+    ) -> tuple[list[dict[str, Any] | None], list[bool]]:
+        """
+        Analyse des fichiers dans un pool existant.
+
+        Ordre de recherche : instantané incrémental (fichier absent du diff
+        Git), cache par signature stat (fichier inchangé sur ce disque), puis
+        stockage adressé par contenu (même contenu vu par un autre checkout
+        ou projet). Seuls les fichiers absents de tous sont relus, en lots
+        équilibrés par taille.
+
+        Args:
+            entries: Fichiers issus du parcours
+            analyzers: Analyseurs à exécuter (voir file_analysis.ANALYZERS)
+            pool: Pool d'analyse (partagé par les paquets d'iter_files)
+
+        Returns:
+            Métriques par fichier (None si illisible) et indicateur de
+            réutilisation d'un cache, dans l'ordre de entries
+        """
+        self._timings.add(len(entries), sum(entry.size for entry in entries))
+        # Hooks de cache : un seul test par lot sans abonné
+        cache_hooks = bool(hooks.on_cache_hit or hooks.on_cache_miss)
+        results: list[dict[str, Any] | None] = [None] * len(entries)
+        reused = [False] * len(entries)
+        pending: list[int] = []
+        # Métriques déjà connues des fichiers à compléter (autres analyseurs)
+        partial: list[dict[str, Any]] = []
+        cache = self.cache
+        store = self.content_store
+
+        def complete(data: dict[str, Any] | None) -> bool:
+            return data is not None and all(name in data for name in analyzers)
+
+        for index, entry in enumerate(entries):
+            known = self._known_analyses.get(entry.rel_path)
+            if complete(known):
+                results[index] = known
+                reused[index] = True
+                if cache_hooks:
+                    _emit_cache("incremental", entry.rel_path, True)
+                continue
+            cached = None
+            if cache is not None:
+                cached = cache.get(entry.rel_path, stat_signature(entry.stat()))
+                if complete(cached):
+                    results[index] = cached
+                    reused[index] = True
+                    cache.record(hits=1)
+                    if cache_hooks:
+                        _emit_cache("stat", entry.rel_path, True)
+                    continue
+            pending.append(index)
+            partial.append({**(known or {}), **(cached or {})})
+
+        if not pending:
+            self._record_analyses(entries, results)
+            _emit_analyzed(entries, results, reused)
+            return results, reused
+
+        weights = [entries[i].size for i in pending] if self.jobs > 1 else None
+        keys: list[str | None] = [None] * len(pending)
+        stored: list[dict[str, Any] | None] = [None] * len(pending)
+        if store is not None:
+            blob_ids = self._content_blob_ids()
+            use_git = blob_ids is not None
+            keys = pool.map_batches(
+                content_key_batch,
+                [
+                    (
+                        entries[i].path,
+                        blob_ids.get(entries[i].rel_path) if blob_ids else None,
+                        use_git,
+                    )
+                    for i in pending
+                ],
+                weights,
+            )
+            stored = [store.get(key) if key else None for key in keys]
+
+        to_compute = [n for n, data in enumerate(stored) if not complete(data)]
+        computed = pool.map_batches(
+            analyze_batch,
+            [(entries[pending[n]].path, analyzers) for n in to_compute],
+            [weights[n] for n in to_compute] if weights else None,
+            kind=pool_kind(analyzers),
+        )
+
+        # Une phase hors délai n'écrit plus dans les caches
+        with publishing():
+            for n, data in zip(to_compute, computed, strict=True):
+                key = keys[n]
+                if store is not None:
+                    store.record(misses=1)
+                    if data is not None and key is not None:
+                        # Conserve les analyseurs déjà stockés pour ce contenu
+                        data = {**(stored[n] or {}), **data}
+                        store.put(key, data)
+                stored[n] = data
+        if store is not None:
+            store.record(hits=len(pending) - len(to_compute))
+
+        computed_indices = set(to_compute)
+        with publishing():
+            for n, index in enumerate(pending):
+                data = stored[n]
+                reused[index] = n not in computed_indices
+                if data is not None:
+                    data = {**partial[n], **data}
+                results[index] = data
+                if cache_hooks:
+                    rel_path = entries[index].rel_path
+                    if cache is not None:
+                        _emit_cache("stat", rel_path, False)
+                    if store is not None:
+                        _emit_cache("content", rel_path, reused[index])
+                if cache is not None:
+                    cache.record(misses=1)
+                    signature = stat_signature(entries[index].stat())
+                    if data is not None and signature is not None:
+                        cache.put(entries[index].rel_path, signature, data)
+
+            if cache is not None:
+                cache.commit()
+        self._record_analyses(entries, results)
+        _emit_analyzed(entries, results, reused)
+        return results, reused
+
+    def _record_analyses(
+        self, entries: list[WalkEntry], results: list[dict[str, Any] | None]
+    ) -> None:
+        """Garde les métriques du run pour l'instantané incrémental."""
+        if not self.incremental:
+            return
+        with self._lock, publishing():
+            for entry, data in zip(entries, results, strict=True):
+                if data is not None:
+                    previous = self._analyses.get(entry.rel_path)
+                    self._analyses[entry.rel_path] = (
+                        {**previous, **data} if previous else data
+                    )
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Chemin de l'instantané de la collecte incrémentale."""
+        return self.cache_dir / SNAPSHOT_FILE
+
+    def _prepare_incremental(self, full: bool) -> dict[str, Any]:
+        """
+        Prépare une collecte incrémentale à partir de l'instantané.
+
+        En cas de succès, la liste des fichiers et leurs métriques sont
+        reprises de l'instantané, sauf pour les chemins modifiés depuis son
+        commit (git diff + fichiers non suivis), qui seront réexaminés.
+
+        Args:
+            full: Forcer une collecte complète
+
+        Returns:
+            Informations sur le mode retenu ("incremental" ou "full")
+        """
+        info: dict[str, Any] = {
+            "enabled": True,
+            "mode": "full",
+            "reason": None,
+            "base": None,
+            "head": None,
+            "changed_paths": None,
+        }
+        head = git_head(self.project_root) if self.enumeration != "filesystem" else None
+        info["head"] = head
+        if head is None:
+            info["reason"] = "not_git"
+            return info
+        if full:
+            info["reason"] = "forced"
+            return info
+
+        snapshot = CollectionSnapshot.load(self.snapshot_path)
+        if snapshot is None:
+            info["reason"] = "no_snapshot"
+            return info
+        if snapshot.fingerprint != snapshot_fingerprint(
+            self.exclusion_matcher.patterns
+        ):
+            info["reason"] = "settings_changed"
+            return info
+        if snapshot.incremental_runs >= self.full_every:
+            info["reason"] = "reconciliation"
+            return info
+
+        changed = git_changed_paths(self.project_root, snapshot.head)
+        if changed is None:
+            info["reason"] = "diff_failed"
+            return info
+        # Un fichier non suivi lors de l'instantané a pu disparaître depuis
+        changed.update(snapshot.untracked)
+
+        existing = {p for p in changed if (self.project_root / p).is_file()}
+        self._scan_paths = [p for p in snapshot.files if p not in changed]
+        self._scan_paths.extend(existing)
+        self._known_analyses = {
+            path: data
+            for path, data in snapshot.analyses.items()
+            if path not in changed
+        }
+
+        info.update(
+            mode="incremental",
+            base=snapshot.head,
+            changed_paths=len(changed),
+            incremental_runs=snapshot.incremental_runs + 1,
+        )
+        return info
+
+    def _save_snapshot(self, info: dict[str, Any]) -> None:
+        """
+        Écrit l'instantané servant de base à la collecte suivante.
+
+        Args:
+            info: Informations renvoyées par _prepare_incremental
+        """
+        scan = self.scan_project()
+        if info["head"] is None or scan.backend not in ("git", "paths"):
+            return
+        untracked = git_untracked(self.project_root)
+        if untracked is None:
+            return
+        try:
+            prepare_cache_dir(self.cache_dir)
+        except OSError as e:
+            logger.warning(f"Dossier de cache inaccessible ({self.cache_dir}): {e}")
+            return
+        CollectionSnapshot(
+            head=info["head"],
+            fingerprint=snapshot_fingerprint(self.exclusion_matcher.patterns),
+            files=scan.paths,
+            untracked=untracked,
+            analyses=self._analyses,
+            incremental_runs=info.get("incremental_runs", 0),
+        ).save(self.snapshot_path)
 
     def collect_python_metrics(self) -> dict[str, Any]:
         """
         Collecte les métriques sur les fichiers Python.
 
+        Avec une échéance (deadline), les lignes sont estimées sur un
+        échantillon (voir _collect_python_sampled).
+
         Returns:
             Dictionnaire avec les métriques Python
         """
-        python_files: list[Path] = []
-        total_lines = 0
+        if self.deadline is not None:
+            return self._collect_python_sampled(
+                self._deadline_at or time.monotonic() + self.deadline
+            )
+        self.scan_project()
+        table = self.file_table()
 
-        for py_file in self.project_root.rglob("*.py"):
-            if not self._is_excluded(py_file):
-                python_files.append(py_file)
-                try:
-                    with open(py_file, encoding="utf-8") as f:
-                        lines = len(f.readlines())
-                        total_lines += lines
-                except (UnicodeDecodeError, OSError):
-                    # Ignorer les fichiers qui ne peuvent pas être lus
-                    continue
+        # Réduction du flux : comptage binaire et classement tokenize par
+        # paquets (fichiers illisibles ignorés), cumuls par dossier au
+        # passage (la documentation n'est pas relue)
+        reducer = FileStreamReducer(sloc=self.sloc)
+        rollup = DirectoryRollup(self.directory_depth)
+        for index, record in enumerate(self.iter_files()):
+            check_cancelled()
+            rollup.add(record)
+            if record.kind == "documentation":
+                continue
+            reducer.add(record)
+            # Même ordre que la table ; seule cette phase écrit les lignes
+            if record.lines is not None:
+                table.set_lines(index, record.lines)
+        with self._lock, publishing():
+            self._rollup = rollup
 
-        # Séparation par type de fichier
-        test_files = [f for f in python_files if self._is_test_file(f)]
-        core_files = [f for f in python_files if not self._is_test_file(f)]
+        result = reducer.python_metrics()
+        if self.file_lists == "legacy":
+            result["files_list"] = table.paths(FLAG_PYTHON)
+        return result
 
-        return {
-            "count": len(python_files),
-            "core_files": len(core_files),
-            "test_files": len(test_files),
-            "total_lines": total_lines,
-            "files_list": [str(f.relative_to(self.project_root)) for f in python_files],
+    def _collect_python_sampled(self, deadline_at: float) -> dict[str, Any]:
+        """
+        Métriques Python estimées avant une échéance.
+
+        Les modules sont énumérés sans lecture et répartis en strates
+        (dossier de premier niveau × classe de taille), puis analysés par
+        paquets de SAMPLE_BATCH_SIZE dans l'ordre de sample_order jusqu'à
+        l'échéance (au moins un paquet). Les comptes de fichiers restent
+        exacts ; les lignes sont extrapolées, avec leur intervalle de
+        confiance dans ``estimates`` si l'échantillon est partiel.
+
+        Args:
+            deadline_at: Échéance (horloge time.monotonic)
+
+        Returns:
+            Dictionnaire avec les métriques Python
+        """
+        scan = self.scan_project()
+        table = self.file_table()
+        entries = scan.get("python")
+        tests = {entry.rel_path for entry in scan.get("test")}
+        rows = table.indices(FLAG_PYTHON)
+
+        fields = ("total_lines", *SLOC_FIELDS) if self.sloc else ("total_lines",)
+        estimator = StratifiedEstimator(fields)
+        keys: list[tuple[str, int]] = []
+        strata: dict[tuple[str, int], list[int]] = {}
+        for index, entry in enumerate(entries):
+            key = stratum_key(entry.rel_path, entry.size)
+            keys.append(key)
+            estimator.add_population(key, entry.size)
+            strata.setdefault(key, []).append(index)
+        order = sample_order(strata, random.Random(self.sample_seed))
+
+        with AnalysisPool(self.jobs) as pool:
+            for start in range(0, len(order), SAMPLE_BATCH_SIZE):
+                if start and time.monotonic() >= deadline_at:
+                    break
+                check_cancelled()
+                batch = order[start : start + SAMPLE_BATCH_SIZE]
+                results, _ = self._analyze_entries(
+                    [entries[i] for i in batch], self._line_analyzers, pool
+                )
+                for index, data in zip(batch, results, strict=True):
+                    if data is None:
+                        # Illisible : ignoré comme dans une collecte exacte
+                        estimator.add_sample(
+                            keys[index], dict.fromkeys(fields, 0), entries[index].size
+                        )
+                        continue
+                    values = (
+                        line_values(data["lines"], data["sloc"])
+                        if self.sloc
+                        else {"total_lines": data["lines"]}
+                    )
+                    estimator.add_sample(keys[index], values, entries[index].size)
+                    table.set_lines(rows[index], data["lines"])
+
+        complete = estimator.sampled == len(entries)
+        estimates = {field: estimator.estimate(field) for field in fields}
+        result: dict[str, Any] = {
+            "count": len(entries),
+            "core_files": len(entries) - len(tests),
+            "test_files": len(tests),
+            **{field: estimate["value"] for field, estimate in estimates.items()},
         }
+        if not complete:
+            result["estimates"] = {
+                field: {k: v for k, v in estimate.items() if k != "value"}
+                for field, estimate in estimates.items()
+            }
+        with self._lock, publishing():
+            self._sampling = {
+                "deadline_seconds": self.deadline,
+                "population_files": len(entries),
+                "sampled_files": estimator.sampled,
+                "strata": estimator.strata_count,
+                "confidence": CONFIDENCE,
+                "complete": complete,
+            }
+        if self.file_lists == "legacy":
+            result["files_list"] = table.paths(FLAG_PYTHON)
+        return result
+
+    def collect_directory_metrics(self) -> dict[str, Any]:
+        """
+        Cumuls par dossier (fichiers, lignes, tests, documentation).
+
+        Les compteurs sont tenus pendant le flux de collect_python_metrics ;
+        ils ne sont recalculés que si cette collecte n'a pas encore eu lieu
+        sur le parcours courant (ou qu'elle était échantillonnée).
+
+        Returns:
+            Arbre compact des dossiers jusqu'à directory_depth (voir
+            DirectoryRollup.to_tree)
+        """
+        with self._lock:
+            rollup = self._rollup
+        if rollup is None and self.deadline is None:
+            self.collect_python_metrics()
+            with self._lock:
+                rollup = self._rollup
+        if rollup is None:
+            # Collecte bornée : l'échantillon ne couvre pas tous les dossiers
+            rollup = DirectoryRollup(self.directory_depth)
+            for record in self.iter_files():
+                rollup.add(record)
+        return rollup.to_tree()
+
+    def _count_languages(self) -> dict[str, list[int]]:
+        """
+        Fichiers et lignes par langage, hors modules .py.
+
+        Les modules .py sont comptés par collect_python_metrics ; chacun des
+        autres fichiers n'est lu qu'une fois (les fichiers sans extension
+        sont d'abord ouverts pour leur seule ligne shebang).
+
+        Returns:
+            Langage -> [fichiers, lignes]
+        """
+        entries: list[WalkEntry] = []
+        languages: list[str] = []
+        candidates: list[WalkEntry] = []
+        for entry in self.scan_project().get("language"):
+            language = language_for_name(entry.name, entry.suffix)
+            if language is not None:
+                entries.append(entry)
+                languages.append(language)
+            elif not entry.suffix:
+                candidates.append(entry)
+        if candidates:
+            shebangs = self._analyze_files(candidates, ("shebang",))
+            for entry, data in zip(candidates, shebangs, strict=True):
+                if data is not None and data["shebang"] is not None:
+                    entries.append(entry)
+                    languages.append(data["shebang"])
+
+        counts: dict[str, list[int]] = {}
+        analyses = self._analyze_files(entries, ("lines",))
+        for language, data in zip(languages, analyses, strict=True):
+            if data is None:
+                continue
+            counters = counts.setdefault(language, [0, 0])
+            counters[0] += 1
+            counters[1] += data["lines"]
+        return counts
+
+    @staticmethod
+    def _language_metrics(
+        python_metrics: dict[str, Any], counts: dict[str, list[int]]
+    ) -> dict[str, dict[str, Any]]:
+        """Fusionne les modules .py et les autres langages (section languages)."""
+        merged = {language: list(c) for language, c in counts.items()}
+        python = merged.setdefault("Python", [0, 0])
+        python[0] += python_metrics["count"]
+        python[1] += python_metrics["total_lines"]
+        return language_table(merged)
+
+    def collect_language_metrics(self) -> dict[str, Any]:
+        """
+        Collecte les fichiers et lignes par langage.
+
+        Le langage vient de l'extension, du nom (Makefile, Dockerfile...) ou
+        de la ligne shebang des fichiers sans extension. Les lignes des
+        modules .py sont celles de collect_python_metrics.
+
+        Returns:
+            Langage -> {"files", "lines"}, par nombre de lignes décroissant
+        """
+        return self._language_metrics(
+            self.collect_python_metrics(), self._count_languages()
+        )
+
+    def collect_code_structure_metrics(self) -> dict[str, Any]:
+        """
+        Collecte les métriques de structure des fichiers Python.
 
-    def _is_test_file(self, path: Path) -> bool:
+        Chaque module est analysé une fois (ast) dans le pool d'analyse
+        (processus si jobs > 1) ; le résultat est mis en cache par fichier et
+        par contenu comme le comptage de lignes.
+
+        Returns:
+            Totaux de fonctions, classes et méthodes, complexité cyclomatique
+            (moyenne, p95, max, fonctions les plus complexes) et détail par
+            fichier
+        """
+        python_files = self.scan_project().get("python")
+        analyses = self._analyze_files(python_files, ("structure",))
+        return aggregate_structure(
+            {
+                entry.rel_path: data["structure"] if data is not None else None
+                for entry, data in zip(python_files, analyses, strict=True)
+            }
+        )
+
+    def _is_test_file(self, path: Path | WalkEntry) -> bool:
         """
         Détermine si un fichier est un fichier de test.
 
         Args:
-            path: Chemin du fichier
+            path: Chemin du fichier (ou entrée issue du parcours, dont les
+                composants sont relatifs à la racine du projet)
 
         Returns:
             True si c'est un fichier de test
@@ -168,32 +1202,61 @@ class MetricsCollector:
         Returns:
             Dictionnaire avec les métriques de tests
         """
-        test_files = []
-        test_directories = set()
+        return self._test_metrics(
+            self._count_tests(),
+            # Essayer de récupérer le coverage depuis coverage.xml
+            CoverageParser.get_coverage_for_project(self.project_root),
+        )
 
-        # Collecter les fichiers de test
-        for py_file in self.project_root.rglob("*.py"):
-            if not self._is_excluded(py_file) and self._is_test_file(py_file):
-                test_files.append(py_file)
-                test_directories.add(py_file.parent)
+    def _count_tests(self) -> int:
+        """
+        Compte les tests avec le moteur configuré.
 
-        # Essayer de collecter les tests avec pytest
-        collected_tests = self._collect_pytest_tests()
+        Returns:
+            Nombre de tests collectés
+        """
+        if self.test_counter == "pytest":
+            return self._collect_pytest_tests()
+        if self.test_counter == "pytest-pool":
+            return self._collect_pytest_pool()
+        return self._count_tests_statically()
+
+    def _test_metrics(
+        self,
+        collected_tests: int,
+        coverage_data: dict[str, Any] | None,
+        count_files: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Assemble les métriques de tests.
+
+        Args:
+            collected_tests: Nombre de tests collectés
+            coverage_data: Données de coverage.xml (None si absent)
+            count_files: False pour ne pas compter les fichiers de test
+                (parcours interrompu : comptes à zéro)
+
+        Returns:
+            Dictionnaire avec les métriques de tests
+        """
+        reducer = FileStreamReducer()
+        if count_files:
+            self.scan_project()
+            for record in self.iter_files(kinds=("test",), analyze=False):
+                reducer.add(record)
 
-        # Essayer de récupérer le coverage depuis coverage.xml
-        coverage_data = CoverageParser.get_coverage_for_project(self.project_root)
         coverage_percentage = None
         if coverage_data and coverage_data.get("coverage_percentage") is not None:
             coverage_percentage = coverage_data["coverage_percentage"]
 
-        result = {
-            "test_files_count": len(test_files),
-            "test_directories_count": len(test_directories),
+        result: dict[str, Any] = {
+            **reducer.test_files_metrics(),
             "collected_tests_count": collected_tests,
-            "test_files_list": [
-                str(f.relative_to(self.project_root)) for f in test_files
-            ],
         }
+        if self.file_lists == "legacy":
+            result["test_files_list"] = (
+                self.file_table().paths(FLAG_TEST) if count_files else []
+            )
 
         # Ajouter le coverage si disponible
         if coverage_percentage is not None:
@@ -207,45 +1270,172 @@ class MetricsCollector:
 
         return result
 
+    def _count_tests_statically(self) -> int:
+        """
+        Compte les tests par analyse syntaxique des modules de test.
+
+        Seuls les modules que pytest collecte par défaut (``test_*.py``,
+        ``*_test.py``) sont analysés, en parallèle et avec les caches actifs.
+
+        Returns:
+            Nombre de tests
+        """
+        modules = [f for f in self.scan_project().get("test") if is_test_module(f.name)]
+        analyses = self._analyze_files(modules, ("tests",))
+        return sum(data["tests"] for data in analyses if data is not None)
+
     def _collect_pytest_tests(self) -> int:
         """
-        Collecte le nombre de tests via pytest ou par comptage de fichiers.
+        Collecte le nombre de tests via pytest ou par analyse statique.
 
         Returns:
             Nombre de tests collectés
         """
         try:
-            # Changer vers le répertoire du projet
-            original_cwd = Path.cwd()
-            try:
-                import os
-
-                os.chdir(self.project_root)
-
-                # Utiliser pytest pour collecter les tests
-                result = subprocess.run(  # nosec B603
-                    [sys.executable, "-m", "pytest", "--collect-only", "-q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
+            # cwd= plutôt que os.chdir : le répertoire courant du processus
+            # est partagé par tous les threads. addopts vidé : un --verbose
+            # ou un -q du projet changerait le format de la sortie
+            result = run_command(
+                [
+                    self.test_python,
+                    "-m",
+                    "pytest",
+                    "--collect-only",
+                    "-q",
+                    "-o",
+                    "addopts=",
+                ],
+                name="pytest --collect-only",
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
 
-                if result.returncode == 0:
-                    # Compter les lignes qui contiennent "test"
-                    lines = result.stdout.split("\n")
-                    test_count = sum(1 for line in lines if "test" in line.lower())
-                    # Retourner le nombre de tests collectés par pytest
-                    return test_count
-                else:
-                    # En cas d'échec, compter les fichiers de test manuellement
-                    return self._count_test_files_manually()
-
-            finally:
-                os.chdir(original_cwd)
+            if result.returncode == 0:
+                count = parse_collected_count(result.stdout)
+                if count is not None:
+                    return count
+            # Échec (imports du projet...) ou sortie illisible : analyse statique
+            return self._count_tests_statically()
 
         except Exception:
-            # En cas d'erreur, compter les fichiers de test manuellement
-            return self._count_test_files_manually()
+            # En cas d'erreur, analyse statique
+            return self._count_tests_statically()
+
+    def _pytest_cache_keys(self, modules: list[WalkEntry]) -> list[str | None]:
+        """
+        Clés du cache de collecte pytest des modules de test.
+
+        Chaque clé combine le contenu du module, celui des conftest.py des
+        dossiers parents, la configuration pytest, l'interpréteur et la
+        version de la collecte (PYTEST_COLLECTION_VERSION).
+
+        Args:
+            modules: Modules de test
+
+        Returns:
+            Clés "pytest/<empreinte>" (None si le module est illisible)
+        """
+        context = hashlib.blake2b(
+            f"{PYTEST_COLLECTION_VERSION}:{self.test_python}".encode(),
+            digest_size=16,
+        )
+        for name in PYTEST_CONFIG_FILES:
+            config = self.project_root / name
+            if config.is_file():
+                context.update(f"{name}:{blake2b_digest(str(config))}".encode())
+
+        conftests: dict[str, str] = {}
+        for entry in self.scan_project().get("python"):
+            if entry.name == "conftest.py":
+                try:
+                    conftests[entry.rel_path.rpartition("/")[0]] = blake2b_digest(
+                        entry.path
+                    )
+                except OSError:
+                    continue
+
+        # Empreinte du contenu seul (ni blob Git ni index)
+        items: list[tuple[str, str | None, bool]] = [
+            (entry.path, None, False) for entry in modules
+        ]
+        with AnalysisPool(self.jobs) as pool:
+            digests = pool.map_batches(content_key_batch, items)
+
+        keys: list[str | None] = []
+        for entry, digest in zip(modules, digests, strict=True):
+            if digest is None:
+                keys.append(None)
+                continue
+            key = context.copy()
+            key.update(digest.encode())
+            # conftest.py de la racine jusqu'au dossier du module
+            parts = entry.rel_path.split("/")[:-1]
+            for depth in range(len(parts) + 1):
+                conftest = conftests.get("/".join(parts[:depth]))
+                if conftest is not None:
+                    key.update(conftest.encode())
+            keys.append(f"pytest/{key.hexdigest()}")
+        return keys
+
+    def _collect_pytest_pool(self) -> int:
+        """
+        Compte les tests avec des workers pytest persistants.
+
+        Seuls les modules de test absents du cache (contenu, conftest.py ou
+        configuration modifiés) sont recollectés. Les modules dont la
+        collecte échoue sont comptés par analyse statique.
+
+        Returns:
+            Nombre de tests collectés
+        """
+        modules = [f for f in self.scan_project().get("test") if is_test_module(f.name)]
+        if not modules:
+            return 0
+
+        try:
+            prepare_cache_dir(self.cache_dir)
+        except OSError as e:
+            logger.debug(f"Dossier de cache inaccessible ({self.cache_dir}): {e}")
+        store = ContentStore(self.cache_dir / PYTEST_CACHE_DIR)
+        keys = self._pytest_cache_keys(modules)
+
+        total = 0
+        missing: list[tuple[WalkEntry, str | None]] = []
+        for entry, key in zip(modules, keys, strict=True):
+            cached = store.get(key) if key else None
+            if cached is not None and "pytest_items" in cached:
+                total += cached["pytest_items"]
+                store.record(hits=1)
+            else:
+                missing.append((entry, key))
+
+        if not missing:
+            return total
+
+        store.record(misses=len(missing))
+        collected = shared_pool().collect(
+            self.test_python,
+            self.project_root,
+            [entry.rel_path for entry, _ in missing],
+            jobs=self.jobs,
+            weights=[entry.size for entry, _ in missing],
+        )
+        failed: list[WalkEntry] = []
+        for entry, key in missing:
+            count = collected.get(entry.rel_path) if collected is not None else None
+            if count is None:
+                failed.append(entry)
+                continue
+            total += count
+            if key is not None:
+                store.put(key, {"pytest_items": count})
+
+        if failed:
+            analyses = self._analyze_files(failed, ("tests",))
+            total += sum(data["tests"] for data in analyses if data is not None)
+        return total
 
     def _count_test_files_manually(self) -> int:
         """
@@ -254,16 +1444,10 @@ class MetricsCollector:
         Returns:
             Nombre de fichiers de test
         """
-        test_files = []
-
-        # Méthode optimale : rglob + nom contenant "test"
-        for test_file in self.project_root.rglob("*.py"):
-            if not self._is_excluded(test_file):
-                # Vérifier si le nom du fichier contient "test"
-                if "test" in test_file.name.lower():
-                    test_files.append(test_file)
-
-        return len(test_files)
+        # Réutilise le parcours partagé : nom contenant "test"
+        return sum(
+            1 for f in self.scan_project().get("python") if "test" in f.name.lower()
+        )
 
     def collect_documentation_metrics(self) -> dict[str, Any]:
         """
@@ -272,28 +1456,139 @@ class MetricsCollector:
         Returns:
             Dictionnaire avec les métriques de documentation
         """
-        doc_files = []
-        doc_extensions = {".md", ".rst", ".txt", ".html", ".pdf"}
+        self.scan_project()
+        reducer = FileStreamReducer()
+        size = 0
+        for record in self.iter_files(kinds=("documentation",), analyze=False):
+            reducer.add(record)
+            size += record.size
+        self._timings.add(reducer.counts["documentation"], size)
 
-        for doc_file in self.project_root.rglob("*"):
-            if not self._is_excluded(doc_file) and doc_file.suffix in doc_extensions:
-                doc_files.append(doc_file)
-
-        return {
-            "documentation_files": len(doc_files),
-            "documentation_list": [
-                str(f.relative_to(self.project_root)) for f in doc_files
-            ],
+        result: dict[str, Any] = {
+            "documentation_files": reducer.counts["documentation"]
         }
+        if self.file_lists == "legacy":
+            result["documentation_list"] = self.file_table().paths(FLAG_DOCUMENTATION)
+        return result
 
-    def collect_all_metrics(self) -> dict[str, Any]:
+    def collect_all_metrics(self, full: bool = False) -> dict[str, Any]:
         """
         Collecte toutes les métriques du projet.
 
+        Chaque appel repart d'un parcours neuf, partagé ensuite par toutes
+        les collectes de ce run. En mode incrémental, le parcours est
+        remplacé par l'instantané du run précédent corrigé du diff Git.
+
+        Args:
+            full: En mode incrémental, forcer une collecte complète
+
         Returns:
             Dictionnaire complet avec toutes les métriques
         """
-        collection_info = {
+        # Un seul run à la fois par instance (parcours et instantané partagés)
+        with self._run_lock:
+            return self._collect_all(full)
+
+    def _collection_phases(self) -> list[Phase]:
+        """
+        Phases de collect_all_metrics.
+
+        Le comptage des tests par pytest attend un sous-processus : il
+        démarre en premier et recouvre le parcours et l'analyse des
+        fichiers. Chaque phase a une valeur par défaut vide, retenue en cas
+        d'échec ou de dépassement de son délai.
+
+        Returns:
+            Phases de la collecte
+        """
+        timeouts = dict(self.phase_timeouts)
+        if self.deadline is not None:
+            # La phase python s'arrête d'elle-même à l'échéance
+            for name in PHASES:
+                if name != "python":
+                    timeouts.setdefault(name, self.deadline)
+        legacy = self.file_lists == "legacy"
+        phases = [
+            Phase(
+                "python",
+                self.collect_python_metrics,
+                kind="io",
+                timeout=timeouts.get("python"),
+                default={
+                    "count": 0,
+                    "core_files": 0,
+                    "test_files": 0,
+                    "total_lines": 0,
+                    **(dict.fromkeys(SLOC_FIELDS, 0) if self.sloc else {}),
+                    **({"files_list": []} if legacy else {}),
+                },
+            ),
+            Phase(
+                "tests",
+                self._count_tests,
+                kind="subprocess" if self.test_counter != "static" else "cpu",
+                timeout=timeouts.get("tests"),
+                default=0,
+            ),
+            Phase(
+                "coverage",
+                lambda: CoverageParser.get_coverage_for_project(self.project_root),
+                kind="io",
+                timeout=timeouts.get("coverage"),
+            ),
+            Phase(
+                "documentation",
+                self.collect_documentation_metrics,
+                kind="io",
+                timeout=timeouts.get("documentation"),
+                default={
+                    "documentation_files": 0,
+                    **({"documentation_list": []} if legacy else {}),
+                },
+            ),
+        ]
+        if self.languages:
+            phases.append(
+                Phase(
+                    "languages",
+                    self._count_languages,
+                    kind="io",
+                    timeout=timeouts.get("languages"),
+                    default={},
+                )
+            )
+        if self.code_structure:
+            phases.append(
+                Phase(
+                    "code_structure",
+                    self.collect_code_structure_metrics,
+                    kind="cpu",
+                    timeout=timeouts.get("code_structure"),
+                )
+            )
+        for phase in phases:
+            phase.func = self._timed(phase.name, phase.func)
+        return phases
+
+    def _timed(self, name: str, func: Callable[[], Any]) -> Callable[[], Any]:
+        """Mesure func comme une phase du run courant (collection_info.timings)."""
+        timings = self._timings
+
+        def run() -> Any:
+            with timings.phase(name):
+                return func()
+
+        return run
+
+    def _collect_all(self, full: bool) -> dict[str, Any]:
+        """Corps de collect_all_metrics, appelé sous le verrou de l'instance."""
+        self.refresh()
+        self._timings = TimingRecorder()
+        self._deadline_at = (
+            time.monotonic() + self.deadline if self.deadline is not None else None
+        )
+        incremental_info = self._prepare_incremental(full) if self.incremental else None
+        collection_info: dict[str, Any] = {
             "collector_version": __version__,
             "python_version": (
                 f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
@@ -301,14 +1596,64 @@ class MetricsCollector:
             "collection_date": datetime.now().isoformat(),
         }
 
-        python_metrics = self.collect_python_metrics()
-        test_metrics = self.collect_test_metrics()
-        doc_metrics = self.collect_documentation_metrics()
+        phases = run_phases(self._collection_phases(), self.concurrent_phases)
+        # Parcours interrompu par les délais des phases : pas de nouveau
+        # parcours ici, les sections qui en dépendent restent vides
+        with self._lock:
+            scan = self._scan
+        python_metrics = phases["python"].value
+        test_metrics = self._test_metrics(
+            phases["tests"].value,
+            phases["coverage"].value,
+            count_files=scan is not None,
+        )
+        doc_metrics = phases["documentation"].value
+        structure_phase = phases.get("code_structure")
+        collection_info["phases"] = {
+            name: result.to_dict() for name, result in phases.items()
+        }
+
+        if scan is not None:
+            collection_info["file_enumeration"] = {
+                "backend": scan.backend,
+                "duration_seconds": round(scan.duration_seconds, 4),
+                "files": scan.total_files,
+            }
+            self._timings.record(
+                "enumeration", scan.duration_seconds, files=scan.total_files
+            )
+            # Total : chaque fichier une fois, octets des fichiers classés
+            classified = {
+                entry.rel_path: entry.size
+                for entries in scan.categories.values()
+                for entry in entries
+            }
+            self._timings.add_input(scan.total_files, sum(classified.values()))
+        else:
+            collection_info["file_enumeration"] = {"backend": None, "complete": False}
+        if self.cache is not None:
+            if scan is not None:
+                # Les fichiers disparus depuis le dernier run sortent du cache
+                self.cache.prune(
+                    entry.rel_path
+                    for entries in scan.categories.values()
+                    for entry in entries
+                )
+            collection_info["cache"] = self.cache.stats()
+        else:
+            collection_info["cache"] = {"enabled": False}
+        if self.content_store is not None:
+            collection_info["content_store"] = self.content_store.stats()
+        if incremental_info is not None:
+            if scan is not None:
+                self._save_snapshot(incremental_info)
+            collection_info["incremental"] = incremental_info
 
         # Créer un résumé
         summary = {
             "total_python_files": python_metrics["count"],
             "lines_of_code": python_metrics["total_lines"],
+            **{field: python_metrics[field] for field in SLOC_FIELDS if self.sloc},
             "collected_tests": test_metrics["collected_tests_count"],
             "documentation_files": doc_metrics["documentation_files"],
         }
@@ -322,5 +1667,118 @@ class MetricsCollector:
             "documentation_metrics": doc_metrics,
             "summary": summary,
         }
+        if structure_phase is not None:
+            self.metrics_data["code_structure"] = structure_phase.value
+        languages_phase = phases.get("languages")
+        if languages_phase is not None:
+            self.metrics_data["languages"] = self._language_metrics(
+                python_metrics, languages_phase.value
+            )
+        # État publié par la phase python : ignoré si elle n'a pas abouti
+        python_ok = phases["python"].status == "ok"
+        if python_ok and self._rollup is not None:
+            self.metrics_data["directories"] = self._rollup.to_tree()
+        if python_ok and self._sampling is not None:
+            collection_info["sampling"] = self._sampling
+            if "estimates" in python_metrics:
+                summary["estimated_fields"] = [
+                    field for field in ESTIMATED_FIELDS if field in summary
+                ]
+                if languages_phase is not None:
+                    self.metrics_data["languages"]["Python"]["estimated"] = True
+        self._mark_incomplete(phases, scan is not None)
+        self._deadline_at = None
+        if self.file_lists == "compact" and scan is not None:
+            self.metrics_data["file_table"] = self.file_table().to_json()
+
+        # Le parcours d'abord : il précède les analyses (dans une phase)
+        timings = self._timings.to_dict()
+        phases_timings = timings["phases"]
+        if "enumeration" in phases_timings:
+            timings["phases"] = {
+                "enumeration": phases_timings.pop("enumeration"),
+                **phases_timings,
+            }
+        collection_info["timings"] = timings
 
         return self.metrics_data
+
+    def _mark_incomplete(self, phases: dict[str, PhaseResult], scanned: bool) -> None:
+        """
+        Signale les sections issues d'une phase en échec ou hors délai.
+
+        Leurs valeurs par défaut (zéros, sections vides) ne doivent pas
+        passer pour des mesures : chaque section concernée reçoit
+        ``incomplete: true`` (sauf languages, indexée par langage) et le
+        résumé liste les sections et champs concernés.
+
+        Args:
+            phases: Résultats des phases du run
+            scanned: False si le parcours a été interrompu (fichiers de test
+                non comptés)
+        """
+        failed = [name for name, result in phases.items() if result.status != "ok"]
+        sections = [section for name in failed for section in PHASE_OUTPUTS[name][0]]
+        if not scanned:
+            sections.append("test_metrics")
+        if not sections:
+            return
+        summary = self.metrics_data["summary"]
+        sections = [s for s in dict.fromkeys(sections) if s in self.metrics_data]
+        for section in sections:
+            value = self.metrics_data[section]
+            if isinstance(value, dict) and section != "languages":
+                value["incomplete"] = True
+        summary["incomplete_sections"] = sections
+        summary["incomplete_fields"] = [
+            field
+            for name in failed
+            for field in PHASE_OUTPUTS[name][1]
+            if field in summary
+        ]
+
+
+def collect_many(
+    project_roots: Iterable[str | Path],
+    max_workers: int | None = None,
+    full: bool = False,
+    **collector_options: Any,
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Collecte plusieurs projets en parallèle dans un même processus.
+
+    Chaque projet a son propre MetricsCollector, exécuté dans un thread ; les
+    collecteurs ne modifient pas le répertoire courant et les sous-processus
+    (git, pytest) reçoivent la racine de leur projet en cwd.
+
+    Args:
+        project_roots: Racines des projets à collecter
+        max_workers: Nombre de projets collectés simultanément (défaut: un
+            par CPU, dans la limite du nombre de projets)
+        full: En mode incrémental, forcer des collectes complètes
+        **collector_options: Options passées à chaque MetricsCollector
+            (config_file, cache, content_store, test_counter...)
+
+    Returns:
+        Métriques par racine résolue, dans l'ordre d'entrée (None pour les
+        projets dont la collecte a échoué)
+    """
+    roots = list(dict.fromkeys(str(Path(root).resolve()) for root in project_roots))
+    if not roots:
+        return {}
+    store = collector_options.get("content_store")
+    if store is not None and not isinstance(store, ContentStore):
+        # Un seul stockage (et ses compteurs) pour tous les projets
+        collector_options["content_store"] = ContentStore(store)
+
+    def collect(root: str) -> dict[str, Any] | None:
+        try:
+            collector = MetricsCollector(root, **collector_options)
+            return collector.collect_all_metrics(full=full)
+        except Exception as e:
+            logger.warning(f"Collecte impossible pour {root}: {e}")
+            return None
+
+    workers = max_workers or min(len(roots), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(roots, executor.map(collect, roots), strict=True))
@@ -15,6 +15,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ..instrumentation.timings import TimingRecorder
+from ..instrumentation.tracing import span
+from .content_store import ContentStore
 from .git_contributions import GitContributions
 from .github_collector import GitHubCollector
 from .metrics_collector import MetricsCollector
@@ -35,7 +38,10 @@ class MultiProjectAggregator:
     """
 
     def __init__(
-        self, enable_history: bool = True, enable_github: bool = False
+        self,
+        enable_history: bool = True,
+        enable_github: bool = False,
+        content_store: ContentStore | str | Path | None = None,
     ) -> None:
         """
         Initialise l'agrégateur multi-projets.
@@ -43,16 +49,24 @@ class MultiProjectAggregator:
         Args:
             enable_history: Activer la sauvegarde de l'historique
             enable_github: Activer la collecte GitHub API
+            content_store: Stockage adressé par contenu (ou son dossier)
+                partagé par tous les projets collectés
         """
+        if content_store is not None and not isinstance(content_store, ContentStore):
+            content_store = ContentStore(content_store)
+        self.content_store: ContentStore | None = content_store
         self.projects_metrics: dict[str, Any] = {}
         self.history = MetricsHistory() if enable_history else None
         self.github_collector = GitHubCollector() if enable_github else None
+        # Mesures cumulées des collectes (metrics, github, git_contributions)
+        self.timings = TimingRecorder()
 
     def collect_project(
         self,
         project_name: str,
         project_path: str | Path,
         github_url: str | None = None,
+        config_file: str | Path | None = None,
     ) -> dict[str, Any] | None:
         """
         Collecte les métriques d'un projet.
@@ -61,50 +75,70 @@ class MultiProjectAggregator:
             project_name: Nom du projet
             project_path: Chemin vers le projet
             github_url: URL GitHub du projet (format: owner/repo)
+            config_file: Configuration spécifique au projet (ex:
+                config/project_configs/athalia.yaml)
 
         Returns:
             Métriques du projet ou None en cas d'erreur
         """
-        try:
-            collector = MetricsCollector(str(project_path))
-            metrics = collector.collect_all_metrics()
-
-            # Collecter les métriques GitHub si activé
-            github_metrics = None
-            if self.github_collector and github_url:
-                try:
-                    owner, repo = github_url.split("/")
-                    github_metrics = self.github_collector.collect_repo_metrics(
-                        owner, repo
+        with span(project_name, "project"):
+            try:
+                with self.timings.phase("metrics"):
+                    collector = MetricsCollector(
+                        str(project_path),
+                        config_file=config_file,
+                        content_store=self.content_store,
                     )
+                    metrics = collector.collect_all_metrics()
+                    self._add_timings(metrics)
+
+                # Collecter les métriques GitHub si activé
+                github_metrics = None
+                if self.github_collector and github_url:
+                    try:
+                        owner, repo = github_url.split("/")
+                        with self.timings.phase("github"):
+                            github_metrics = self.github_collector.collect_repo_metrics(
+                                owner, repo
+                            )
+                            self._add_timings(github_metrics)
+                    except Exception as e:
+                        logger.debug(f"Erreur collecte GitHub pour {project_name}: {e}")
+
+                # Collecter les statistiques Git
+                git_contributions = None
+                try:
+                    with self.timings.phase("git_contributions"):
+                        git_collector = GitContributions(project_path)
+                        git_contributions = git_collector.collect_contributions(days=30)
+                        self._add_timings(git_contributions)
                 except Exception as e:
-                    logger.debug(f"Erreur collecte GitHub pour {project_name}: {e}")
+                    logger.debug(f"Erreur collecte Git pour {project_name}: {e}")
 
-            # Collecter les statistiques Git
-            git_contributions = None
-            try:
-                git_collector = GitContributions(project_path)
-                git_contributions = git_collector.collect_contributions(days=30)
-            except Exception as e:
-                logger.debug(f"Erreur collecte Git pour {project_name}: {e}")
-
-            project_data: dict[str, Any] = {
-                "name": project_name,
-                "path": str(project_path),
-                "metrics": metrics,
-                "collection_date": datetime.now().isoformat(),
-            }
+                project_data: dict[str, Any] = {
+                    "name": project_name,
+                    "path": str(project_path),
+                    "metrics": metrics,
+                    "collection_date": datetime.now().isoformat(),
+                }
 
-            if github_metrics:
-                project_data["github_metrics"] = github_metrics
+                if github_metrics:
+                    project_data["github_metrics"] = github_metrics
 
-            if git_contributions:
-                project_data["git_contributions"] = git_contributions
+                if git_contributions:
+                    project_data["git_contributions"] = git_contributions
 
-            self.projects_metrics[project_name] = project_data
-            return metrics
-        except Exception:
-            return None
+                self.projects_metrics[project_name] = project_data
+                return metrics
+            except Exception:
+                return None
+
+    def _add_timings(self, data: dict[str, Any] | None) -> None:
+        """Compte les fichiers et octets uniques d'une collecte (total et phase)."""
+        timings = (data or {}).get("collection_info", {}).get("timings")
+        if timings:
+            total = timings["total"]
+            self.timings.add_input(total["files"], total["bytes"])
 
     def load_from_json(self, json_file: str | Path) -> bool:
         """
@@ -201,6 +235,7 @@ class MultiProjectAggregator:
             },
             "projects": projects_summary,
             "collection_date": datetime.now().isoformat(),
+            "collection_info": {"timings": self.timings.to_dict()},
         }
 
         # Ajouter les métriques GitHub agrégées si disponibles
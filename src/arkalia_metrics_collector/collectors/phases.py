@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Exécution concurrente des phases d'une collecte.
+
+Une collecte enchaîne des phases indépendantes (lignes Python, comptage des
+tests, coverage, documentation) dont certaines attendent surtout un
+sous-processus (``pytest --collect-only``, workers pytest). Le planificateur
+les lance dans des threads, les phases à sous-processus en premier, pour que
+cette attente recouvre l'analyse des fichiers.
+
+Chaque phase a son propre délai : une phase en échec ou hors délai reçoit sa
+valeur par défaut sans invalider les résultats des autres. Une phase hors
+délai est annulée : elle s'arrête au prochain point d'arrêt coopératif
+(check_cancelled, appelé par le parcours et les boucles d'analyse) et ne
+publie plus rien dans l'état partagé (publishing). Les phases tournent dans
+des threads démons : une phase bloquée (sous-processus) ne retient pas la
+fin du processus.
+
+Pendant un profilage (option --profile), les phases s'exécutent en séquence
+dans le thread appelant, seul suivi par cProfile et tracemalloc.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from arkalia_metrics_collector.instrumentation.profiling import profiling_active
+
+logger = logging.getLogger(__name__)
+
+# Types de phases, dans leur ordre de démarrage
+PHASE_KINDS = ("subprocess", "io", "cpu")
+
+
+@dataclass
+class Phase:
+    """
+    Phase d'une collecte.
+
+    Attributes:
+        name: Nom de la phase
+        func: Calcul de la phase (sans argument)
+        kind: "subprocess" (attente d'un autre processus), "io" ou "cpu"
+        timeout: Délai maximal en secondes (None : sans limite)
+        default: Valeur retenue si la phase échoue ou dépasse son délai
+    """
+
+    name: str
+    func: Callable[[], Any]
+    kind: str = "cpu"
+    timeout: float | None = None
+    default: Any = None
+
+
+@dataclass
+class PhaseResult:
+    """
+    Résultat d'une phase.
+
+    Attributes:
+        name: Nom de la phase
+        status: "ok", "failed" ou "timeout"
+        value: Valeur calculée (ou valeur par défaut de la phase)
+        duration_seconds: Durée de la phase (délai écoulé si hors délai)
+        error: Message d'erreur éventuel
+    """
+
+    name: str
+    status: str
+    value: Any
+    duration_seconds: float
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Résumé sérialisable (sans la valeur)."""
+        info: dict[str, Any] = {
+            "status": self.status,
+            "duration_seconds": round(self.duration_seconds, 4),
+        }
+        if self.error is not None:
+            info["error"] = self.error
+        return info
+
+
+class PhaseCancelled(BaseException):
+    """
+    Levée dans une phase hors délai à son prochain point d'arrêt.
+
+    Dérive de BaseException pour traverser les ``except Exception`` des
+    analyses (comme asyncio.CancelledError).
+    """
+
+
+class _PhaseToken:
+    """État d'annulation d'une phase concurrente."""
+
+    __slots__ = ("cancelled", "lock")
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        # Sérialise l'annulation et les publications de la phase
+        self.lock = threading.Lock()
+
+
+# Jeton de la phase exécutée par le thread courant (absent hors phase)
+_current = threading.local()
+
+
+def check_cancelled() -> None:
+    """
+    Point d'arrêt coopératif des phases.
+
+    Sans effet hors d'une phase concurrente (appel direct, mode séquentiel,
+    workers d'un pool d'analyse).
+
+    Raises:
+        PhaseCancelled: Si la phase du thread courant est hors délai
+    """
+    token = getattr(_current, "token", None)
+    if token is not None and token.cancelled:
+        raise PhaseCancelled("phase annulée (délai dépassé)")
+
+
+@contextmanager
+def publishing() -> Iterator[None]:
+    """
+    Encadre l'écriture de résultats dans l'état partagé d'un collecteur.
+
+    L'annulation d'une phase attend la fin d'une publication en cours ;
+    une phase déjà annulée ne publie plus rien.
+
+    Raises:
+        PhaseCancelled: Si la phase du thread courant est hors délai
+    """
+    token = getattr(_current, "token", None)
+    if token is None:
+        yield
+        return
+    with token.lock:
+        if token.cancelled:
+            raise PhaseCancelled("phase annulée (délai dépassé)")
+        yield
+
+
+def _timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    """Exécute func et mesure sa durée."""
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+class _PhaseThread(threading.Thread):
+    """Thread démon exécutant une phase concurrente."""
+
+    def __init__(self, phase: Phase) -> None:
+        super().__init__(name=f"arkalia-phase-{phase.name}", daemon=True)
+        self.phase = phase
+        self.token = _PhaseToken()
+        self.outcome: tuple[Any, float] | None = None
+        self.error: Exception | None = None
+
+    def run(self) -> None:
+        _current.token = self.token
+        try:
+            self.outcome = _timed(self.phase.func)
+        except PhaseCancelled:
+            logger.debug(f"Phase {self.phase.name} interrompue après son délai")
+        except Exception as e:
+            self.error = e
+
+    def cancel(self) -> None:
+        """Annule la phase (après une éventuelle publication en cours)."""
+        with self.token.lock:
+            self.token.cancelled = True
+
+
+def run_phases(
+    phases: Sequence[Phase], concurrent: bool = True
+) -> dict[str, PhaseResult]:
+    """
+    Exécute des phases, concurremment par défaut.
+
+    Les phases démarrent dans l'ordre de PHASE_KINDS (sous-processus, E/S
+    puis CPU). Le délai d'une phase court à partir du lancement de la
+    collecte ; une phase hors délai est annulée et son résultat ignoré.
+
+    Args:
+        phases: Phases à exécuter (noms uniques)
+        concurrent: False pour tout exécuter dans le thread appelant (les
+            délais ne sont alors pas appliqués) ; forcé pendant un profilage
+
+    Returns:
+        Résultat par nom de phase, dans l'ordre de phases
+    """
+    ordered = sorted(
+        phases,
+        key=lambda p: PHASE_KINDS.index(p.kind) if p.kind in PHASE_KINDS else 99,
+    )
+    results: dict[str, PhaseResult] = {}
+
+    if not concurrent or len(ordered) < 2 or profiling_active():
+        for phase in ordered:
+            start = time.perf_counter()
+            try:
+                value, duration = _timed(phase.func)
+                results[phase.name] = PhaseResult(phase.name, "ok", value, duration)
+            except Exception as e:
+                logger.warning(f"Phase {phase.name} en échec: {e}")
+                results[phase.name] = PhaseResult(
+                    phase.name,
+                    "failed",
+                    phase.default,
+                    time.perf_counter() - start,
+                    str(e),
+                )
+        return {phase.name: results[phase.name] for phase in phases}
+
+    start = time.perf_counter()
+    threads = [_PhaseThread(phase) for phase in ordered]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        phase = thread.phase
+        remaining = None
+        if phase.timeout is not None:
+            remaining = max(0.0, start + phase.timeout - time.perf_counter())
+        thread.join(remaining)
+        if thread.is_alive():
+            thread.cancel()
+            logger.warning(
+                f"Phase {phase.name} hors délai ({phase.timeout}s), "
+                "résultat par défaut retenu"
+            )
+            results[phase.name] = PhaseResult(
+                phase.name,
+                "timeout",
+                phase.default,
+                time.perf_counter() - start,
+                f"délai de {phase.timeout}s dépassé",
+            )
+        elif thread.outcome is not None:
+            value, duration = thread.outcome
+            results[phase.name] = PhaseResult(phase.name, "ok", value, duration)
+        else:
+            logger.warning(f"Phase {phase.name} en échec: {thread.error}")
+            results[phase.name] = PhaseResult(
+                phase.name,
+                "failed",
+                phase.default,
+                time.perf_counter() - start,
+                str(thread.error),
+            )
+    return {phase.name: results[phase.name] for phase in phases}
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Pool persistant de workers de collecte pytest.
+
+Quand le comptage exact de pytest est nécessaire (tests générés par des
+fixtures ou des plugins), lancer un interpréteur par projet coûte plusieurs
+secondes de démarrage à chaque fois. Les workers de ce module restent
+vivants entre les collectes : chacun tourne dans l'interpréteur du projet
+(virtualenv détecté automatiquement) et exécute
+``pytest.main(["--collect-only", ...])`` avec un petit plugin qui renvoie le
+nombre exact d'items par fichier.
+
+Le worker est autonome (il n'importe pas arkalia_metrics_collector, absent
+de l'environnement du projet) et dialogue en JSON ligne par ligne sur
+stdin/stdout.
+"""
+
+import atexit
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any
+
+from arkalia_metrics_collector.collectors.analysis_pool import make_batches
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+from arkalia_metrics_collector.instrumentation.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Dossiers de virtualenv recherchés à la racine du projet
+VENV_DIRS = (".venv", "venv", "env", ".env")
+
+# Sous-dossier du cache contenant les comptes pytest par fichier
+PYTEST_CACHE_DIR = "pytest_collection"
+
+# Fichiers de configuration de pytest pris en compte dans les clés du cache
+PYTEST_CONFIG_FILES = ("pytest.ini", "pyproject.toml", "tox.ini", "setup.cfg")
+
+# Délai maximal d'une collecte par worker (secondes)
+DEFAULT_TIMEOUT = 60.0
+
+# Codes de sortie de pytest d'une collecte aboutie (5 : aucun test)
+_COLLECT_OK_CODES = (0, 5)
+
+# Version des comptes mis en cache (à incrémenter quand la collecte change ;
+# 2 : comptes nuls des collectes en erreur d'usage écartés)
+PYTEST_COLLECTION_VERSION = 2
+
+WORKER_SOURCE = r"""
+import json
+import os
+import sys
+
+# Le protocole utilise une copie de stdout ; tout ce que pytest écrit sur
+# stdout part sur stderr
+_proto = os.fdopen(os.dup(1), "w", encoding="utf-8")
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+_base_path = list(sys.path)
+_roots = set()
+
+
+class _ItemCounter:
+    def __init__(self):
+        self.counts = {}
+        self.errors = set()
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.errors.add(report.nodeid.split("::")[0])
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            path = item.nodeid.split("::")[0]
+            self.counts[path] = self.counts.get(path, 0) + 1
+
+
+def _forget_modules(roots):
+    # Oublie les modules du projet pour relire les fichiers modifiés
+    prefixes = tuple(os.path.join(root, "") for root in roots)
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if path.startswith(prefixes):
+            del sys.modules[name]
+
+
+def _collect(request):
+    if pytest is None:
+        return {"error": "pytest indisponible"}
+    root = request["root"]
+    _roots.add(root)
+    _forget_modules(_roots)
+    sys.path[:] = _base_path
+    os.chdir(root)
+    counter = _ItemCounter()
+    # Pas de -p no:cacheprovider : un --cache-clear dans les addopts du
+    # projet en ferait une erreur d'usage (code 4)
+    args = ["--collect-only", "-q", "--rootdir", root]
+    code = pytest.main(args + list(request["files"]), plugins=[counter])
+    return {
+        "counts": counter.counts,
+        "errors": sorted(counter.errors),
+        "code": int(code),
+    }
+
+
+for line in sys.stdin:
+    try:
+        reply = _collect(json.loads(line))
+    except BaseException as e:
+        reply = {"error": repr(e)}
+    _proto.write(json.dumps(reply) + "\n")
+    _proto.flush()
+"""
+
+
+def detect_project_python(project_root: str | Path) -> str:
+    """
+    Détecte l'interpréteur du projet.
+
+    Args:
+        project_root: Racine du projet
+
+    Returns:
+        Python du premier virtualenv trouvé à la racine (.venv, venv...),
+        sinon l'interpréteur courant
+    """
+    root = Path(project_root)
+    for name in VENV_DIRS:
+        for candidate in (
+            root / name / "bin" / "python",
+            root / name / "Scripts" / "python.exe",
+        ):
+            if candidate.is_file() and os.access(candidate, os.X_OK):
+                return str(candidate)
+    return sys.executable
+
+
+class PytestWorker:
+    """
+    Processus persistant exécutant des collectes pytest.
+
+    Le hook on_subprocess est émis une fois, à l'arrêt du worker, avec la
+    durée de vie du processus (ou au lancement s'il échoue).
+
+    Attributes:
+        python: Interpréteur du worker
+    """
+
+    def __init__(self, python: str) -> None:
+        """
+        Démarre le worker.
+
+        Args:
+            python: Interpréteur à utiliser
+
+        Raises:
+            OSError: Si l'interpréteur ne peut pas être lancé
+        """
+        self.python = python
+        self._lock = threading.Lock()
+        self._command = [python, "-c", WORKER_SOURCE]
+        self._start = time.perf_counter()
+        self._reported = False
+        try:
+            self._proc = subprocess.Popen(  # nosec B603
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        except OSError:
+            self._report(None)
+            raise
+
+    def _report(self, returncode: int | None) -> None:
+        """Émet on_subprocess pour la durée de vie du worker (une seule fois)."""
+        if self._reported:
+            return
+        self._reported = True
+        if hooks.on_subprocess:
+            hooks.emit(
+                "on_subprocess",
+                command=list(self._command),
+                returncode=returncode,
+                seconds=time.perf_counter() - self._start,
+            )
+
+    @property
+    def alive(self) -> bool:
+        """Indique si le processus tourne encore."""
+        return self._proc.poll() is None
+
+    def collect(self, root: str, files: list[str]) -> dict[str, Any]:
+        """
+        Collecte des fichiers de test (appel bloquant).
+
+        Args:
+            root: Racine du projet (rootdir de pytest)
+            files: Chemins relatifs des modules de test
+
+        Returns:
+            Réponse du worker (counts/errors ou error)
+        """
+        with self._lock, span("pytest worker", "subprocess", files=len(files)):
+            if self._proc.stdin is None or self._proc.stdout is None:
+                return {"error": "worker arrêté"}
+            try:
+                self._proc.stdin.write(json.dumps({"root": root, "files": files}))
+                self._proc.stdin.write("\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (OSError, ValueError) as e:
+                return {"error": str(e)}
+        if not line:
+            return {"error": "worker interrompu"}
+        try:
+            reply: dict[str, Any] = json.loads(line)
+        except ValueError as e:
+            return {"error": f"réponse invalide: {e}"}
+        return reply
+
+    def close(self) -> None:
+        """Arrête le worker."""
+        if self.alive:
+            self._proc.kill()
+        self._report(self._proc.wait())
+        # Un appel bloqué sur la lecture la termine lui-même (fin de flux)
+        if self._lock.acquire(blocking=False):
+            try:
+                for stream in (self._proc.stdin, self._proc.stdout):
+                    if stream is not None:
+                        stream.close()
+            finally:
+                self._lock.release()
+
+
+class PytestWorkerPool:
+    """
+    Workers pytest persistants, regroupés par interpréteur.
+
+    Un même worker sert successivement plusieurs projets utilisant le même
+    interpréteur : seul le premier appel paie le démarrage de Python et
+    l'import de pytest.
+    """
+
+    def __init__(self) -> None:
+        self._workers: dict[str, list[PytestWorker]] = {}
+        self._lock = threading.Lock()
+
+    def _get_workers(self, python: str, count: int) -> list[PytestWorker]:
+        """Retourne count workers vivants pour un interpréteur."""
+        with self._lock:
+            workers = [w for w in self._workers.get(python, []) if w.alive]
+            while len(workers) < count:
+                workers.append(PytestWorker(python))
+            self._workers[python] = workers
+            return workers[:count]
+
+    def collect(
+        self,
+        python: str,
+        root: str | Path,
+        files: list[str],
+        jobs: int = 1,
+        weights: list[int] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> dict[str, int | None] | None:
+        """
+        Compte les items pytest de chaque fichier.
+
+        Args:
+            python: Interpréteur du projet
+            root: Racine du projet
+            files: Chemins relatifs des modules de test
+            jobs: Nombre de workers utilisés en parallèle
+            weights: Poids des fichiers pour équilibrer les lots
+            timeout: Délai maximal par lot (le worker est arrêté au-delà)
+
+        Returns:
+            Nombre d'items par fichier (None si sa collecte a échoué, ou si
+            le lot a échoué sans produire d'item pour ce fichier), ou None
+            si pytest est inutilisable dans cet interpréteur
+        """
+        if not files:
+            return {}
+        try:
+            batches = make_batches(weights or [1] * len(files), jobs)
+            workers = self._get_workers(python, len(batches))
+        except OSError as e:
+            logger.debug(f"Impossible de lancer {python}: {e}")
+            return None
+
+        root_str = str(Path(root).resolve())
+        results: dict[str, int | None] = {}
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            futures = [
+                (
+                    batch,
+                    worker,
+                    executor.submit(
+                        worker.collect, root_str, [files[i] for i in batch]
+                    ),
+                )
+                for batch, worker in zip(batches, workers, strict=True)
+            ]
+            for batch, worker, future in futures:
+                try:
+                    reply = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    # Débloque la lecture en cours ; le worker sera remplacé
+                    worker.close()
+                    reply = future.result()
+                if "error" in reply:
+                    logger.debug(f"Collecte pytest impossible: {reply['error']}")
+                    if reply["error"] == "pytest indisponible":
+                        return None
+                    reply = {"counts": {}, "errors": [files[i] for i in batch]}
+                errors = set(reply.get("errors", []))
+                counts = reply.get("counts", {})
+                # Erreur d'usage, interruption... : un fichier sans item n'est
+                # pas un fichier sans test
+                run_failed = reply.get("code") not in _COLLECT_OK_CODES
+                if run_failed:
+                    logger.debug(f"Collecte pytest en échec (code {reply.get('code')})")
+                for i in batch:
+                    path = files[i]
+                    if path in errors or (run_failed and path not in counts):
+                        results[path] = None
+                    else:
+                        results[path] = counts.get(path, 0)
+        return results
+
+    def close(self) -> None:
+        """Arrête tous les workers."""
+        with self._lock:
+            for workers in self._workers.values():
+                for worker in workers:
+                    worker.close()
+            self._workers.clear()
+
+
+_shared_pool: PytestWorkerPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> PytestWorkerPool:
+    """
+    Pool partagé par tous les collecteurs du processus.
+
+    Returns:
+        Pool créé au premier appel et arrêté à la sortie du processus
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = PytestWorkerPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Estimation des totaux de lignes par échantillonnage stratifié.
+
+Pour une collecte bornée dans le temps, les fichiers sont répartis en
+strates (dossier de premier niveau × classe de taille) puis analysés dans un
+ordre aléatoire qui couvre d'abord chaque strate une fois, puis garde des
+taux de sondage proportionnels : à tout instant, l'échantillon déjà analysé
+est un échantillon stratifié exploitable.
+
+Les totaux sont extrapolés par l'estimateur stratifié classique
+(N_h × moyenne_h par strate) avec un intervalle de confiance normal et
+correction de population finie.
+"""
+
+import math
+import random
+from typing import Any
+
+# Niveau de confiance des intervalles et quantile normal associé
+CONFIDENCE = 0.95
+_Z_95 = 1.959963984540054
+
+
+def size_bucket(size: int) -> int:
+    """
+    Classe de taille d'un fichier (facteur 4 entre deux classes).
+
+    Args:
+        size: Taille en octets
+
+    Returns:
+        0 pour un fichier vide, puis 1 (1-3 octets), 2 (4-15)...
+    """
+    return (size.bit_length() + 1) // 2
+
+
+def stratum_key(rel_path: str, size: int) -> tuple[str, int]:
+    """
+    Strate d'un fichier : dossier de premier niveau et classe de taille.
+
+    Args:
+        rel_path: Chemin relatif (séparateurs POSIX)
+        size: Taille en octets
+
+    Returns:
+        Clé de strate ("" pour les fichiers à la racine)
+    """
+    top, sep, _ = rel_path.partition("/")
+    return (top if sep else "", size_bucket(size))
+
+
+def sample_order(strata: dict[Any, list[int]], rng: random.Random) -> list[int]:
+    """
+    Ordre d'analyse des fichiers pour un sondage interruptible.
+
+    Un fichier de chaque strate d'abord (strates dans un ordre aléatoire),
+    puis les autres par taux de sondage croissant : le k-ième fichier d'une
+    strate de N fichiers passe à la position (k + u) / N, u aléatoire.
+
+    Args:
+        strata: Indices des fichiers par strate
+        rng: Générateur aléatoire (graine fixe pour un ordre reproductible)
+
+    Returns:
+        Tous les indices, dans l'ordre d'analyse
+    """
+    first: list[int] = []
+    rest: list[tuple[float, int]] = []
+    for members in strata.values():
+        shuffled = list(members)
+        rng.shuffle(shuffled)
+        first.append(shuffled[0])
+        size = len(shuffled)
+        rest.extend(
+            ((k + rng.random()) / size, index)
+            for k, index in enumerate(shuffled[1:], 1)
+        )
+    rng.shuffle(first)
+    rest.sort()
+    return first + [index for _, index in rest]
+
+
+class _Stratum:
+    """Cumuls d'une strate (population et échantillon)."""
+
+    __slots__ = ("population", "bytes", "sampled", "sampled_bytes", "sums", "squares")
+
+    def __init__(self, fields: tuple[str, ...]) -> None:
+        self.population = 0
+        self.bytes = 0
+        self.sampled = 0
+        self.sampled_bytes = 0
+        self.sums = dict.fromkeys(fields, 0)
+        self.squares = dict.fromkeys(fields, 0)
+
+
+class StratifiedEstimator:
+    """
+    Estimateur stratifié de totaux.
+
+    Attributes:
+        fields: Champs estimés (ex: total_lines)
+    """
+
+    def __init__(self, fields: tuple[str, ...]) -> None:
+        """
+        Initialise un estimateur vide.
+
+        Args:
+            fields: Champs à estimer
+        """
+        self.fields = fields
+        self._strata: dict[Any, _Stratum] = {}
+
+    def _stratum(self, key: Any) -> _Stratum:
+        stratum = self._strata.get(key)
+        if stratum is None:
+            stratum = self._strata[key] = _Stratum(self.fields)
+        return stratum
+
+    def add_population(self, key: Any, size: int) -> None:
+        """
+        Déclare un fichier de la population.
+
+        Args:
+            key: Strate du fichier
+            size: Taille en octets
+        """
+        stratum = self._stratum(key)
+        stratum.population += 1
+        stratum.bytes += size
+
+    def add_sample(self, key: Any, values: dict[str, int], size: int) -> None:
+        """
+        Ajoute un fichier analysé.
+
+        Args:
+            key: Strate du fichier (déjà déclarée dans la population)
+            values: Valeur de chaque champ pour ce fichier
+            size: Taille en octets
+        """
+        stratum = self._stratum(key)
+        stratum.sampled += 1
+        stratum.sampled_bytes += size
+        for field in self.fields:
+            value = values[field]
+            stratum.sums[field] += value
+            stratum.squares[field] += value * value
+
+    @property
+    def population(self) -> int:
+        """Nombre de fichiers de la population."""
+        return sum(s.population for s in self._strata.values())
+
+    @property
+    def sampled(self) -> int:
+        """Nombre de fichiers analysés."""
+        return sum(s.sampled for s in self._strata.values())
+
+    @property
+    def strata_count(self) -> int:
+        """Nombre de strates."""
+        return len(self._strata)
+
+    def estimate(self, field: str) -> dict[str, Any]:
+        """
+        Estime le total d'un champ.
+
+        Une strate non échantillonnée est extrapolée au prorata de ses
+        octets (valeur par octet de l'échantillon), avec la variance
+        globale de l'échantillon. L'écart type d'une strate d'un seul
+        fichier analysé est également pris dans l'échantillon global.
+
+        Args:
+            field: Champ à estimer
+
+        Returns:
+            value, low, high (intervalle à CONFIDENCE, borné par le total
+            observé) et stderr
+        """
+        sampled = 0
+        sum_values = 0
+        sum_squares = 0
+        sampled_bytes = 0
+        for stratum in self._strata.values():
+            if stratum.sampled:
+                sampled += stratum.sampled
+                sum_values += stratum.sums[field]
+                sum_squares += stratum.squares[field]
+                sampled_bytes += stratum.sampled_bytes
+        pooled_variance = (
+            (sum_squares - sum_values * sum_values / sampled) / (sampled - 1)
+            if sampled > 1
+            else 0.0
+        )
+        per_byte = sum_values / sampled_bytes if sampled_bytes else 0.0
+
+        total = 0.0
+        variance = 0.0
+        for stratum in self._strata.values():
+            n, big_n = stratum.sampled, stratum.population
+            if n == 0:
+                total += per_byte * stratum.bytes
+                variance += big_n * big_n * pooled_variance
+                continue
+            mean = stratum.sums[field] / n
+            total += big_n * mean
+            if n >= big_n:
+                continue
+            if n > 1:
+                s2 = (stratum.squares[field] - n * mean * mean) / (n - 1)
+            else:
+                s2 = pooled_variance
+            variance += big_n * big_n * (1 - n / big_n) * max(s2, 0.0) / n
+
+        stderr = math.sqrt(variance)
+        low = max(float(sum_values), total - _Z_95 * stderr)
+        return {
+            "value": round(total),
+            "low": round(low),
+            "high": round(max(total + _Z_95 * stderr, low)),
+            "stderr": round(stderr, 2),
+        }
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Répartition des lignes d'un module Python (code, commentaires, docstrings).
+
+Le module est lu une seule fois par ``tokenize`` en flux : chaque ligne
+physique est classée dès la fin de son instruction logique, sans conserver
+la liste des tokens. Une ligne contenant du code compte comme code, même si
+elle porte aussi un commentaire ; les lignes d'une chaîne multiligne
+ordinaire comptent comme code.
+
+Les docstrings sont les chaînes seules en première instruction du module,
+d'une classe ou d'une fonction.
+"""
+
+import os
+import tokenize
+from collections.abc import Callable
+from typing import Any
+
+# Catégories, par priorité croissante sur une même ligne
+_BLANK, _COMMENT, _DOCSTRING, _CODE = range(4)
+
+# Premier mot d'une instruction ouvrant un bloc documentable
+_DOCUMENTED_BLOCKS = frozenset({"module", "def", "class", "async"})
+
+
+class _LineClassifier:
+    """Catégories des lignes de l'instruction en cours, comptées au fil de l'eau."""
+
+    def __init__(self) -> None:
+        self.counts = [0, 0, 0, 0]
+        self._pending: dict[int, int] = {}
+
+    def mark(self, start: int, end: int, kind: int) -> None:
+        """Classe les lignes start..end (la catégorie la plus forte l'emporte)."""
+        for row in range(start, end + 1):
+            if self._pending.get(row, _BLANK) < kind:
+                self._pending[row] = kind
+
+    def flush(self, upto: int | None = None) -> None:
+        """Compte les lignes terminées (toutes si upto est None)."""
+        rows = [row for row in self._pending if upto is None or row <= upto]
+        for row in rows:
+            self.counts[self._pending.pop(row)] += 1
+
+
+def classify_lines(readline: Callable[[], bytes]) -> dict[str, int]:
+    """
+    Classe les lignes d'un module lu ligne par ligne.
+
+    Args:
+        readline: Lecture de la ligne suivante en octets (ex: f.readline)
+
+    Returns:
+        Dictionnaire sloc/comment_lines/docstring_lines/blank_lines
+
+    Raises:
+        tokenize.TokenError: Si le module est tronqué
+        SyntaxError: Si l'indentation ou l'encodage est invalide
+    """
+    total = 0
+
+    def counting_readline() -> bytes:
+        nonlocal total
+        line = readline()
+        if line:
+            total += 1
+        return line
+
+    classifier = _LineClassifier()
+    block_start = False
+    opener: str | None = None
+    first: str | None = None
+    doc_strings: list[tuple[int, int]] | None = None
+
+    for token in tokenize.tokenize(counting_readline):
+        kind = token.type
+        if kind == tokenize.ENCODING:
+            block_start, opener = True, "module"
+        elif kind == tokenize.INDENT:
+            block_start = True
+        elif kind == tokenize.DEDENT:
+            block_start = False
+        elif kind == tokenize.ENDMARKER:
+            break
+        elif kind == tokenize.COMMENT:
+            classifier.mark(token.start[0], token.start[0], _COMMENT)
+        elif kind == tokenize.NL:
+            if first is None:
+                # Ligne vide ou commentaire hors instruction : déjà terminée
+                classifier.flush(token.end[0])
+        elif kind == tokenize.NEWLINE:
+            for start, end in doc_strings or ():
+                classifier.mark(start, end, _DOCSTRING)
+            classifier.flush(token.end[0])
+            opener, first, doc_strings = first, None, None
+            block_start = False
+        else:
+            if first is None:
+                first = token.string
+                if (
+                    kind == tokenize.STRING
+                    and block_start
+                    and opener in _DOCUMENTED_BLOCKS
+                ):
+                    doc_strings = []
+            if doc_strings is not None and kind == tokenize.STRING:
+                doc_strings.append((token.start[0], token.end[0]))
+                continue
+            if doc_strings:
+                # Chaîne suivie d'autre chose : simple expression
+                for start, end in doc_strings:
+                    classifier.mark(start, end, _CODE)
+            doc_strings = None
+            classifier.mark(token.start[0], token.end[0], _CODE)
+
+    classifier.flush()
+    _, comments, docstrings, code = classifier.counts
+    return {
+        "sloc": code,
+        "comment_lines": comments,
+        "docstring_lines": docstrings,
+        "blank_lines": total - code - comments - docstrings,
+    }
+
+
+def count_sloc_file(path: str | os.PathLike[str]) -> dict[str, Any] | None:
+    """
+    Classe les lignes d'un fichier Python.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Voir classify_lines, ou None si le fichier n'est pas du Python
+        tokenisable (encodage ou indentation invalide, chaîne non fermée)
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    with open(path, "rb") as f:
+        try:
+            return classify_lines(f.readline)
+        except (tokenize.TokenError, SyntaxError, ValueError):
+            return None
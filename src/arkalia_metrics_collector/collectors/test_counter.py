@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Comptage statique des tests par analyse syntaxique (ast).
+
+Reproduit les règles de collecte par défaut de pytest sans importer le code
+du projet :
+- modules ``test_*.py`` ou ``*_test.py``
+- fonctions ``test*`` au niveau du module
+- méthodes ``test*`` des classes ``Test*`` (sans ``__init__``) et des
+  sous-classes de ``unittest.TestCase`` (toute base ``*TestCase``),
+  méthodes héritées d'une classe du même module comprises
+- ``pytest.mark.parametrize`` à liste littérale : un test par jeu de valeurs
+  (décorateurs empilés multipliés, marqueurs de classe et ``pytestmark``
+  compris)
+
+Les paramètres non littéraux et les fixtures paramétrées comptent pour un.
+"""
+
+import ast
+import os
+
+_FunctionDef = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def is_test_module(name: str) -> bool:
+    """
+    Indique si pytest collecte un fichier (python_files par défaut).
+
+    Args:
+        name: Nom du fichier
+
+    Returns:
+        True pour ``test_*.py`` et ``*_test.py``
+    """
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def _dotted_name(node: ast.expr) -> str:
+    """Nom pointé d'une expression (``pytest.mark.parametrize``), sinon ""."""
+    parts: list[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return ""
+
+
+def _parametrize_factor(node: ast.expr) -> int:
+    """Nombre de jeux de valeurs d'un marqueur parametrize (1 sinon)."""
+    if not isinstance(node, ast.Call):
+        return 1
+    name = _dotted_name(node.func)
+    if name != "parametrize" and not name.endswith("mark.parametrize"):
+        return 1
+
+    argvalues: ast.expr | None = node.args[1] if len(node.args) > 1 else None
+    for keyword in node.keywords:
+        if keyword.arg == "argvalues":
+            argvalues = keyword.value
+    if isinstance(argvalues, (ast.List, ast.Tuple, ast.Set)):
+        if any(isinstance(elt, ast.Starred) for elt in argvalues.elts):
+            return 1
+        # Une liste vide produit un test marqué "skip", toujours collecté
+        return max(len(argvalues.elts), 1)
+    return 1
+
+
+def _marks_factor(marks: list[ast.expr]) -> int:
+    """Produit des facteurs parametrize d'une liste de marqueurs."""
+    factor = 1
+    for mark in marks:
+        if isinstance(mark, (ast.List, ast.Tuple)):
+            factor *= _marks_factor(list(mark.elts))
+        else:
+            factor *= _parametrize_factor(mark)
+    return factor
+
+
+def _pytestmark_factor(body: list[ast.stmt]) -> int:
+    """Facteur des marqueurs ``pytestmark = ...`` d'un module ou d'une classe."""
+    factor = 1
+    for stmt in body:
+        if isinstance(stmt, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "pytestmark"
+            for target in stmt.targets
+        ):
+            factor *= _marks_factor([stmt.value])
+    return factor
+
+
+def _own_test_methods(node: ast.ClassDef) -> dict[str, int]:
+    """Méthodes de test définies dans le corps d'une classe."""
+    return {
+        stmt.name: _marks_factor(stmt.decorator_list)
+        for stmt in node.body
+        if isinstance(stmt, _FunctionDef) and stmt.name.startswith("test")
+    }
+
+
+def _is_disabled(body: list[ast.stmt]) -> bool:
+    """Vérifie la présence de ``__test__ = False``."""
+    for stmt in body:
+        if (
+            isinstance(stmt, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "__test__"
+                for target in stmt.targets
+            )
+            and isinstance(stmt.value, ast.Constant)
+            and stmt.value.value is False
+        ):
+            return True
+    return False
+
+
+class _ModuleCounter:
+    """Compte les tests d'un module déjà analysé."""
+
+    def __init__(self, tree: ast.Module) -> None:
+        self.tree = tree
+        # Classes du module, pour résoudre l'héritage local
+        self.classes = {
+            node.name: node for node in tree.body if isinstance(node, ast.ClassDef)
+        }
+        self.module_factor = _pytestmark_factor(tree.body)
+        self._methods: dict[str, dict[str, int]] = {}
+        self._testcase: dict[str, bool] = {}
+
+    def is_testcase(
+        self, node: ast.ClassDef, seen: frozenset[str] = frozenset()
+    ) -> bool:
+        """Vérifie si une classe dérive (éventuellement via le module) de TestCase."""
+        cached = self._testcase.get(node.name)
+        if cached is not None:
+            return cached
+        result = False
+        for base in node.bases:
+            name = _dotted_name(base)
+            if name.endswith("TestCase"):
+                result = True
+            elif name in self.classes and name not in seen:
+                result = self.is_testcase(self.classes[name], seen | {node.name})
+            if result:
+                break
+        self._testcase[node.name] = result
+        return result
+
+    def methods(
+        self, node: ast.ClassDef, seen: frozenset[str] = frozenset()
+    ) -> dict[str, int]:
+        """Méthodes de test (nom -> nombre de cas), héritage du module compris."""
+        cached = self._methods.get(node.name)
+        if cached is not None:
+            return cached
+
+        methods: dict[str, int] = {}
+        # Héritage : les bases les plus à droite sont masquées par les premières
+        for base in reversed(node.bases):
+            name = _dotted_name(base)
+            if name in self.classes and name not in seen:
+                methods.update(self.methods(self.classes[name], seen | {node.name}))
+
+        methods.update(_own_test_methods(node))
+
+        self._methods[node.name] = methods
+        return methods
+
+    def count_class(self, node: ast.ClassDef, nested: bool = False) -> int:
+        """Nombre de tests d'une classe collectée par pytest."""
+        if _is_disabled(node.body):
+            return 0
+        testcase = self.is_testcase(node) if not nested else False
+        if not testcase:
+            if not node.name.startswith("Test"):
+                return 0
+            if any(
+                isinstance(stmt, _FunctionDef) and stmt.name == "__init__"
+                for stmt in node.body
+            ):
+                # pytest refuse les classes Test* avec constructeur
+                return 0
+
+        # Les classes imbriquées ne sont pas indexées : pas d'héritage local
+        methods = _own_test_methods(node) if nested else self.methods(node)
+        total = sum(methods.values())
+
+        if not testcase:
+            # Les classes Test* imbriquées sont aussi collectées
+            total += sum(
+                self.count_class(stmt, nested=True)
+                for stmt in node.body
+                if isinstance(stmt, ast.ClassDef)
+            )
+            # parametrize n'a pas d'effet sur les TestCase unittest
+            total *= _marks_factor(node.decorator_list) * _pytestmark_factor(node.body)
+        return total
+
+    def count(self) -> int:
+        """Nombre total de tests du module."""
+        total = 0
+        for node in self.tree.body:
+            if isinstance(node, _FunctionDef) and node.name.startswith("test"):
+                total += _marks_factor(node.decorator_list) * self.module_factor
+            elif isinstance(node, ast.ClassDef):
+                count = self.count_class(node)
+                if not self.is_testcase(node):
+                    count *= self.module_factor
+                total += count
+        return total
+
+
+def count_tests_in_source(source: str | bytes, filename: str = "<test>") -> int:
+    """
+    Compte les tests d'un module de test.
+
+    Args:
+        source: Code source du module
+        filename: Nom du fichier (messages d'erreur)
+
+    Returns:
+        Nombre de tests (0 si le module est syntaxiquement invalide)
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return 0
+    if _is_disabled(tree.body):
+        return 0
+    return _ModuleCounter(tree).count()
+
+
+def count_tests_in_file(path: str | os.PathLike[str]) -> int:
+    """
+    Compte les tests d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Nombre de tests
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+    """
+    with open(path, "rb") as f:
+        return count_tests_in_source(f.read(), str(path))
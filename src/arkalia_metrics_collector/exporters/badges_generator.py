@@ -122,6 +122,7 @@ class BadgesGenerator:
         summary = metrics.get("summary", {})
         python_files = summary.get("total_python_files", 0)
         lines_of_code = summary.get("lines_of_code", 0)
+        sloc = summary.get("sloc")
         tests = summary.get("collected_tests", 0)
 
         # Badge modules Python
@@ -149,6 +150,19 @@ class BadgesGenerator:
             else f"![LOC]({loc_badge})"
         )
 
+        # Badge lignes de code source (hors commentaires, docstrings, vides)
+        if sloc is not None:
+            sloc_badge = self.generate_shields_badge(
+                "SLOC",
+                f"{sloc:,}",
+                color="green",
+            )
+            badges.append(
+                f"[![SLOC]({sloc_badge})](https://github.com/{github_owner}/{github_repo})"
+                if github_owner and github_repo
+                else f"![SLOC]({sloc_badge})"
+            )
+
         # Badge tests
         tests_badge = self.generate_shields_badge(
             "Tests",
@@ -20,6 +20,10 @@ else:
     except ImportError:
         requests = None  # type: ignore[assignment,unused-ignore]
 
+from arkalia_metrics_collector.instrumentation.calls import http_request
+from arkalia_metrics_collector.instrumentation.hooks import export_hook
+from arkalia_metrics_collector.instrumentation.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +39,8 @@ class GoogleSheetsExporter:
         """
         self.spreadsheet_id = spreadsheet_id
 
+    @export_hook("google_sheets")
+    @traced(category="export")
     def export(self, metrics: dict[str, Any]) -> bool:
         """
         Exporte les métriques vers Google Sheets.
@@ -72,6 +78,8 @@ class NotionExporter:
         self.notion_token = notion_token
         self.database_id = database_id
 
+    @export_hook("notion")
+    @traced(category="export")
     def export(self, metrics: dict[str, Any]) -> bool:
         """
         Exporte les métriques vers Notion.
@@ -122,6 +130,8 @@ class AirtableExporter:
         self.base_id = base_id
         self.table_name = table_name
 
+    @export_hook("airtable")
+    @traced(category="export")
     def export(self, metrics: dict[str, Any]) -> bool:
         """
         Exporte les métriques vers Airtable.
@@ -165,6 +175,8 @@ class RESTAPIExporter:
         self.api_url = api_url
         self.api_key = api_key
 
+    @export_hook("rest_api")
+    @traced(category="export")
     def export(self, metrics: dict[str, Any]) -> bool:
         """
         Exporte les métriques vers l'API REST.
@@ -191,9 +203,11 @@ class RESTAPIExporter:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
-            response = requests_module.post(
-                self.api_url, json=metrics, headers=headers, timeout=10
-            )
+            with http_request("POST", self.api_url) as call:
+                response = requests_module.post(
+                    self.api_url, json=metrics, headers=headers, timeout=10
+                )
+                call.status = response.status_code
 
             if response.status_code in (200, 201):
                 logger.info(f"Métriques exportées vers {self.api_url}")
@@ -9,11 +9,14 @@ Crée un dashboard avancé avec :
 - Export CSV/JSON depuis le dashboard
 """
 
+import html
 import json
 from pathlib import Path
 from typing import Any
 
 from arkalia_metrics_collector import __version__
+from arkalia_metrics_collector.collectors.file_table import FLAG_PYTHON, FileTable
+from arkalia_metrics_collector.instrumentation.tracing import traced
 
 
 class InteractiveDashboardGenerator:
@@ -24,6 +27,7 @@ class InteractiveDashboardGenerator:
     """
 
     @staticmethod
+    @traced(category="export")
     def generate_dashboard(
         metrics_data: dict[str, Any],
         history_data: list[dict[str, Any]] | None = None,
@@ -290,6 +294,9 @@ class InteractiveDashboardGenerator:
         <!-- Tableau des projets (si métriques agrégées) -->
         {InteractiveDashboardGenerator._generate_projects_table(metrics_data) if is_aggregated else ''}
 
+        <!-- Treemap des dossiers (si disponible) -->
+        {InteractiveDashboardGenerator._generate_directories_treemap(metrics_data) if not is_aggregated else ''}
+
         <!-- Tableau des fichiers Python (si disponible) -->
         {InteractiveDashboardGenerator._generate_files_table(metrics_data) if not is_aggregated else ''}
 
@@ -559,7 +566,14 @@ class InteractiveDashboardGenerator:
     @staticmethod
     def _generate_files_table(metrics_data: dict[str, Any]) -> str:
         """Génère un tableau interactif des fichiers Python."""
-        python_files = metrics_data.get("python_files", {}).get("files_list", [])
+        python_files = metrics_data.get("python_files", {}).get("files_list")
+        if python_files is None and metrics_data.get("file_table"):
+            # Collecte compacte : chemins reconstruits depuis la table
+            try:
+                table = FileTable.from_json(metrics_data["file_table"])
+            except ValueError:
+                return ""
+            python_files = table.paths(FLAG_PYTHON)
         if not python_files or len(python_files) > 100:
             return ""  # Trop de fichiers pour afficher
 
@@ -586,3 +600,64 @@ class InteractiveDashboardGenerator:
             {f'<p class="text-gray-400 text-sm mt-4">Affichage de 50 fichiers sur {len(python_files)}</p>' if len(python_files) > 50 else ''}
         </div>
         """
+
+    @staticmethod
+    def _treemap_boxes(nodes: list[dict[str, Any]], direction: str) -> str:
+        """Génère les cases d'un niveau du treemap (surface ∝ lignes)."""
+        boxes = ""
+        for node in sorted(nodes, key=lambda n: -n["lines"]):
+            if node["lines"] <= 0:
+                continue
+            name = html.escape(node["name"])
+            title = (
+                f"{name} : {node['lines']:,} lignes, {node['files']:,} fichiers, "
+                f"{node['test_files']:,} tests, {node['doc_files']:,} docs"
+            )
+            children = node.get("children", [])
+            inner = (
+                InteractiveDashboardGenerator._treemap_boxes(
+                    children, "column" if direction == "row" else "row"
+                )
+                if children
+                else ""
+            )
+            boxes += (
+                f'<div class="border border-gray-900 bg-blue-900/60 overflow-hidden '
+                f'flex flex-col p-1 min-w-0" style="flex: {node["lines"]} 1 0" '
+                f'title="{title}"><span class="text-xs text-gray-200 truncate">'
+                f"{name} ({node['lines']:,})</span>"
+                f'<div class="flex flex-1 min-h-0" style="flex-direction: {direction}">'
+                f"{inner}</div></div>"
+            )
+        return boxes
+
+    @staticmethod
+    def _generate_directories_treemap(metrics_data: dict[str, Any]) -> str:
+        """Génère un treemap des lignes par dossier (section directories)."""
+        tree = metrics_data.get("directories", {}).get("tree")
+        if not tree or not tree.get("children") or tree.get("lines", 0) <= 0:
+            return ""
+
+        # Fichiers à la racine : case dédiée pour que les surfaces restent justes
+        nodes = list(tree["children"])
+        root_lines = tree["lines"] - sum(child["lines"] for child in nodes)
+        if root_lines > 0:
+            nodes.append(
+                {
+                    "name": "(racine)",
+                    "lines": root_lines,
+                    "files": tree["files"] - sum(c["files"] for c in nodes),
+                    "test_files": tree["test_files"]
+                    - sum(c["test_files"] for c in nodes),
+                    "doc_files": tree["doc_files"] - sum(c["doc_files"] for c in nodes),
+                }
+            )
+
+        return f"""
+        <div class="bg-gray-800 rounded-xl p-6 mb-8">
+            <h2 class="text-2xl font-bold mb-4">🗂️ Lignes par dossier</h2>
+            <div class="flex w-full h-96 rounded overflow-hidden" style="flex-direction: row">
+                {InteractiveDashboardGenerator._treemap_boxes(nodes, "column")}
+            </div>
+        </div>
+        """
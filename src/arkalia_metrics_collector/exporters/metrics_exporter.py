@@ -20,6 +20,8 @@ from arkalia_metrics_collector import __version__
 from arkalia_metrics_collector.exporters.interactive_dashboard import (
     InteractiveDashboardGenerator,
 )
+from arkalia_metrics_collector.instrumentation.hooks import export_hook
+from arkalia_metrics_collector.instrumentation.tracing import traced
 
 
 class MetricsExporter:
@@ -43,6 +45,8 @@ class MetricsExporter:
         """
         self.metrics_data = metrics_data
 
+    @export_hook("json")
+    @traced(category="export")
     def export_json(self, output_file: str) -> bool:
         """
         Exporte en format JSON.
@@ -66,6 +70,8 @@ class MetricsExporter:
             print(f"Erreur lors de l'export JSON: {e}")
             return False
 
+    @export_hook("markdown")
+    @traced(category="export")
     def export_markdown_summary(self, output_file: str) -> bool:
         """
         Exporte un résumé en format Markdown pour le README.
@@ -82,6 +88,14 @@ class MetricsExporter:
 
             summary = self.metrics_data.get("summary", {})
             collection_info = self.metrics_data.get("collection_info", {})
+            # Répartition SLOC seulement si collectée (option sloc)
+            sloc_row = (
+                f'| **🧮 Code Source (SLOC)** | `{summary["sloc"]:,} lignes` | '
+                "![Mesuré](https://img.shields.io/badge/status-mesuré-blue) | "
+                "✅ **CLASSÉ** |\n"
+                if "sloc" in summary
+                else ""
+            )
 
             content = f"""## 📊 **Métriques du Projet** *(Mise à jour automatique)*
 
@@ -91,7 +105,7 @@ class MetricsExporter:
 |:-------------:|:---------:|:----------:|:------------:|
 | **🐍 Fichiers Python** | `{summary.get("total_python_files", 0):,} modules` | ![Actif](https://img.shields.io/badge/status-actif-brightgreen) | ✅ **COMPTÉ** |
 | **📝 Lignes de Code** | `{summary.get("lines_of_code", 0):,} lignes` | ![Maintenu](https://img.shields.io/badge/status-maintenu-blue) | ✅ **MESURÉ** |
-| **🧪 Tests** | `{summary.get("collected_tests", 0):,} tests` | ![Testé](https://img.shields.io/badge/status-testé-green) | ✅ **COLLECTÉ** |
+{sloc_row}| **🧪 Tests** | `{summary.get("collected_tests", 0):,} tests` | ![Testé](https://img.shields.io/badge/status-testé-green) | ✅ **COLLECTÉ** |
 | **📚 Documentation** | `{summary.get("documentation_files", 0)} fichiers` | ![Complet](https://img.shields.io/badge/status-complet-yellow) | ✅ **ORGANISÉ** |
 
 </div>
@@ -108,6 +122,8 @@ class MetricsExporter:
             print(f"Erreur lors de l'export Markdown: {e}")
             return False
 
+    @export_hook("html")
+    @traced(category="export")
     def export_html_dashboard(
         self, output_file: str, use_interactive: bool = True
     ) -> bool:
@@ -160,6 +176,18 @@ class MetricsExporter:
 
             summary = self.metrics_data.get("summary", {})
             collection_info = self.metrics_data.get("collection_info", {})
+            python_files = self.metrics_data.get("python_files", {})
+            # Répartition SLOC seulement si collectée (option sloc)
+            sloc_items = "".join(
+                f"\n                        <li>• {label}: {python_files[key]:,}</li>"
+                for label, key in (
+                    ("Code (SLOC)", "sloc"),
+                    ("Commentaires", "comment_lines"),
+                    ("Docstrings", "docstring_lines"),
+                    ("Lignes vides", "blank_lines"),
+                )
+                if key in python_files
+            )
 
             html_content = f"""<!DOCTYPE html>
 <html lang="fr">
@@ -222,7 +250,7 @@ class MetricsExporter:
                     <ul class="space-y-2 text-gray-300">
                         <li>• Fichiers core: {self.metrics_data.get("python_files", {}).get("core_files", 0)}</li>
                         <li>• Fichiers de test: {self.metrics_data.get("python_files", {}).get("test_files", 0)}</li>
-                        <li>• Total lignes: {self.metrics_data.get("python_files", {}).get("total_lines", 0):,}</li>
+                        <li>• Total lignes: {self.metrics_data.get("python_files", {}).get("total_lines", 0):,}</li>{sloc_items}
                     </ul>
                 </div>
                 <div>
@@ -252,6 +280,8 @@ class MetricsExporter:
             print(f"Erreur lors de l'export HTML: {e}")
             return False
 
+    @export_hook("csv")
+    @traced(category="export")
     def export_csv(self, output_file: str) -> bool:
         """
         Exporte en format CSV pour analyse.
@@ -287,6 +317,15 @@ class MetricsExporter:
                 writer.writerow(
                     ["Lignes de Code", summary.get("lines_of_code", 0), "lignes"]
                 )
+                for label, key in (
+                    ("Code Source (SLOC)", "sloc"),
+                    ("Lignes de Commentaires", "comment_lines"),
+                    ("Lignes de Docstrings", "docstring_lines"),
+                    ("Lignes Vides", "blank_lines"),
+                ):
+                    # Répartition SLOC seulement si collectée (option sloc)
+                    if key in summary:
+                        writer.writerow([label, summary[key], "lignes"])
                 writer.writerow(["Tests", summary.get("collected_tests", 0), "tests"])
                 writer.writerow(
                     ["Documentation", summary.get("documentation_files", 0), "fichiers"]
@@ -313,6 +352,8 @@ class MetricsExporter:
             print(f"Erreur lors de l'export CSV: {e}")
             return False
 
+    @export_hook("yaml")
+    @traced(category="export")
     def export_yaml(self, output_file: str) -> bool:
         """
         Exporte en format YAML.
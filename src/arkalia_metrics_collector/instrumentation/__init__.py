@@ -0,0 +1,23 @@
+"""Instrumentation des collectes (chronométrage, profilage, traces et hooks)."""
+
+from .hooks import HOOK_EVENTS, HookRegistry, hooks
+from .profiling import CpuProfile, MemoryProfile, create_profile
+from .timings import PhaseTiming, TimingRecorder, format_timings
+from .tracing import Tracer, span, start_tracing, stop_tracing, traced
+
+__all__ = [
+    "PhaseTiming",
+    "TimingRecorder",
+    "format_timings",
+    "CpuProfile",
+    "MemoryProfile",
+    "create_profile",
+    "Tracer",
+    "span",
+    "traced",
+    "start_tracing",
+    "stop_tracing",
+    "HOOK_EVENTS",
+    "HookRegistry",
+    "hooks",
+]
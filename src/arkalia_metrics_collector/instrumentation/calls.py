@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Appels externes instrumentés : commandes et requêtes HTTP.
+
+run_command, open_command et http_request ouvrent le span de l'appel (trace
+--trace) et émettent le hook correspondant (on_subprocess, on_http_request)
+avec sa durée : les collecteurs n'ont qu'un appel à faire par commande ou
+requête.
+"""
+
+import subprocess  # nosec B404
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+from arkalia_metrics_collector.instrumentation.tracing import span
+
+
+def run_command(
+    command: list[str], name: str | None = None, **kwargs: Any
+) -> subprocess.CompletedProcess[Any]:
+    """
+    Exécute une commande (subprocess.run) dans un span et émet on_subprocess.
+
+    Args:
+        command: Commande et arguments
+        name: Nom du span (défaut: les deux premiers éléments de la commande)
+        **kwargs: Arguments de subprocess.run (cwd, timeout...)
+
+    Returns:
+        Résultat de subprocess.run
+
+    Raises:
+        OSError, subprocess.SubprocessError: Comme subprocess.run (le hook
+            reçoit alors returncode None)
+    """
+    start = time.perf_counter()
+    returncode = None
+    try:
+        with span(name or " ".join(command[:2]), "subprocess"):
+            result = subprocess.run(command, **kwargs)  # nosec B603 B607
+        returncode = result.returncode
+        return result
+    finally:
+        if hooks.on_subprocess:
+            hooks.emit(
+                "on_subprocess",
+                command=list(command),
+                returncode=returncode,
+                seconds=time.perf_counter() - start,
+            )
+
+
+@contextmanager
+def open_command(
+    command: list[str], name: str | None = None, **kwargs: Any
+) -> Iterator[subprocess.Popen[bytes]]:
+    """
+    Lance une commande lue en flux (subprocess.Popen), comme run_command.
+
+    Le span et la durée du hook on_subprocess couvrent toute la lecture ;
+    à la sortie du bloc, la sortie standard est fermée et la commande
+    attendue (returncode du processus renseigné).
+
+    Args:
+        command: Commande et arguments
+        name: Nom du span (défaut: les deux premiers éléments de la commande)
+        **kwargs: Arguments de subprocess.Popen (cwd, stdout...)
+
+    Yields:
+        Processus lancé
+
+    Raises:
+        OSError, subprocess.SubprocessError: Comme subprocess.Popen (le hook
+            reçoit alors returncode None)
+    """
+    start = time.perf_counter()
+    returncode = None
+    try:
+        with span(name or " ".join(command[:2]), "subprocess") as command_span:
+            proc = subprocess.Popen(command, **kwargs)  # nosec B603 B607
+            try:
+                yield proc
+            finally:
+                if proc.stdout is not None:
+                    proc.stdout.close()
+                returncode = proc.wait()
+                command_span.set(returncode=returncode)
+    finally:
+        if hooks.on_subprocess:
+            hooks.emit(
+                "on_subprocess",
+                command=list(command),
+                returncode=returncode,
+                seconds=time.perf_counter() - start,
+            )
+
+
+class HttpCall:
+    """
+    Requête en cours dans http_request.
+
+    Attributes:
+        status: Statut HTTP de la réponse (à renseigner par l'appelant)
+    """
+
+    __slots__ = ("status",)
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+
+
+@contextmanager
+def http_request(method: str, url: str, **args: Any) -> Iterator[HttpCall]:
+    """
+    Mesure une requête HTTP : span "http" et hook on_http_request.
+
+    Args:
+        method: Méthode HTTP
+        url: URL requêtée
+        **args: Détails supplémentaires du span
+
+    Yields:
+        Requête dont l'appelant renseigne status une fois la réponse reçue
+    """
+    call = HttpCall()
+    start = time.perf_counter()
+    try:
+        with span(method, "http", url=url, **args) as request_span:
+            yield call
+            request_span.set(status=call.status)
+    finally:
+        if hooks.on_http_request:
+            hooks.emit(
+                "on_http_request",
+                method=method,
+                url=url,
+                status=call.status,
+                seconds=time.perf_counter() - start,
+            )
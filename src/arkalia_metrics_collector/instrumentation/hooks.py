@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Points d'accroche (hooks) pour observer une collecte sans modifier le code.
+
+Un programme qui embarque le collecteur abonne des fonctions à des
+événements (ex: envoyer des compteurs StatsD, faire avancer une barre de
+progression) :
+
+    from arkalia_metrics_collector.instrumentation import hooks
+
+    hooks.register("on_file_analyzed", lambda path, cached, **_: ...)
+
+Les fonctions sont appelées avec des arguments nommés, dans le thread qui
+produit l'événement (souvent un thread de phase : elles doivent être sûres
+entre threads). Accepter ``**kwargs`` garde une fonction compatible avec
+les arguments ajoutés plus tard. Événements et arguments :
+
+- ``on_phase_start(phase)`` / ``on_phase_end(phase, seconds)`` : phases
+  chronométrées (MetricsCollector, GitContributions, GitHubCollector,
+  MultiProjectAggregator) ;
+- ``on_file_analyzed(path, metrics, cached)`` : chaque fichier analysé ou
+  servi par un cache, à chaque passe d'analyse (lignes, structure,
+  tests...) ; chemin relatif, métriques ou None si illisible ;
+- ``on_subprocess(command, returncode, seconds)`` : commandes git et
+  pytest (returncode None si la commande n'a pas pu aboutir) ; un worker
+  pytest persistant l'émet à son arrêt, pour toute sa durée de vie ;
+- ``on_http_request(method, url, status, seconds)`` : requêtes HTTP
+  (status None en cas d'erreur réseau) ; pour les webhooks Slack et
+  Discord, url se limite à l'origine (le chemin contient le jeton) ;
+- ``on_cache_hit(cache, key)`` / ``on_cache_miss(cache, key)`` : caches
+  "incremental", "stat", "content" (fichiers) et "github" (réponses) ;
+- ``on_export(exporter, success, seconds)`` : exports (json, csv...,
+  services externes).
+
+Sans abonné, un événement ne coûte qu'un test sur un tuple vide : les
+appelants vérifient ``if hooks.on_xxx:`` avant de préparer les arguments.
+Une fonction qui lève une exception est journalisée sans interrompre la
+collecte.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Événements disponibles
+HOOK_EVENTS = (
+    "on_phase_start",
+    "on_phase_end",
+    "on_file_analyzed",
+    "on_subprocess",
+    "on_http_request",
+    "on_cache_hit",
+    "on_cache_miss",
+    "on_export",
+)
+
+Hook = Callable[..., Any]
+
+
+class HookRegistry:
+    """
+    Abonnés de chaque événement.
+
+    Chaque événement est un attribut (tuple des abonnés, vide par défaut),
+    remplacé en entier à chaque abonnement : la lecture ne prend pas de
+    verrou et un appel en cours n'est pas affecté par un désabonnement.
+    """
+
+    __slots__ = (*HOOK_EVENTS, "_lock")
+
+    on_phase_start: tuple[Hook, ...]
+    on_phase_end: tuple[Hook, ...]
+    on_file_analyzed: tuple[Hook, ...]
+    on_subprocess: tuple[Hook, ...]
+    on_http_request: tuple[Hook, ...]
+    on_cache_hit: tuple[Hook, ...]
+    on_cache_miss: tuple[Hook, ...]
+    on_export: tuple[Hook, ...]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.clear()
+
+    def _check(self, event: str) -> None:
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Événement inconnu: {event}")
+
+    def register(self, event: str, hook: Hook) -> Hook:
+        """
+        Abonne une fonction à un événement.
+
+        Args:
+            event: Nom de l'événement (voir HOOK_EVENTS)
+            hook: Fonction appelée avec les arguments nommés de l'événement
+
+        Returns:
+            La fonction abonnée
+
+        Raises:
+            ValueError: Si l'événement est inconnu
+        """
+        self._check(event)
+        with self._lock:
+            setattr(self, event, (*getattr(self, event), hook))
+        return hook
+
+    def unregister(self, event: str, hook: Hook) -> None:
+        """
+        Désabonne une fonction (sans effet si elle n'est pas abonnée).
+
+        Args:
+            event: Nom de l'événement
+            hook: Fonction passée à register
+
+        Raises:
+            ValueError: Si l'événement est inconnu
+        """
+        self._check(event)
+        with self._lock:
+            hooks = list(getattr(self, event))
+            if hook in hooks:
+                hooks.remove(hook)
+                setattr(self, event, tuple(hooks))
+
+    def clear(self) -> None:
+        """Désabonne toutes les fonctions de tous les événements."""
+        with self._lock:
+            for event in HOOK_EVENTS:
+                setattr(self, event, ())
+
+    def emit(self, event: str, **kwargs: Any) -> None:
+        """
+        Appelle les abonnés d'un événement.
+
+        Args:
+            event: Nom de l'événement
+            **kwargs: Arguments de l'événement
+        """
+        for hook in getattr(self, event):
+            try:
+                hook(**kwargs)
+            except Exception as e:
+                logger.warning(f"Hook {event} en erreur: {e}")
+
+
+# Registre global, partagé par tous les collecteurs et exportateurs
+hooks = HookRegistry()
+
+
+def export_hook(exporter: str) -> Callable[[F], F]:
+    """
+    Décorateur des méthodes d'export : émet on_export après chaque appel.
+
+    Args:
+        exporter: Nom de l'export (ex: "json", "notion")
+
+    Returns:
+        Décorateur (la méthode décorée renvoie un booléen de succès)
+    """
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not hooks.on_export:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            success = False
+            try:
+                success = func(*args, **kwargs)
+                return success
+            finally:
+                hooks.emit(
+                    "on_export",
+                    exporter=exporter,
+                    success=bool(success),
+                    seconds=time.perf_counter() - start,
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Profilage d'une exécution complète (option --profile de la CLI).
+
+Deux modes :
+- ``cpu`` : cProfile autour de la commande, statistiques écrites dans un
+  fichier .pstats (lisible par pstats, snakeviz...) et résumé des N
+  fonctions les plus coûteuses en temps propre ;
+- ``memory`` : tracemalloc, avec un instantané à chaque frontière de phase
+  (hooks on_phase_start et on_phase_end) ; chaque phase reçoit son pic de
+  mémoire, sa variation nette et ses principaux sites d'allocation.
+
+cProfile ne suit que le thread qui l'active et tracemalloc ne sait pas
+attribuer une allocation à un thread : tant qu'un profilage est actif,
+run_phases exécute les phases séquentiellement dans le thread appelant
+(profiling_active). Les workers du pool d'analyse (jobs > 1) ne sont pas
+profilés.
+"""
+
+import abc
+import cProfile
+import io
+import json
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+
+# Modes de profilage
+PROFILE_MODES = ("cpu", "memory")
+
+# Nombre de lignes des résumés (fonctions ou sites d'allocation)
+DEFAULT_PROFILE_TOP = 20
+
+# Fichiers de sortie par défaut, par mode
+DEFAULT_PROFILE_OUTPUTS = {
+    "cpu": "arkalia-metrics.pstats",
+    "memory": "arkalia-metrics-memory.json",
+}
+
+_active = 0
+_active_lock = threading.Lock()
+
+
+def profiling_active() -> bool:
+    """True si un profilage est en cours (phases à exécuter en séquence)."""
+    return _active > 0
+
+
+def _format_size(size: float) -> str:
+    """Taille lisible (o, Ko, Mo, Go), signe conservé."""
+    value = float(size)
+    for unit in ("o", "Ko", "Mo"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}" if unit != "o" else f"{value:.0f} o"
+        value /= 1024
+    return f"{value:.1f} Go"
+
+
+class _Profile(abc.ABC):
+    """Base des profils : démarrage, arrêt et compteur des profils actifs."""
+
+    mode = ""
+
+    def __init__(self, output: str | Path, top: int = DEFAULT_PROFILE_TOP) -> None:
+        """
+        Prépare un profil.
+
+        Args:
+            output: Fichier de sortie
+            top: Nombre de lignes du résumé
+        """
+        self.output = Path(output)
+        self.top = top
+        self._running = False
+
+    def start(self) -> None:
+        """Démarre le profilage."""
+        global _active
+        with _active_lock:
+            _active += 1
+        self._running = True
+        self._start()
+
+    def stop(self) -> str:
+        """
+        Arrête le profilage et écrit le fichier de sortie.
+
+        Returns:
+            Résumé texte
+        """
+        global _active
+        if not self._running:
+            return ""
+        self._running = False
+        try:
+            self._stop()
+        finally:
+            with _active_lock:
+                _active -= 1
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self._write()
+        return self.summary()
+
+    def __enter__(self) -> "_Profile":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @abc.abstractmethod
+    def _start(self) -> None:
+        """Démarre la mesure propre au profil."""
+
+    @abc.abstractmethod
+    def _stop(self) -> None:
+        """Arrête la mesure propre au profil."""
+
+    @abc.abstractmethod
+    def _write(self) -> None:
+        """Écrit le fichier de sortie."""
+
+    @abc.abstractmethod
+    def summary(self) -> str:
+        """Résumé texte du profil."""
+
+
+class CpuProfile(_Profile):
+    """Profil CPU (cProfile) d'une exécution."""
+
+    mode = "cpu"
+
+    def _start(self) -> None:
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def _stop(self) -> None:
+        self._profiler.disable()
+
+    def _write(self) -> None:
+        self._profiler.dump_stats(str(self.output))
+
+    def summary(self) -> str:
+        """Fonctions les plus coûteuses en temps propre (hors appelées)."""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.TIME)
+        stats.print_stats(self.top)
+        return stream.getvalue().strip()
+
+
+class _PhaseFrame:
+    """Phase en cours du profil mémoire."""
+
+    __slots__ = ("name", "snapshot", "current", "peak")
+
+    def __init__(self, name: str, snapshot: tracemalloc.Snapshot, current: int):
+        self.name = name
+        self.snapshot = snapshot
+        self.current = current
+        self.peak = current
+
+
+class MemoryProfile(_Profile):
+    """
+    Profil mémoire (tracemalloc) par phase.
+
+    Attributes:
+        phases: Rapport de chaque phase terminée, dans l'ordre de fin
+    """
+
+    mode = "memory"
+
+    def __init__(self, output: str | Path, top: int = DEFAULT_PROFILE_TOP) -> None:
+        super().__init__(output, top)
+        self.phases: list[dict[str, Any]] = []
+        self._stack: list[_PhaseFrame] = []
+        self._peak = 0
+        self._started_tracing = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Instantané sans les allocations de tracemalloc lui-même."""
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+
+    def _fold_peak(self) -> None:
+        """Reporte le pic courant sur les phases ouvertes, puis le remet à zéro."""
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak = max(self._peak, peak)
+        for frame in self._stack:
+            frame.peak = max(frame.peak, peak)
+        tracemalloc.reset_peak()
+
+    def _on_phase_start(self, phase: str, **_: Any) -> None:
+        """Instantané au début d'une phase."""
+        if not tracemalloc.is_tracing():
+            return
+        self._fold_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        self._stack.append(_PhaseFrame(phase, self._snapshot(), current))
+
+    def _on_phase_end(self, phase: str, **_: Any) -> None:
+        """Instantané à la fin d'une phase, comparé à celui du début."""
+        if not tracemalloc.is_tracing():
+            return
+        self._fold_peak()
+        if not self._stack or self._stack[-1].name != phase:
+            return
+        frame = self._stack.pop()
+        snapshot = self._snapshot()
+        stats = snapshot.compare_to(frame.snapshot, "lineno")
+        current = tracemalloc.get_traced_memory()[0]
+        self.phases.append(
+            {
+                "phase": phase,
+                "peak_bytes": frame.peak,
+                "net_bytes": current - frame.current,
+                "top": [
+                    {
+                        "site": f"{stat.traceback[0].filename}:"
+                        f"{stat.traceback[0].lineno}",
+                        "size_bytes": stat.size_diff,
+                        "count": stat.count_diff,
+                    }
+                    for stat in stats[: self.top]
+                    if stat.size_diff > 0
+                ],
+            }
+        )
+
+    def _start(self) -> None:
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        hooks.register("on_phase_start", self._on_phase_start)
+        hooks.register("on_phase_end", self._on_phase_end)
+
+    def _stop(self) -> None:
+        hooks.unregister("on_phase_start", self._on_phase_start)
+        hooks.unregister("on_phase_end", self._on_phase_end)
+        if tracemalloc.is_tracing():
+            self._fold_peak()
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def report(self) -> dict[str, Any]:
+        """Rapport sérialisable : pic global et détail par phase."""
+        return {"peak_bytes": self._peak, "phases": self.phases}
+
+    def _write(self) -> None:
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+
+    def summary(self) -> str:
+        """Pic et variation de chaque phase avec ses sites d'allocation."""
+        lines = [f"Pic mémoire: {_format_size(self._peak)}"]
+        for phase in self.phases:
+            lines.append(
+                f"  {phase['phase']}: pic {_format_size(phase['peak_bytes'])}, "
+                f"net {'+' if phase['net_bytes'] >= 0 else ''}"
+                f"{_format_size(phase['net_bytes'])}"
+            )
+            for site in phase["top"]:
+                lines.append(
+                    f"      +{_format_size(site['size_bytes'])}  {site['site']} "
+                    f"({site['count']:+,} blocs)"
+                )
+        return "\n".join(lines)
+
+
+def create_profile(
+    mode: str, output: str | Path | None = None, top: int = DEFAULT_PROFILE_TOP
+) -> CpuProfile | MemoryProfile:
+    """
+    Crée un profil pour un mode.
+
+    Args:
+        mode: "cpu" ou "memory"
+        output: Fichier de sortie (défaut: DEFAULT_PROFILE_OUTPUTS)
+        top: Nombre de lignes du résumé
+
+    Returns:
+        Profil prêt à démarrer
+
+    Raises:
+        ValueError: Si le mode est inconnu
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Mode de profilage inconnu: {mode}")
+    path = output or DEFAULT_PROFILE_OUTPUTS[mode]
+    if mode == "cpu":
+        return CpuProfile(path, top)
+    return MemoryProfile(path, top)
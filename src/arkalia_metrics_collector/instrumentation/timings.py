@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Chronométrage des phases de collecte.
+
+Chaque phase mesurée reçoit son temps écoulé (horloge murale), son temps CPU
+(celui du thread qui l'exécute, les workers d'analyse n'étant pas comptés)
+ainsi que le nombre de fichiers et d'octets traités, d'où un débit en
+fichiers par seconde. Les phases s'exécutant dans des threads différents,
+le compteur courant est tenu par thread : add() impute les fichiers à la
+phase en cours du thread appelant, et ne fait rien hors phase.
+
+Un même fichier pouvant être traité par plusieurs phases, le total ne somme
+pas les phases : il cumule les entrées uniques déclarées par add_input()
+(fichiers énumérés, réponses téléchargées...).
+
+Le début et la fin de chaque phase émettent les hooks on_phase_start et
+on_phase_end dans le thread de la phase ; le profilage mémoire s'en sert
+pour prendre ses instantanés aux frontières des phases. Avec une trace
+active, chaque phase est aussi un span (catégorie "phase").
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from arkalia_metrics_collector.instrumentation.hooks import hooks
+from arkalia_metrics_collector.instrumentation.tracing import span
+
+
+class PhaseTiming:
+    """
+    Mesures d'une phase.
+
+    Attributes:
+        name: Nom de la phase
+        wall_seconds: Temps écoulé
+        cpu_seconds: Temps CPU du thread de la phase (None si inconnu)
+        files: Fichiers traités
+        bytes: Octets traités
+    """
+
+    __slots__ = ("name", "wall_seconds", "cpu_seconds", "files", "bytes")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall_seconds = 0.0
+        self.cpu_seconds: float | None = 0.0
+        self.files = 0
+        self.bytes = 0
+
+    @property
+    def files_per_second(self) -> float:
+        """Débit de la phase (0 si elle n'a pas duré)."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.files / self.wall_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Représentation sérialisable."""
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": (
+                round(self.cpu_seconds, 4) if self.cpu_seconds is not None else None
+            ),
+            "files": self.files,
+            "bytes": self.bytes,
+            "files_per_second": round(self.files_per_second, 1),
+        }
+
+
+class TimingRecorder:
+    """
+    Mesures des phases d'une collecte.
+
+    Une même phase mesurée plusieurs fois cumule ses mesures (ex: la phase
+    "metrics" de chaque projet d'une agrégation).
+    """
+
+    def __init__(self) -> None:
+        self._phases: dict[str, PhaseTiming] = {}
+        self._lock = threading.Lock()
+        self._current = threading.local()
+        # Phases en cours -> début (phase hors délai encore en arrière-plan)
+        self._running: dict[str, float] = {}
+        # Entrées uniques de la collecte (add_input)
+        self._files = 0
+        self._bytes = 0
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def _timing(self, name: str) -> PhaseTiming:
+        with self._lock:
+            timing = self._phases.get(name)
+            if timing is None:
+                timing = self._phases[name] = PhaseTiming(name)
+            return timing
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseTiming]:
+        """
+        Mesure le bloc comme une phase.
+
+        Args:
+            name: Nom de la phase
+
+        Yields:
+            Mesures (cumulées) de la phase
+        """
+        timing = self._timing(name)
+        previous = getattr(self._current, "timing", None)
+        self._current.timing = timing
+        if hooks.on_phase_start:
+            hooks.emit("on_phase_start", phase=name)
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        with self._lock:
+            self._running[name] = wall
+        try:
+            with span(name, "phase"):
+                yield timing
+        finally:
+            elapsed = time.perf_counter() - wall
+            with self._lock:
+                timing.wall_seconds += elapsed
+                if timing.cpu_seconds is not None:
+                    timing.cpu_seconds += time.thread_time() - cpu
+                self._running.pop(name, None)
+            self._current.timing = previous
+            if hooks.on_phase_end:
+                hooks.emit("on_phase_end", phase=name, seconds=elapsed)
+
+    def add(self, files: int = 0, size: int = 0) -> None:
+        """
+        Impute des fichiers à la phase en cours du thread appelant.
+
+        Args:
+            files: Nombre de fichiers traités
+            size: Octets traités
+        """
+        timing = getattr(self._current, "timing", None)
+        if timing is None:
+            return
+        with self._lock:
+            timing.files += files
+            timing.bytes += size
+
+    def add_input(self, files: int = 0, size: int = 0) -> None:
+        """
+        Compte des entrées uniques de la collecte dans le total.
+
+        Chaque entrée ne doit être déclarée qu'une fois (ex: fichiers
+        énumérés, réponse HTTP téléchargée) ; elle est aussi imputée à la
+        phase en cours du thread appelant, comme avec add().
+
+        Args:
+            files: Nombre de fichiers
+            size: Octets
+        """
+        with self._lock:
+            self._files += files
+            self._bytes += size
+        self.add(files, size)
+
+    @property
+    def total_files(self) -> int:
+        """Fichiers uniques déclarés par add_input() jusqu'ici."""
+        with self._lock:
+            return self._files
+
+    @property
+    def total_bytes(self) -> int:
+        """Octets uniques déclarés par add_input() jusqu'ici."""
+        with self._lock:
+            return self._bytes
+
+    def record(
+        self,
+        name: str,
+        wall_seconds: float,
+        cpu_seconds: float | None = None,
+        files: int = 0,
+        size: int = 0,
+    ) -> None:
+        """
+        Enregistre une phase mesurée ailleurs (ex: durée du parcours).
+
+        Args:
+            name: Nom de la phase
+            wall_seconds: Temps écoulé
+            cpu_seconds: Temps CPU (None si inconnu)
+            files: Fichiers traités
+            size: Octets traités
+        """
+        timing = self._timing(name)
+        with self._lock:
+            timing.wall_seconds += wall_seconds
+            if cpu_seconds is None:
+                timing.cpu_seconds = None
+            elif timing.cpu_seconds is not None:
+                timing.cpu_seconds += cpu_seconds
+            timing.files += files
+            timing.bytes += size
+
+    def get(self, name: str) -> PhaseTiming | None:
+        """Mesures d'une phase (None si jamais mesurée)."""
+        with self._lock:
+            return self._phases.get(name)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Bloc timings de collection_info.
+
+        Une phase encore en cours (hors délai) est marquée ``running`` ;
+        son temps écoulé court jusqu'à l'appel et son temps CPU est inconnu.
+
+        Returns:
+            Dictionnaire phases (mesures par phase, dans l'ordre de première
+            mesure) et total (temps écoulé et CPU du processus depuis la
+            création de l'enregistreur, fichiers et octets uniques déclarés
+            par add_input)
+        """
+        now = time.perf_counter()
+        with self._lock:
+            phases: dict[str, dict[str, Any]] = {}
+            for name, timing in self._phases.items():
+                info = timing.to_dict()
+                start = self._running.get(name)
+                if start is not None:
+                    info["wall_seconds"] = round(timing.wall_seconds + now - start, 4)
+                    info["cpu_seconds"] = None
+                    info["running"] = True
+                phases[name] = info
+            total = PhaseTiming("total")
+            total.wall_seconds = now - self._wall_start
+            total.cpu_seconds = time.process_time() - self._cpu_start
+            total.files = self._files
+            total.bytes = self._bytes
+            return {"phases": phases, "total": total.to_dict()}
+
+
+def format_timings(timings: dict[str, Any]) -> str:
+    """
+    Tableau texte d'un bloc timings (option --timings de la CLI).
+
+    Args:
+        timings: Bloc produit par TimingRecorder.to_dict
+
+    Returns:
+        Tableau aligné, une ligne par phase puis le total
+    """
+    header = ("Phase", "Mur (s)", "CPU (s)", "Fichiers", "Octets", "Fichiers/s")
+    rows = [header]
+    entries = list(timings.get("phases", {}).items())
+    if "total" in timings:
+        entries.append(("total", timings["total"]))
+    for name, timing in entries:
+        cpu = timing.get("cpu_seconds")
+        rows.append(
+            (
+                name,
+                f"{timing['wall_seconds']:.3f}",
+                f"{cpu:.3f}" if cpu is not None else "-",
+                f"{timing['files']:,}",
+                f"{timing['bytes']:,}",
+                f"{timing['files_per_second']:,.1f}",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Traces locales au format Chrome / Perfetto (option --trace de la CLI).
+
+Les collecteurs, exportateurs et notificateurs ouvrent des spans (span() ou
+le décorateur traced) autour de leurs étapes : phases, parcours, commandes
+git et pytest, requêtes HTTP, lots d'analyse, exports. Tant qu'aucune trace
+n'est démarrée (start_tracing), span() renvoie un contexte vide partagé.
+
+Le fichier produit (Trace Event Format, événements complets ``X``) s'ouvre
+dans chrome://tracing ou ui.perfetto.dev avec une piste par thread et par
+processus worker : on y lit le chemin critique et les workers inactifs.
+Les spans des processus workers sont mesurés sur l'horloge murale et
+renvoyés au processus principal avec leurs résultats (voir
+AnalysisPool.map_batches).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Tracer:
+    """
+    Collecte les spans d'une exécution.
+
+    Attributes:
+        pid: Processus principal
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self._origin_ns = time.perf_counter_ns()
+        self._epoch_ns = time.time_ns()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Ajoute un span du thread courant.
+
+        Args:
+            name: Nom du span
+            category: Catégorie (phase, io, subprocess, http, export...)
+            start_ns: Début (time.perf_counter_ns)
+            end_ns: Fin (time.perf_counter_ns)
+            args: Détails affichés avec le span
+        """
+        thread = threading.current_thread()
+        self._add(
+            name,
+            category,
+            (start_ns - self._origin_ns) / 1000,
+            (end_ns - start_ns) / 1000,
+            self.pid,
+            thread.ident or 0,
+            thread.name,
+            args,
+        )
+
+    def add_remote_span(self, record: dict[str, Any]) -> None:
+        """
+        Ajoute un span mesuré dans un processus worker.
+
+        Args:
+            record: Span produit par remote_span_record
+        """
+        self._add(
+            record["name"],
+            record["category"],
+            (record["start_epoch_ns"] - self._epoch_ns) / 1000,
+            record["duration_ns"] / 1000,
+            record["pid"],
+            record["tid"],
+            f"worker {record['pid']}",
+            record.get("args"),
+        )
+
+    def _add(
+        self,
+        name: str,
+        category: str,
+        ts_us: float,
+        dur_us: float,
+        pid: int,
+        tid: int,
+        thread_name: str,
+        args: dict[str, Any] | None,
+    ) -> None:
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(ts_us, 3),
+            "dur": round(dur_us, 3),
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault((pid, tid), thread_name)
+
+    @property
+    def spans(self) -> list[dict[str, Any]]:
+        """Spans enregistrés (copie)."""
+        with self._lock:
+            return list(self._events)
+
+    def to_chrome(self) -> dict[str, Any]:
+        """
+        Trace au format Chrome (Trace Event Format).
+
+        Returns:
+            Dictionnaire traceEvents (noms des processus et des pistes puis
+            spans par date de début)
+        """
+        with self._lock:
+            events = sorted(self._events, key=lambda e: (e["ts"], -e["dur"]))
+            threads = dict(self._threads)
+        metadata: list[dict[str, Any]] = []
+        for pid in sorted({pid for pid, _ in threads}):
+            label = "arkalia-metrics" if pid == self.pid else f"worker {pid}"
+            metadata.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {"name": label},
+                }
+            )
+        for (pid, tid), name in sorted(threads.items()):
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Écrit la trace.
+
+        Args:
+            path: Fichier de sortie (JSON)
+
+        Returns:
+            Chemin écrit
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f, ensure_ascii=False)
+        return output
+
+
+_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """
+    Démarre une trace globale (remplace la précédente).
+
+    Returns:
+        Trace active
+    """
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """
+    Arrête la trace globale.
+
+    Returns:
+        Trace arrêtée (None si aucune n'était active)
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def current_tracer() -> Tracer | None:
+    """Trace en cours (None si aucune)."""
+    return _tracer
+
+
+class _Span:
+    """Span en cours d'une trace active."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(
+        self, tracer: Tracer, name: str, category: str, args: dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def set(self, **args: Any) -> None:
+        """Complète les détails du span (ex: statut HTTP)."""
+        self._args.update(args)
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.add_span(
+            self._name,
+            self._category,
+            self._start,
+            time.perf_counter_ns(),
+            self._args,
+        )
+
+
+class _NoSpan:
+    """Span sans trace active : aucun coût hors de l'appel."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        """Sans effet."""
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, category: str = "collector", **args: Any) -> _Span | _NoSpan:
+    """
+    Ouvre un span (à utiliser avec ``with``).
+
+    Args:
+        name: Nom du span
+        category: Catégorie (phase, io, subprocess, http, export...)
+        **args: Détails affichés avec le span (valeurs JSON) ; complétables
+            dans le bloc via ``.set()`` (ex: statut HTTP)
+
+    Returns:
+        Contexte du span (vide sans trace active)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return _Span(tracer, name, category, args)
+
+
+def traced(name: str | None = None, category: str = "collector") -> Callable[[F], F]:
+    """
+    Décorateur : trace chaque appel de la fonction.
+
+    Args:
+        name: Nom du span (défaut: nom qualifié de la fonction)
+        category: Catégorie du span
+
+    Returns:
+        Décorateur
+    """
+
+    def decorate(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def remote_span_record(
+    name: str, category: str, start_epoch_ns: int, end_epoch_ns: int, **args: Any
+) -> dict[str, Any]:
+    """
+    Span mesuré dans un processus worker, à renvoyer au processus principal.
+
+    Args:
+        name: Nom du span
+        category: Catégorie du span
+        start_epoch_ns: Début (time.time_ns)
+        end_epoch_ns: Fin (time.time_ns)
+        **args: Détails du span
+
+    Returns:
+        Enregistrement sérialisable pour Tracer.add_remote_span
+    """
+    return {
+        "name": name,
+        "category": category,
+        "start_epoch_ns": start_epoch_ns,
+        "duration_ns": end_epoch_ns - start_epoch_ns,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": args,
+    }
@@ -11,6 +11,7 @@ Support pour :
 import logging
 import os
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
     import requests  # type: ignore[import-untyped]
@@ -20,9 +21,28 @@ else:
     except ImportError:
         requests = None  # type: ignore[assignment,unused-ignore]
 
+from arkalia_metrics_collector.instrumentation.calls import http_request
+from arkalia_metrics_collector.instrumentation.tracing import span, traced
+
 logger = logging.getLogger(__name__)
 
 
+def _webhook_origin(webhook_url: str) -> str:
+    """
+    Réduit une URL de webhook à son origine pour les traces et les hooks.
+
+    Le chemin d'un webhook Slack ou Discord contient son jeton secret.
+
+    Args:
+        webhook_url: URL complète du webhook
+
+    Returns:
+        Schéma et hôte de l'URL (ex: https://hooks.slack.com)
+    """
+    parts = urlsplit(webhook_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
 class EmailNotifier:
     """Notificateur par email via SMTP."""
 
@@ -55,6 +75,7 @@ class EmailNotifier:
             os.getenv("SMTP_TO", "").split(",") if os.getenv("SMTP_TO") else []
         )
 
+    @traced(category="notify")
     def send(self, subject: str, body: str) -> bool:
         """
         Envoie un email.
@@ -97,11 +118,12 @@ class EmailNotifier:
 
             msg.attach(MIMEText(body, "html"))
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
-            server.send_message(msg)
-            server.quit()
+            with span("SMTP", "smtp", server=self.smtp_server):
+                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+                server.starttls()
+                server.login(self.username, self.password)
+                server.send_message(msg)
+                server.quit()
 
             logger.info(f"Email envoyé à {', '.join(self.to_emails)}")
             return True
@@ -123,6 +145,7 @@ class SlackNotifier:
         """
         self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
 
+    @traced(category="notify")
     def send(self, message: str, title: str = "🚨 Alertes Métriques") -> bool:
         """
         Envoie un message Slack.
@@ -160,7 +183,13 @@ class SlackNotifier:
                 ],
             }
 
-            response = requests_module.post(self.webhook_url, json=payload, timeout=10)
+            with http_request(
+                "POST", _webhook_origin(self.webhook_url), service="slack"
+            ) as call:
+                response = requests_module.post(
+                    self.webhook_url, json=payload, timeout=10
+                )
+                call.status = response.status_code
 
             if response.status_code == 200:
                 logger.info("Message Slack envoyé")
@@ -186,6 +215,7 @@ class DiscordNotifier:
         """
         self.webhook_url = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
 
+    @traced(category="notify")
     def send(self, message: str, title: str = "🚨 Alertes Métriques") -> bool:
         """
         Envoie un message Discord.
@@ -222,7 +252,13 @@ class DiscordNotifier:
                 ]
             }
 
-            response = requests_module.post(self.webhook_url, json=payload, timeout=10)
+            with http_request(
+                "POST", _webhook_origin(self.webhook_url), service="discord"
+            ) as call:
+                response = requests_module.post(
+                    self.webhook_url, json=payload, timeout=10
+                )
+                call.status = response.status_code
 
             if response.status_code in (200, 204):
                 logger.info("Message Discord envoyé")
@@ -166,6 +166,174 @@ print(main())
         # En mode verbeux, il devrait y avoir plus de détails
         assert len(result.output) > 100
 
+    def test_collect_with_jobs(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de collecte avec analyse parallèle."""
+        result = runner.invoke(
+            cli,
+            [
+                "collect",
+                str(sample_project),
+                "--output",
+                str(tmp_path / "cli_jobs"),
+                "--jobs",
+                "4",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Résumé des métriques" in result.output
+
+    def test_collect_phase_timeout(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --phase-timeout (format PHASE=SECONDES)."""
+        output = str(tmp_path / "cli_phases")
+        result = runner.invoke(
+            cli,
+            ["collect", str(sample_project), "-o", output, "--verbose"]
+            + ["--phase-timeout", "tests=30", "--phase-timeout", "coverage=5"],
+        )
+
+        assert result.exit_code == 0
+        assert "Phase tests: ok" in result.output
+
+        invalid = runner.invoke(
+            cli, ["collect", str(sample_project), "--phase-timeout", "tests"]
+        )
+        assert invalid.exit_code != 0
+        unknown = runner.invoke(
+            cli, ["collect", str(sample_project), "--phase-timeout", "lint=5"]
+        )
+        assert unknown.exit_code != 0
+        assert "code_structure" in unknown.output
+
+    def test_collect_code_structure(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --code-structure."""
+        output = str(tmp_path / "cli_structure")
+        result = runner.invoke(
+            cli,
+            ["collect", str(sample_project), "-o", output, "--code-structure"]
+            + ["--verbose"],
+        )
+
+        assert result.exit_code == 0
+        assert "🧩 Structure: 3 fonctions, 1 classes, 1 méthodes" in result.output
+        with open(Path(output) / "metrics.json", encoding="utf-8") as f:
+            assert json.load(f)["code_structure"]["complexity"]["max"] == 2
+
+    def test_collect_compact_file_lists(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --file-lists compact."""
+        output = str(tmp_path / "cli_compact")
+        result = runner.invoke(
+            cli,
+            ["collect", str(sample_project), "-o", output, "--file-lists", "compact"],
+        )
+
+        assert result.exit_code == 0
+        with open(Path(output) / "metrics.json", encoding="utf-8") as f:
+            metrics = json.load(f)
+        assert "files_list" not in metrics["python_files"]
+        assert len(metrics["file_table"]["name"]) >= metrics["python_files"]["count"]
+
+    def test_collect_deadline(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --deadline (collecte bornée)."""
+        output = str(tmp_path / "cli_deadline")
+        result = runner.invoke(
+            cli,
+            ["collect", str(sample_project), "-o", output, "--deadline", "500ms"],
+        )
+
+        assert result.exit_code == 0
+        with open(Path(output) / "metrics.json", encoding="utf-8") as f:
+            metrics = json.load(f)
+        assert metrics["collection_info"]["sampling"]["deadline_seconds"] == 0.5
+
+        result = runner.invoke(cli, ["collect", str(sample_project), "--deadline", "5x"])
+        assert result.exit_code != 0
+
+    def test_collect_timings(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --timings."""
+        output = str(tmp_path / "cli_timings")
+        result = runner.invoke(
+            cli, ["collect", str(sample_project), "-o", output, "--timings"]
+        )
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert any(line.startswith("Phase ") for line in lines)
+        assert any(line.startswith("python ") for line in lines)
+
+    def test_profile_cpu(
+        self, runner: CliRunner, sample_project: Path, tmp_path: Path
+    ):
+        """Test de l'option --profile cpu du groupe."""
+        profile_file = tmp_path / "collect.pstats"
+        result = runner.invoke(
+            cli,
+            [
+                "--profile",
+                "cpu",
+                "--profile-output",
+                str(profile_file),
+                "collect",
+                str(sample_project),
+                "-o",
+                str(tmp_path / "cli_profile"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert profile_file.exists()
+        assert "Profil cpu" in result.output
+
+    def test_trace(self, runner: CliRunner, sample_project: Path, tmp_path: Path):
+        """Test de l'option --trace du groupe (trace Chrome)."""
+        trace_file = tmp_path / "trace.json"
+        result = runner.invoke(
+            cli,
+            [
+                "--trace",
+                str(trace_file),
+                "collect",
+                str(sample_project),
+                "-o",
+                str(tmp_path / "cli_trace"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Trace" in result.output
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        spans = {e["name"] for e in events if e["ph"] == "X"}
+        assert {"walk", "python", "MetricsExporter.export_json"} <= spans
+
+    def test_files_streams_json_lines(self, runner: CliRunner, sample_project: Path):
+        """Test de la commande files (JSON Lines)."""
+        result = runner.invoke(cli, ["files", str(sample_project), "--kind", "test"])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert records
+        assert {record["kind"] for record in records} == {"test"}
+        assert all(record["lines"] is not None for record in records)
+
+    def test_files_rejects_negative_jobs(self, runner: CliRunner, sample_project: Path):
+        """Test de la commande files avec --jobs négatif."""
+        result = runner.invoke(cli, ["files", str(sample_project), "--jobs", "-1"])
+
+        assert result.exit_code == 2
+        assert "--jobs" in result.output
+
     def test_collect_all_formats(
         self, runner: CliRunner, sample_project: Path, tmp_path: Path
     ):
@@ -0,0 +1,80 @@
+"""
+Tests du pool d'analyse parallèle.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors import file_analysis
+from arkalia_metrics_collector.collectors.analysis_pool import (
+    AnalysisPool,
+    make_batches,
+)
+from arkalia_metrics_collector.collectors.file_analysis import analyze_batch
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+
+class TestAnalysisPool:
+    """Tests pour AnalysisPool et l'équilibrage des lots."""
+
+    def test_make_batches_balances_weights(self):
+        """Les lots ont des poids proches et couvrent tous les éléments."""
+        weights = [100, 1, 1, 50, 50, 1, 1]
+
+        batches = make_batches(weights, 2)
+
+        assert sorted(i for batch in batches for i in batch) == list(range(7))
+        totals = sorted(sum(weights[i] for i in batch) for batch in batches)
+        assert totals == [102, 102]
+
+    def test_make_batches_never_empty(self):
+        """Pas de lot vide quand il y a moins d'éléments que de lots."""
+        assert make_batches([5, 3], 8) == [[0], [1]]
+
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    def test_results_keep_input_order(self, tmp_path: Path, kind: str):
+        """Les résultats fusionnés suivent l'ordre des entrées."""
+        paths = []
+        for i in range(12):
+            path = tmp_path / f"f{i}.py"
+            path.write_text("x\n" * i)
+            paths.append(str(path))
+        paths.append(str(tmp_path / "missing.py"))
+
+        items = [(path, ("lines",)) for path in paths]
+        with AnalysisPool(jobs=3) as pool:
+            results = pool.map_batches(
+                analyze_batch, items, weights=list(range(13)), kind=kind
+            )
+
+        assert results == [{"lines": i} for i in range(12)] + [None]
+
+    def test_failing_analyzer_skips_only_its_file(self, tmp_path: Path, monkeypatch):
+        """Une erreur d'analyseur donne None pour ce fichier seulement."""
+        good = tmp_path / "good.py"
+        good.write_text("a = 1\n")
+        bad = tmp_path / "bad.py"
+        bad.write_text("b = 2\n")
+        count_lines = file_analysis.ANALYZERS["lines"]
+
+        def failing(path: str, counter):
+            if path == str(bad):
+                raise ValueError("analyse cassée")
+            return count_lines(path, counter)
+
+        monkeypatch.setitem(file_analysis.ANALYZERS, "lines", failing)
+
+        items = [(str(bad), ("lines",)), (str(good), ("lines",))]
+        assert analyze_batch(items) == [None, {"lines": 1}]
+
+    def test_parallel_collection_is_deterministic(self, tmp_path: Path):
+        """jobs > 1 donne exactement le même résultat que jobs = 1."""
+        for i in range(30):
+            (tmp_path / f"m{i}.py").write_text("a = 1\n" * (i + 1))
+
+        sequential = MetricsCollector(tmp_path).collect_python_metrics()
+        parallel = MetricsCollector(tmp_path, jobs=4).collect_python_metrics()
+
+        assert parallel == sequential
+        assert parallel["total_lines"] == sum(range(1, 31))
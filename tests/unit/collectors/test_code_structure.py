@@ -0,0 +1,119 @@
+"""
+Tests des métriques de structure du code (fonctions, classes, complexité).
+"""
+
+import textwrap
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors.code_structure import (
+    aggregate_structure,
+    analyze_source,
+    percentile,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+SOURCE = """
+    def simple():
+        return 1
+
+    def branchy(items, flag):
+        for item in items:
+            if item and flag or not item:
+                continue
+        else:
+            pass
+        try:
+            value = [x for x in items if x if x > 1]
+        except ValueError:
+            value = None
+        assert value is not None
+        while flag:
+            flag = flag if flag > 1 else 0
+
+        def inner():
+            if flag:
+                return 1
+
+        return lambda y: y if y else 0
+
+    class Service:
+        def method(self, mode):
+            match mode:
+                case 1:
+                    return "a"
+                case _:
+                    return "b"
+
+        class Nested:
+            async def run(self):
+                pass
+"""
+
+
+class TestCodeStructure:
+    """Tests pour analyze_source, aggregate_structure et le collecteur."""
+
+    def test_counts_and_complexity(self):
+        """Fonctions, méthodes et complexité de McCabe par fonction."""
+        data = analyze_source(textwrap.dedent(SOURCE))
+
+        assert data is not None
+        assert (data["functions"], data["classes"], data["methods"]) == (3, 2, 2)
+        complexity = {name: cc for name, _, cc in data["complexity"]}
+        # for+else (2), if (1), and/or (2), except (1), compréhension (1+2),
+        # assert (1), while (1), ternaires (2 dont la lambda)
+        assert complexity == {
+            "simple": 1,
+            "branchy": 14,
+            "branchy.inner": 2,
+            "Service.method": 3,
+            "Service.Nested.run": 1,
+        }
+        assert analyze_source("def broken(:\n") is None
+
+    def test_aggregate(self):
+        """Moyenne, p95, max et fonctions les plus complexes."""
+        files = {
+            "a.py": {
+                "functions": 2,
+                "classes": 0,
+                "methods": 0,
+                "complexity": [["f", 1, 1], ["g", 5, 9]],
+            },
+            "b.py": {
+                "functions": 0,
+                "classes": 1,
+                "methods": 1,
+                "complexity": [["C.m", 3, 9]],
+            },
+            "broken.py": None,
+        }
+
+        result = aggregate_structure(files, top_n=2)
+
+        assert result["files_analyzed"] == 2
+        assert result["files_with_errors"] == 1
+        assert (result["functions"], result["classes"], result["methods"]) == (2, 1, 1)
+        assert result["complexity"]["average"] == 6.33
+        assert result["complexity"]["p95"] == 9
+        assert [t["function"] for t in result["complexity"]["top"]] == ["g", "C.m"]
+        assert result["files"]["a.py"]["max_complexity"] == 9
+        assert percentile([1, 2, 3, 4], 0.5) == 2
+
+    def test_collector_section_is_cached(self, tmp_path: Path):
+        """Section code_structure, servie par le cache au second run."""
+        (tmp_path / "app.py").write_text(textwrap.dedent(SOURCE))
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+
+        first = MetricsCollector(tmp_path, code_structure=True, cache=True)
+        metrics = first.collect_all_metrics()
+        second = MetricsCollector(tmp_path, code_structure=True, cache=True)
+        again = second.collect_all_metrics()
+
+        structure = metrics["code_structure"]
+        assert structure["functions"] == 3
+        assert structure["complexity"]["max"] == 14
+        assert structure["files_with_errors"] == 1
+        assert again["code_structure"] == structure
+        assert again["collection_info"]["cache"]["misses"] == 0
+        assert "code_structure" not in MetricsCollector(tmp_path).collect_all_metrics()
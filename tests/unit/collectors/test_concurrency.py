@@ -0,0 +1,93 @@
+"""
+Tests de la collecte concurrente (threads, sans os.chdir).
+"""
+
+import os
+import subprocess  # nosec B404
+import threading
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.metrics_collector import (
+    MetricsCollector,
+    collect_many,
+)
+
+
+def _make_project(root: Path, modules: int) -> Path:
+    (root / "pkg").mkdir(parents=True)
+    for i in range(modules):
+        (root / "pkg" / f"mod_{i}.py").write_text(f"x = {i}\ny = {i}\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_pkg.py").write_text("def test_a():\n    pass\n")
+    return root
+
+
+@pytest.fixture
+def projects(tmp_path: Path) -> list[Path]:
+    """Projets de tailles différentes."""
+    return [_make_project(tmp_path / f"project_{n}", n + 1) for n in range(4)]
+
+
+class TestConcurrentCollection:
+    """Tests pour collect_many et la réentrance de MetricsCollector."""
+
+    def test_collect_many_matches_sequential(self, projects: list[Path], tmp_path):
+        """Résultats identiques au séquentiel, dans l'ordre d'entrée."""
+        store = tmp_path / "store"
+        results = collect_many(reversed(projects), max_workers=4, content_store=store)
+
+        assert list(results) == [str(p.resolve()) for p in reversed(projects)]
+        for root, metrics in results.items():
+            assert metrics is not None
+            expected = MetricsCollector(root).collect_all_metrics()
+            assert metrics["python_files"] == expected["python_files"]
+            assert metrics["summary"] == expected["summary"]
+        # Contenus identiques entre projets : une seule entrée chacun
+        assert len(list(store.rglob("*.json"))) == 4 + 1
+
+    def test_collect_many_reports_failures(self, projects: list[Path]):
+        """Une option invalide donne None sans interrompre les autres."""
+        assert collect_many(projects, test_counter="inconnu") == {
+            str(p.resolve()): None for p in projects
+        }
+        assert collect_many([]) == {}
+
+    def test_pytest_counter_keeps_cwd(self, projects: list[Path], monkeypatch):
+        """Le moteur pytest passe cwd= au lieu de changer de répertoire."""
+        seen: list[str] = []
+        real_run = subprocess.run
+
+        def fake_run(args, **kwargs):
+            if "pytest" not in args:
+                return real_run(args, **kwargs)
+            seen.append(str(kwargs["cwd"]))
+            output = "tests/test_pkg.py::test_a\n"
+            return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        cwd = os.getcwd()
+
+        results = collect_many(projects, max_workers=4, test_counter="pytest")
+
+        assert os.getcwd() == cwd
+        assert sorted(seen) == sorted(str(p.resolve()) for p in projects)
+        assert all(m and m["summary"]["collected_tests"] == 1 for m in results.values())
+
+    def test_same_instance_is_reentrant(self, projects: list[Path]):
+        """Des appels concurrents sur une même instance sont sérialisés."""
+        collector = MetricsCollector(projects[-1], cache=True)
+        results: list[dict] = []
+
+        def run() -> None:
+            results.append(collector.collect_all_metrics())
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert {m["python_files"]["total_lines"] for m in results} == {10}
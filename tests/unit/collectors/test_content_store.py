@@ -0,0 +1,121 @@
+"""
+Tests du stockage des métriques adressé par contenu.
+"""
+
+import shutil
+import subprocess  # nosec B404
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.content_store import (
+    ContentStore,
+    blake2b_digest,
+    content_key_batch,
+    git_blob_sha,
+)
+from arkalia_metrics_collector.collectors.file_walker import FileWalker
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.multi_project_aggregator import (
+    MultiProjectAggregator,
+)
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git absent")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(  # nosec B603 B607
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_project(root: Path) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "shared.py").write_text("import os\n\nprint(os.name)\n")
+    (root / "own.py").write_text(f"NAME = '{root.name}'\n")
+
+
+class TestContentStore:
+    """Tests pour ContentStore et son intégration."""
+
+    def test_digests(self, tmp_path: Path):
+        """Les empreintes ne dépendent que du contenu."""
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("x = 1\n")
+        b.write_text("x = 1\n")
+
+        assert blake2b_digest(str(a)) == blake2b_digest(str(b))
+        assert len(blake2b_digest(str(a))) == 32
+        keys = content_key_batch(
+            [(str(a), None, False), (str(a), "abc", True), (str(b) + "~", None, False)]
+        )
+        assert keys == [f"blake2b/{blake2b_digest(str(a))}", "git/abc", None]
+
+    @requires_git
+    def test_git_blob_sha_matches_git(self, tmp_path: Path):
+        """git_blob_sha et git_blob_ids donnent l'identifiant Git du blob."""
+        _make_project(tmp_path)
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        (tmp_path / "own.py").write_text("changed = True\n")
+
+        blobs = FileWalker(tmp_path).git_blob_ids()
+        expected = subprocess.run(  # nosec B603 B607
+            ["git", "hash-object", "shared.py"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        assert git_blob_sha(str(tmp_path / "shared.py")) == expected
+        # Un fichier modifié n'a plus de blob fiable dans l'index
+        assert blobs == {"shared.py": expected}
+
+    def test_roundtrip(self, tmp_path: Path):
+        """Une entrée écrite est relue par un autre stockage sur le même dossier."""
+        ContentStore(tmp_path).put("blake2b/abcdef", {"lines": 4})
+
+        assert ContentStore(tmp_path).get("blake2b/abcdef") == {"lines": 4}
+        assert ContentStore(tmp_path).get("blake2b/000000") is None
+
+    def test_fresh_checkout_reuses_store(self, tmp_path: Path):
+        """Un autre checkout du même contenu ne relit aucun fichier."""
+        store_dir = tmp_path / "store"
+        _make_project(tmp_path / "checkout1")
+        shutil.copytree(tmp_path / "checkout1", tmp_path / "checkout2")
+
+        first = MetricsCollector(
+            tmp_path / "checkout1", enumeration="filesystem", content_store=store_dir
+        ).collect_all_metrics()
+        second = MetricsCollector(
+            tmp_path / "checkout2", enumeration="filesystem", content_store=store_dir
+        ).collect_all_metrics()
+
+        assert first["collection_info"]["content_store"]["misses"] == 2
+        assert second["collection_info"]["content_store"]["hits"] == 2
+        assert second["collection_info"]["content_store"]["misses"] == 0
+        assert (
+            second["python_files"]["total_lines"]
+            == first["python_files"]["total_lines"]
+        )
+
+    def test_aggregator_shares_one_store(self, tmp_path: Path):
+        """Les projets d'une agrégation partagent le même stockage."""
+        _make_project(tmp_path / "alpha")
+        _make_project(tmp_path / "beta")
+        aggregator = MultiProjectAggregator(
+            enable_history=False, content_store=tmp_path / "store"
+        )
+
+        aggregator.collect_project("alpha", tmp_path / "alpha")
+        aggregator.collect_project("beta", tmp_path / "beta")
+
+        # shared.py est identique dans les deux projets
+        assert aggregator.content_store is not None
+        assert aggregator.content_store.hits == 1
+        assert aggregator.content_store.misses == 3
@@ -0,0 +1,115 @@
+"""
+Tests du parser coverage.xml (lecture en flux).
+"""
+
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors.coverage_parser import CoverageParser
+
+COVERAGE_XML = """<?xml version="1.0" ?>
+<coverage version="7.4" line-rate="0.75" branch-rate="0.5" lines-covered="3"
+    lines-valid="4" branches-covered="1" branches-valid="2" timestamp="1">
+  <sources><source>/project</source></sources>
+  <packages>
+    <package name="pkg" line-rate="0.75" branch-rate="0.5">
+      <classes>
+        <class name="a.py" filename="pkg/a.py" line-rate="0.6667">
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="0"/>
+            <line number="3" hits="2" branch="true" condition-coverage="50% (1/2)"/>
+          </lines>
+        </class>
+        <class name="b.py" filename="pkg/b.py" line-rate="1">
+          <lines><line number="1" hits="4"/></lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+# Cobertura répète sous <methods> des lignes déjà listées par la classe
+METHODS_XML = """<?xml version="1.0" ?>
+<coverage version="7.4" line-rate="0.5" branch-rate="0" lines-covered="1"
+    lines-valid="2" branches-covered="0" branches-valid="0" timestamp="1">
+  <packages>
+    <package name="pkg" line-rate="0.5" branch-rate="0">
+      <classes>
+        <class name="a.py" filename="pkg/a.py" line-rate="0.5">
+          <methods>
+            <method name="f" signature="()" line-rate="1">
+              <lines>
+                <line number="1" hits="1" branch="true" condition-coverage="50% (1/2)"/>
+              </lines>
+            </method>
+          </methods>
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="0"/>
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+class TestCoverageParser:
+    """Tests pour CoverageParser.parse_coverage_xml."""
+
+    def test_summary_from_root_attributes(self, tmp_path: Path):
+        """Le mode résumé lit les totaux de l'élément <coverage>."""
+        path = tmp_path / "coverage.xml"
+        path.write_text(COVERAGE_XML)
+
+        metrics = CoverageParser.parse_coverage_xml(path)
+
+        assert metrics is not None
+        assert metrics["coverage_percentage"] == 75.0
+        assert metrics["branch_coverage"] == 50.0
+        assert (metrics["lines_covered"], metrics["lines_valid"]) == (3, 4)
+        assert "files" not in metrics
+        assert CoverageParser.parse_coverage_xml(tmp_path / "absent.xml") is None
+
+    def test_summary_stops_after_root(self, tmp_path: Path):
+        """La lecture s'arrête à la racine : la suite du fichier n'est pas lue."""
+        path = tmp_path / "coverage.xml"
+        root_end = COVERAGE_XML.index("<sources>")
+        path.write_text(COVERAGE_XML[:root_end] + "<packages><package" + "<" * 10)
+
+        metrics = CoverageParser.parse_coverage_xml(path)
+
+        assert metrics is not None and metrics["coverage_percentage"] == 75.0
+        # Le mode détaillé lit tout le fichier et échoue sur le XML tronqué
+        assert CoverageParser.parse_coverage_xml(path, per_file=True) is None
+
+    def test_per_file(self, tmp_path: Path):
+        """Le mode détaillé cumule les lignes et branches de chaque fichier."""
+        path = tmp_path / "coverage.xml"
+        path.write_text(COVERAGE_XML)
+
+        metrics = CoverageParser.get_coverage_for_project(tmp_path, per_file=True)
+
+        assert metrics is not None and metrics["lines_valid"] == 4
+        files = metrics["files"]
+        assert set(files) == {"pkg/a.py", "pkg/b.py"}
+        assert files["pkg/a.py"]["coverage_percentage"] == 66.67
+        assert files["pkg/a.py"]["branches_covered"] == 1
+        assert files["pkg/a.py"]["branches_valid"] == 2
+        assert files["pkg/b.py"]["lines_covered"] == 1
+        assert files["pkg/b.py"]["branch_coverage"] is None
+
+    def test_per_file_ignores_method_lines(self, tmp_path: Path):
+        """Les lignes des <method> ne sont pas comptées une seconde fois."""
+        path = tmp_path / "coverage.xml"
+        path.write_text(METHODS_XML)
+
+        metrics = CoverageParser.parse_coverage_xml(path, per_file=True)
+
+        assert metrics is not None
+        a = metrics["files"]["pkg/a.py"]
+        assert (a["lines_valid"], a["lines_covered"]) == (2, 1)
+        assert a["coverage_percentage"] == 50.0
+        assert a["branches_valid"] == 0
@@ -0,0 +1,83 @@
+"""
+Tests des cumuls par dossier.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.directory_rollup import DirectoryRollup
+from arkalia_metrics_collector.collectors.file_stream import StreamedFile
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.exporters.interactive_dashboard import (
+    InteractiveDashboardGenerator,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Projet sur trois niveaux de dossiers."""
+    (tmp_path / "src" / "pkg" / "deep").mkdir(parents=True)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "setup.py").write_text("x = 1\n")
+    (tmp_path / "src" / "pkg" / "core.py").write_text("a = 1\nb = 2\n")
+    (tmp_path / "src" / "pkg" / "deep" / "more.py").write_text("c = 3\nd = 4\ne = 5\n")
+    (tmp_path / "tests" / "test_core.py").write_text("def test_a():\n    pass\n")
+    (tmp_path / "src" / "pkg" / "README.md").write_text("# Paquet\n")
+    return tmp_path
+
+
+class TestDirectoryRollup:
+    """Tests pour DirectoryRollup et la section directories."""
+
+    def test_counters_fold_deep_directories(self):
+        """Les dossiers au-delà de max_depth sont repliés sur leur ancêtre."""
+        rollup = DirectoryRollup(max_depth=1)
+        rollup.add(StreamedFile("a/b/c.py", "core", 1, lines=10))
+        rollup.add(StreamedFile("a/test_x.py", "test", 1, lines=4))
+        rollup.add(StreamedFile("a/b/doc.md", "documentation", 1))
+        rollup.add(StreamedFile("top.py", "core", 1, lines=1))
+
+        assert rollup.get("a") == {
+            "files": 3,
+            "lines": 14,
+            "test_files": 1,
+            "doc_files": 1,
+        }
+        assert rollup.get("a/b") is None
+        assert rollup.get()["lines"] == 15
+
+        tree = rollup.to_tree()
+        assert tree["max_depth"] == 1
+        assert [child["name"] for child in tree["tree"]["children"]] == ["a"]
+        assert "children" not in tree["tree"]["children"][0]
+
+        with pytest.raises(ValueError):
+            DirectoryRollup(max_depth=-1)
+
+    def test_collection_section(self, project: Path):
+        """collect_all_metrics émet l'arbre, cohérent avec le résumé."""
+        metrics = MetricsCollector(project, directory_depth=2).collect_all_metrics()
+
+        tree = metrics["directories"]["tree"]
+        assert tree["lines"] == metrics["summary"]["lines_of_code"]
+        assert tree["doc_files"] == metrics["summary"]["documentation_files"]
+        src = next(c for c in tree["children"] if c["name"] == "src")
+        pkg = src["children"][0]
+        # src/pkg/deep replié dans src/pkg à la profondeur 2
+        assert (pkg["name"], pkg["files"], pkg["lines"]) == ("pkg", 3, 5)
+        assert "children" not in pkg
+
+        collector = MetricsCollector(project, directory_depth=0)
+        assert "children" not in collector.collect_directory_metrics()["tree"]
+
+    def test_dashboard_treemap(self, project: Path):
+        """Le dashboard dessine le treemap depuis la section directories."""
+        metrics = MetricsCollector(project).collect_all_metrics()
+
+        html = InteractiveDashboardGenerator._generate_directories_treemap(metrics)
+
+        assert "Lignes par dossier" in html
+        assert "src (5)" in html
+        assert "(racine) (1)" in html
+        assert InteractiveDashboardGenerator._generate_directories_treemap({}) == ""
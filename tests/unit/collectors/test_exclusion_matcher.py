@@ -0,0 +1,91 @@
+"""
+Tests du matcher d'exclusions compilé.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.exclusion_matcher import (
+    DEFAULT_CONFIG_FILE,
+    DEFAULT_EXCLUSIONS,
+    ExclusionMatcher,
+    load_exclusions,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+
+class TestExclusionMatcher:
+    """Tests pour ExclusionMatcher."""
+
+    @pytest.fixture
+    def matcher(self) -> ExclusionMatcher:
+        return ExclusionMatcher(DEFAULT_EXCLUSIONS)
+
+    @pytest.mark.parametrize(
+        "rel_path",
+        [
+            "node_modules/pkg/index.js",
+            "src/build/lib/module.py",
+            "pkg.egg-info/PKG-INFO",
+            "notes.bak",
+            "docs/._README.md",
+            ".coverage",
+            "a/b/.git/config",
+        ],
+    )
+    def test_default_exclusions(self, matcher: ExclusionMatcher, rel_path: str):
+        """Les globs de config/default.yaml sont appliqués."""
+        assert matcher.is_excluded(rel_path) is True
+
+    @pytest.mark.parametrize(
+        "rel_path", ["src/main.py", "docs/building.md", "builder/x.py", "envoy.py"]
+    )
+    def test_not_excluded(self, matcher: ExclusionMatcher, rel_path: str):
+        """Les noms proches des exclusions ne sont pas touchés."""
+        assert matcher.is_excluded(rel_path) is False
+
+    def test_directory_and_file_patterns(self):
+        """Dossiers seuls, chemins multi-segments et patterns ancrés."""
+        matcher = ExclusionMatcher(["**/data/archive/**", "/generated", "logs/"])
+
+        assert matcher.match_dir("data/archive", "archive") is True
+        assert matcher.match_dir("x/data/archive", "archive") is True
+        assert matcher.match_dir("archive", "archive") is False
+        assert matcher.match_dir("generated", "generated") is True
+        assert matcher.match_dir("src/generated", "generated") is False
+        assert matcher.match_dir("a/logs", "logs") is True
+        assert matcher.match_file("a/logs", "logs") is False
+
+    def test_default_exclusions_come_from_packaged_config(self):
+        """DEFAULT_EXCLUSIONS est lu depuis le default.yaml livré avec le paquet."""
+        assert DEFAULT_CONFIG_FILE.is_file()
+        assert DEFAULT_EXCLUSIONS == load_exclusions(DEFAULT_CONFIG_FILE)
+        assert "**/build/**" in DEFAULT_EXCLUSIONS
+
+    def test_project_config_extends_defaults(self, tmp_path: Path):
+        """Les exclusions d'une config projet s'ajoutent aux défauts."""
+        config = tmp_path / "project.yaml"
+        config.write_text('exclusions:\n  - "**/blueprints_history/**"\n')
+        (tmp_path / "blueprints_history").mkdir()
+        (tmp_path / "blueprints_history" / "old.py").write_text("")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "gen.py").write_text("")
+        (tmp_path / "app.py").write_text("")
+
+        collector = MetricsCollector(tmp_path, config_file=config)
+
+        assert collector.collect_python_metrics()["files_list"] == ["app.py"]
+
+    def test_shared_matcher(self, tmp_path: Path):
+        """Un matcher compilé peut être partagé entre collecteurs."""
+        matcher = ExclusionMatcher(["**/vendor/**"])
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "lib.py").write_text("")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "gen.py").write_text("")
+
+        collector = MetricsCollector(tmp_path, exclusion_matcher=matcher)
+
+        assert collector.exclusion_matcher is matcher
+        assert collector.collect_python_metrics()["files_list"] == ["build/gen.py"]
@@ -0,0 +1,99 @@
+"""
+Tests du flux de fichiers (MetricsCollector.iter_files).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.file_stream import (
+    FileStreamReducer,
+    StreamedFile,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Projet avec code, tests, documentation et fichiers ignorés."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text('"""Paquet."""\n')
+    (tmp_path / "pkg" / "core.py").write_text("# note\nx = 1\n\ny = 2\n")
+    (tmp_path / "tests" / "test_core.py").write_text("def test_x():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Projet\n")
+    (tmp_path / "data.bin").write_bytes(b"\0")
+    return tmp_path
+
+
+class TestFileStream:
+    """Tests pour iter_files et FileStreamReducer."""
+
+    def test_streams_without_scan(self, project: Path):
+        """Le flux énumère le projet sans construire de parcours en cache."""
+        collector = MetricsCollector(project, sloc=True)
+
+        records = list(collector.iter_files())
+
+        assert collector._scan is None
+        assert [(r.rel_path, r.kind) for r in records] == [
+            ("README.md", "documentation"),
+            ("pkg/__init__.py", "core"),
+            ("pkg/core.py", "core"),
+            ("tests/test_core.py", "test"),
+        ]
+        core = records[2]
+        assert (core.lines, core.sloc["sloc"], core.sloc["comment_lines"]) == (4, 2, 1)
+        assert core.size == (project / "pkg" / "core.py").stat().st_size
+        assert records[0].lines is None
+        assert not any(r.cached for r in records)
+        assert not hasattr(core, "__dict__")
+
+    def test_kinds_chunks_and_analyze(self, project: Path):
+        """Filtre par type, paquets quelconques, lecture facultative."""
+        collector = MetricsCollector(project)
+        full = [r.to_dict() for r in collector.iter_files()]
+
+        assert [r.to_dict() for r in collector.iter_files(chunk_size=1)] == full
+        assert [r.rel_path for r in collector.iter_files(kinds=["test"])] == [
+            "tests/test_core.py"
+        ]
+        assert all(r.lines is None for r in collector.iter_files(analyze=False))
+        with pytest.raises(ValueError):
+            list(collector.iter_files(kinds=["binary"]))
+
+    def test_cached_flag(self, project: Path, tmp_path: Path):
+        """Les fichiers inchangés sont signalés comme servis par le cache."""
+        cache_dir = tmp_path / "cache"
+        first = MetricsCollector(project, cache=True, cache_dir=cache_dir)
+        assert not any(r.cached for r in first.iter_files(kinds=["core"]))
+
+        second = MetricsCollector(project, cache=True, cache_dir=cache_dir)
+        assert all(r.cached for r in second.iter_files(kinds=["core"]))
+
+    def test_collection_is_reduction_of_stream(self, project: Path):
+        """Les sections de collect_all_metrics réduisent le même flux."""
+        collector = MetricsCollector(project)
+        reducer = FileStreamReducer()
+        for record in collector.iter_files():
+            reducer.add(record)
+
+        metrics = collector.collect_all_metrics()
+
+        python = metrics["python_files"]
+        assert {k: python[k] for k in reducer.python_metrics()} == (
+            reducer.python_metrics()
+        )
+        assert metrics["test_metrics"]["test_directories_count"] == 1
+        assert metrics["documentation_metrics"]["documentation_files"] == (
+            reducer.counts["documentation"]
+        )
+
+    def test_reducer_untokenizable_file(self):
+        """Un module non tokenisable compte toutes ses lignes comme du code."""
+        reducer = FileStreamReducer(sloc=True)
+        reducer.add(StreamedFile("a.py", "core", 10, lines=3, sloc=None))
+        reducer.add(StreamedFile("b.md", "documentation", 5))
+
+        assert reducer.python_metrics()["sloc"] == 3
+        assert reducer.counts["documentation"] == 1
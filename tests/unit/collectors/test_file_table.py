@@ -0,0 +1,122 @@
+"""
+Tests de la table en colonnes des fichiers collectés.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.file_table import (
+    FLAG_CORE,
+    FLAG_DOCUMENTATION,
+    FLAG_PYTHON,
+    FLAG_TEST,
+    FileTable,
+    expand_file_lists,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.exporters.interactive_dashboard import (
+    InteractiveDashboardGenerator,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Petit projet avec code, tests et documentation."""
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "core.py").write_text("x = 1\ny = 2\n")
+    (tmp_path / "tests" / "test_core.py").write_text("def test_x():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Projet\n")
+    (tmp_path / "data.bin").write_bytes(b"\0")
+    return tmp_path
+
+
+class TestFileTable:
+    """Tests pour FileTable et expand_file_lists."""
+
+    def test_columns_and_records(self):
+        """Dossiers partagés, noms internés, enregistrements à la demande."""
+        table = FileTable()
+        first = table.add("pkg/__init__.py", 10, FLAG_PYTHON | FLAG_CORE)
+        table.add("pkg/sub/__init__.py", 0, FLAG_PYTHON | FLAG_CORE)
+        table.add("README.md", 5, FLAG_DOCUMENTATION)
+        table.set_lines(first, 3)
+
+        assert table.dirs == ["pkg", "pkg/sub", ""]
+        assert table._names[0] is table._names[1]
+        assert table.paths(FLAG_PYTHON) == ["pkg/__init__.py", "pkg/sub/__init__.py"]
+        assert table.count(FLAG_DOCUMENTATION) == 1
+
+        records = list(table)
+        assert [r.rel_path for r in records][-1] == "README.md"
+        assert (records[0].size, records[0].lines) == (10, 3)
+        assert records[1].lines == -1
+        assert not hasattr(records[0], "__dict__")
+
+    def test_json_round_trip(self):
+        """L'encodage compact se relit à l'identique, via JSON."""
+        table = FileTable()
+        table.add("a/b.py", 7, FLAG_PYTHON | FLAG_TEST)
+        table.set_lines(0, 2)
+        table.add("c.md", 1, FLAG_DOCUMENTATION)
+
+        encoded = json.loads(json.dumps(table.to_json()))
+        assert encoded["lines"] == [2, None]
+        restored = FileTable.from_json(encoded)
+
+        assert restored.paths() == table.paths()
+        assert [r.lines for r in restored] == [2, -1]
+
+        encoded["flags"].pop()
+        with pytest.raises(ValueError):
+            FileTable.from_json(encoded)
+        with pytest.raises(ValueError):
+            FileTable.from_json({"version": 99})
+
+    def test_compact_collection_matches_legacy(self, project: Path):
+        """Le mode compact restitue exactement les listes historiques."""
+        legacy = MetricsCollector(project).collect_all_metrics()
+        compact = MetricsCollector(project, file_lists="compact").collect_all_metrics()
+
+        assert "file_table" not in legacy
+        assert "files_list" not in compact["python_files"]
+        assert "test_files_list" not in compact["test_metrics"]
+        assert "documentation_list" not in compact["documentation_metrics"]
+        assert compact["summary"] == legacy["summary"]
+
+        table = FileTable.from_json(compact["file_table"])
+        assert table.paths(FLAG_TEST | FLAG_CORE) == table.paths(FLAG_PYTHON)
+        assert set(table.paths(FLAG_CORE)) == {
+            "pkg/__init__.py",
+            "pkg/core.py",
+            "pkg/sub/__init__.py",
+        }
+        assert "data.bin" not in table.paths()
+        lines = {r.rel_path: r.lines for r in table}
+        assert lines["pkg/core.py"] == 2
+        assert lines["README.md"] == -1
+
+        expand_file_lists(compact)
+        for section, key in (
+            ("python_files", "files_list"),
+            ("test_metrics", "test_files_list"),
+            ("documentation_metrics", "documentation_list"),
+        ):
+            assert compact[section][key] == legacy[section][key]
+
+    def test_dashboard_reads_compact_table(self, project: Path):
+        """Le tableau des fichiers du dashboard lit la table compacte."""
+        compact = MetricsCollector(project, file_lists="compact").collect_all_metrics()
+
+        html = InteractiveDashboardGenerator._generate_files_table(compact)
+
+        assert "pkg/core.py" in html
+
+    def test_unknown_mode(self, project: Path):
+        """Un encodage inconnu est refusé."""
+        with pytest.raises(ValueError):
+            MetricsCollector(project, file_lists="columnar")
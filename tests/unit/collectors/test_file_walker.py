@@ -0,0 +1,204 @@
+"""
+Tests du moteur de parcours unique.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from arkalia_metrics_collector.collectors.file_walker import FileWalker
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.instrumentation import start_tracing, stop_tracing
+
+
+class TestFileWalker:
+    """Tests pour FileWalker et le partage du parcours."""
+
+    def test_walk_is_sorted_and_relative(self, tmp_path: Path):
+        """Les entrées sont relatives à la racine et dans un ordre stable."""
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "z.py").write_text("")
+        (tmp_path / "a.md").write_text("")
+        (tmp_path / "c.py").write_text("")
+
+        rel_paths = [entry.rel_path for entry in FileWalker(tmp_path).walk()]
+
+        assert rel_paths == ["a.md", "c.py", "b/z.py"]
+
+    def test_scan_classifies_each_entry_once(self, tmp_path: Path):
+        """Un fichier peut appartenir à plusieurs catégories."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_x.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        scan = FileWalker(tmp_path).scan(
+            {
+                "python": lambda e: e.suffix == ".py",
+                "test": lambda e: "tests" in e.parts,
+                "documentation": lambda e: e.suffix == ".md",
+            }
+        )
+
+        assert scan.total_files == 2
+        assert [e.rel_path for e in scan.get("python")] == ["tests/test_x.py"]
+        assert [e.rel_path for e in scan.get("test")] == ["tests/test_x.py"]
+        assert [e.rel_path for e in scan.get("documentation")] == ["README.md"]
+        assert scan.get("unknown") == []
+
+    def test_collector_walks_project_once(self, temp_project_dir: Path):
+        """Toutes les méthodes collect_* réutilisent le même parcours."""
+        collector = MetricsCollector(temp_project_dir)
+
+        with patch.object(
+            FileWalker, "walk", autospec=True, side_effect=FileWalker.walk
+        ) as mock_walk:
+            collector.collect_python_metrics()
+            collector.collect_documentation_metrics()
+            collector._count_test_files_manually()
+
+        assert mock_walk.call_count == 1
+
+    def test_refresh_forces_new_walk(self, tmp_path: Path):
+        """refresh() prend en compte les fichiers créés après le parcours."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        collector = MetricsCollector(tmp_path)
+        assert collector.collect_python_metrics()["count"] == 1
+
+        (tmp_path / "b.py").write_text("y = 2\n")
+        assert collector.collect_python_metrics()["count"] == 1
+
+        collector.refresh()
+        assert collector.collect_python_metrics()["count"] == 2
+
+    def test_excluded_directories_are_pruned(self, tmp_path: Path):
+        """Le contenu des dossiers exclus n'est jamais énuméré."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "README.md").write_text("")
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "site.py").write_text("")
+        (tmp_path / "main.py").write_text("")
+
+        collector = MetricsCollector(tmp_path)
+        with patch(
+            "arkalia_metrics_collector.collectors.file_walker.os.scandir",
+            wraps=os.scandir,
+        ) as mock_scandir:
+            scan = collector.scan_project()
+
+        scanned = {Path(call.args[0]).name for call in mock_scandir.call_args_list}
+        assert "node_modules" not in scanned
+        assert ".venv" not in scanned
+        assert scan.pruned_dirs == 2
+        assert [e.rel_path for e in scan.get("python")] == ["main.py"]
+        assert scan.get("documentation") == []
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git non disponible")
+class TestGitEnumeration:
+    """Tests du moteur d'énumération basé sur git ls-files."""
+
+    @pytest.fixture
+    def git_project(self, tmp_path: Path) -> Path:
+        _git(tmp_path, "init", "-q")
+        (tmp_path / ".gitignore").write_text("generated/\n")
+        (tmp_path / "generated").mkdir()
+        (tmp_path / "generated" / "out.py").write_text("")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "core.py").write_text("x = 1\n")
+        (tmp_path / "pkg" / "old.py").write_text("")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "lib.py").write_text("")
+        (tmp_path / "README.md").write_text("# Projet\n")
+        _git(tmp_path, "add", "-A")
+        (tmp_path / "pkg" / "old.py").unlink()
+        (tmp_path / "untracked.py").write_text("")
+        return tmp_path
+
+    def test_git_backend_matches_filesystem(self, git_project: Path):
+        """Les deux moteurs produisent les mêmes fichiers, dans le même ordre."""
+        git_scan = MetricsCollector(git_project, enumeration="git").scan_project()
+        (git_project / "generated" / "out.py").unlink()
+        fs_scan = MetricsCollector(git_project, enumeration="filesystem").scan_project()
+
+        assert git_scan.backend == "git"
+        assert fs_scan.backend == "filesystem"
+        assert [e.rel_path for e in git_scan.get("python")] == [
+            "untracked.py",
+            "pkg/core.py",
+        ]
+        assert [e.rel_path for e in git_scan.get("python")] == [
+            e.rel_path for e in fs_scan.get("python")
+        ]
+
+    def test_submodules_are_not_files(self, git_project: Path, tmp_path_factory):
+        """Sous-modules et dépôts imbriqués non suivis ne sont pas listés."""
+        library = tmp_path_factory.mktemp("library")
+        _git(library, "init", "-q")
+        (library / "lib.py").write_text("")
+        _git(library, "add", "-A")
+        _git(
+            library, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "lib"
+        )
+        _git(
+            git_project,
+            "-c",
+            "protocol.file.allow=always",
+            "submodule",
+            "add",
+            "-q",
+            str(library),
+            "vendor/library",
+        )
+        (git_project / "nested").mkdir()
+        _git(git_project / "nested", "init", "-q")
+        (git_project / "nested" / "tool.py").write_text("")
+
+        scan = MetricsCollector(git_project, enumeration="git").scan_project()
+
+        assert scan.backend == "git"
+        assert "vendor/library" not in scan.paths
+        assert not any(path.endswith("/") for path in scan.paths)
+        assert [e.rel_path for e in scan.get("python")] == [
+            "untracked.py",
+            "pkg/core.py",
+        ]
+
+    def test_auto_reports_backend(self, git_project: Path):
+        """collection_info indique le moteur utilisé et sa durée."""
+        metrics = MetricsCollector(git_project).collect_all_metrics()
+
+        enumeration = metrics["collection_info"]["file_enumeration"]
+        assert enumeration["backend"] == "git"
+        assert enumeration["duration_seconds"] >= 0
+        assert metrics["python_files"]["count"] == 2
+
+    def test_git_listing_is_traced(self, git_project: Path):
+        """La lecture de git ls-files figure dans la trace (--trace)."""
+        tracer = start_tracing()
+        try:
+            MetricsCollector(git_project, enumeration="git").scan_project()
+        finally:
+            stop_tracing()
+
+        listings = [s for s in tracer.spans if s["name"] == "git ls-files"]
+        assert listings
+        assert all(s["cat"] == "subprocess" for s in listings)
+        assert all(s["args"]["returncode"] == 0 for s in listings)
+
+    def test_fallback_without_git(self, git_project: Path):
+        """Sans exécutable git, le parcours système de fichiers prend le relais."""
+        with patch(
+            "arkalia_metrics_collector.collectors.file_walker.subprocess.run",
+            side_effect=FileNotFoundError("git"),
+        ):
+            scan = MetricsCollector(git_project).scan_project()
+
+        assert scan.backend == "filesystem"
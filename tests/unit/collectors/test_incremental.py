@@ -0,0 +1,133 @@
+"""
+Tests de la collecte incrémentale basée sur git diff.
+"""
+
+import shutil
+import subprocess  # nosec B404
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.incremental import (
+    CollectionSnapshot,
+    git_changed_paths,
+    git_head,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git absent")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(  # nosec B603 B607
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Dépôt Git avec un commit initial."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "core.py").write_text("a = 1\nb = 2\n")
+    (tmp_path / "pkg" / "util.py").write_text("c = 3\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_core.py").write_text("def test_a():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Projet\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _collect(root: Path, **kwargs) -> dict:
+    full = kwargs.pop("full", False)
+    collector = MetricsCollector(root, incremental=True, **kwargs)
+    return collector.collect_all_metrics(full=full)
+
+
+def _comparable(metrics: dict) -> tuple:
+    return (
+        metrics["python_files"],
+        metrics["test_metrics"]["test_files_list"],
+        metrics["documentation_metrics"],
+        metrics["collection_info"]["file_enumeration"]["files"],
+    )
+
+
+class TestIncrementalCollection:
+    """Tests pour la collecte incrémentale."""
+
+    def test_first_run_is_full_and_writes_snapshot(self, repo: Path):
+        """Sans instantané, la collecte est complète puis enregistrée."""
+        metrics = _collect(repo)
+
+        info = metrics["collection_info"]["incremental"]
+        assert info["mode"] == "full"
+        assert info["reason"] == "no_snapshot"
+        snapshot = CollectionSnapshot.load(repo / ".arkalia_cache" / "snapshot.json")
+        assert snapshot is not None
+        assert snapshot.head == git_head(repo)
+        # Répartition SLOC non demandée : seules les lignes sont analysées
+        assert snapshot.analyses["pkg/core.py"] == {"lines": 2}
+
+    def test_incremental_matches_full_collection(self, repo: Path):
+        """Commits, modifications, ajouts et suppressions sont répercutés."""
+        _collect(repo)
+
+        (repo / "pkg" / "util.py").write_text("c = 3\nd = 4\ne = 5\n")
+        (repo / "pkg" / "new.py").write_text("x = 1\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "change")
+        (repo / "README.md").unlink()
+        (repo / "notes.txt").write_text("brouillon\n")
+        (repo / "tests" / "test_util.py").write_text("def test_u():\n    pass\n")
+
+        incremental = _collect(repo)
+        full = MetricsCollector(repo).collect_all_metrics()
+
+        info = incremental["collection_info"]["incremental"]
+        assert info["mode"] == "incremental"
+        assert info["changed_paths"] == 5
+        assert incremental["collection_info"]["file_enumeration"]["backend"] == "paths"
+        assert _comparable(incremental) == _comparable(full)
+        assert incremental["python_files"]["total_lines"] == 10
+
+    def test_full_flag_and_reconciliation(self, repo: Path):
+        """--full et la réconciliation périodique imposent un run complet."""
+        _collect(repo)
+
+        assert (
+            _collect(repo, full=True)["collection_info"]["incremental"]["reason"]
+            == "forced"
+        )
+        assert (
+            _collect(repo, full_every=1)["collection_info"]["incremental"]["mode"]
+            == "incremental"
+        )
+        reconciled = _collect(repo, full_every=1)["collection_info"]["incremental"]
+        assert reconciled["reason"] == "reconciliation"
+
+    def test_unknown_base_falls_back_to_full(self, repo: Path):
+        """Un commit de référence disparu (rebase) déclenche un run complet."""
+        _collect(repo)
+        path = repo / ".arkalia_cache" / "snapshot.json"
+        snapshot = CollectionSnapshot.load(path)
+        assert snapshot is not None
+        snapshot.head = "0" * 40
+        snapshot.save(path)
+
+        assert git_changed_paths(repo, "0" * 40) is None
+        info = _collect(repo)["collection_info"]["incremental"]
+        assert info["reason"] == "diff_failed"
+
+    def test_not_a_git_repository(self, tmp_path: Path):
+        """Hors dépôt Git, la collecte reste complète et sans instantané."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+
+        info = _collect(tmp_path)["collection_info"]["incremental"]
+
+        assert info["reason"] == "not_git"
+        assert not (tmp_path / ".arkalia_cache" / "snapshot.json").exists()
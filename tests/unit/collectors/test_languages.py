@@ -0,0 +1,91 @@
+"""
+Tests de la détection des langages et de la section languages.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors import file_analysis
+from arkalia_metrics_collector.collectors.languages import (
+    language_for_name,
+    shebang_language,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Projet multi-langage."""
+    (tmp_path / "app.py").write_text("a = 1\nb = 2\n")
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / "main.ts").write_text("const a = 1;\nexport { a };\n\n")
+    (tmp_path / "web" / "view.TSX").write_text("<div />\n")
+    (tmp_path / "db.sql").write_text("SELECT 1;\n")
+    (tmp_path / "deploy").write_text("#!/usr/bin/env bash\nset -e\necho ok\n")
+    (tmp_path / "tool").write_text("#!/usr/bin/python3.11\nprint(1)\n")
+    (tmp_path / "Makefile").write_text("all:\n\ttrue\n")
+    (tmp_path / "LICENSE").write_text("MIT\n")
+    (tmp_path / "blob").write_bytes(b"\x00\x01")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+class TestLanguages:
+    """Tests pour languages et collect_language_metrics."""
+
+    def test_detection(self):
+        """Extension, nom de fichier et shebang."""
+        assert language_for_name("index.ts", ".ts") == "TypeScript"
+        assert language_for_name("Makefile", "") == "Makefile"
+        assert language_for_name("notes", "") is None
+        assert shebang_language(b"#!/bin/sh\n") == "Shell"
+        assert shebang_language(b"#!/usr/bin/env -S python3 -u\nx") == "Python"
+        assert shebang_language(b"#!/usr/bin/env FOO=1 node\n") == "JavaScript"
+        assert shebang_language(b"#!/opt/unknown\n") is None
+        assert shebang_language(b"MIT License\n") is None
+
+    def test_languages_section(self, project: Path):
+        """Fichiers et lignes par langage, triés par lignes."""
+        metrics = MetricsCollector(project, languages=True).collect_all_metrics()
+        languages = metrics["languages"]
+
+        assert languages["Python"] == {"files": 2, "lines": 4}
+        assert languages["TypeScript"] == {"files": 2, "lines": 4}
+        assert languages["Shell"] == {"files": 1, "lines": 3}
+        assert languages["SQL"] == {"files": 1, "lines": 1}
+        assert languages["Makefile"] == {"files": 1, "lines": 2}
+        assert list(languages)[0] in ("Python", "TypeScript")
+        assert sum(info["files"] for info in languages.values()) == 7
+        assert metrics["collection_info"]["phases"]["languages"]["status"] == "ok"
+
+    def test_languages_are_opt_in(self, project: Path, monkeypatch):
+        """Sans l'option, aucun fichier non .py n'est lu."""
+        seen: list[str] = []
+        original = file_analysis.ANALYZERS["lines"]
+
+        def spy(path, counter):
+            seen.append(Path(path).name)
+            return original(path, counter)
+
+        monkeypatch.setitem(file_analysis.ANALYZERS, "lines", spy)
+        metrics = MetricsCollector(project).collect_all_metrics()
+
+        assert "languages" not in metrics
+        assert "languages" not in metrics["collection_info"]["phases"]
+        assert all(name.endswith(".py") for name in seen)
+
+    def test_python_modules_not_reread(self, project: Path, monkeypatch):
+        """Les modules .py ne sont lus que par la phase Python."""
+        seen: list[str] = []
+        original = file_analysis.ANALYZERS["lines"]
+
+        def spy(path, counter):
+            seen.append(Path(path).name)
+            return original(path, counter)
+
+        monkeypatch.setitem(file_analysis.ANALYZERS, "lines", spy)
+        MetricsCollector(project).collect_language_metrics()
+
+        assert seen.count("app.py") == 1
+        assert "LICENSE" not in seen and "blob" not in seen
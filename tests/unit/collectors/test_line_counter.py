@@ -0,0 +1,48 @@
+"""
+Tests du compteur de lignes binaire.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.line_counter import LineCounter, count_lines
+
+
+class TestLineCounter:
+    """Tests pour LineCounter."""
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (b"", 0),
+            (b"\n", 1),
+            (b"a\nb\n", 2),
+            (b"a\nb", 2),
+            (b"a\r\nb\r\n", 2),
+            (b"caf\xe9\n\xff\xfe\n", 2),
+        ],
+    )
+    def test_matches_readlines(self, tmp_path: Path, content: bytes, expected: int):
+        """Même résultat que readlines(), sans dépendre de l'encodage."""
+        path = tmp_path / "f.py"
+        path.write_bytes(content)
+
+        assert count_lines(path) == expected
+
+    def test_buffer_boundaries_and_reuse(self, tmp_path: Path):
+        """Le tampon réutilisé gère les lignes à cheval sur deux lectures."""
+        counter = LineCounter(buffer_size=7)
+        first = tmp_path / "first.py"
+        first.write_bytes(b"line\n" * 100 + b"tail")
+        second = tmp_path / "second.py"
+        second.write_bytes(b"x\n" * 3)
+
+        assert counter.count_file(first) == 101
+        assert counter.count_file(second) == 3
+        assert counter.bytes_read == 504 + 6
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        """Un fichier absent lève OSError (ignoré par le collecteur)."""
+        with pytest.raises(OSError):
+            count_lines(tmp_path / "absent.py")
@@ -0,0 +1,99 @@
+"""
+Tests du cache persistant des métriques par fichier.
+"""
+
+import os
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors.metrics_cache import (
+    FileMetricsCache,
+    stat_signature,
+)
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+
+
+def _make_project(root: Path) -> None:
+    """Crée un petit projet Python."""
+    (root / "pkg").mkdir()
+    (root / "pkg" / "a.py").write_text("a = 1\nb = 2\n")
+    (root / "pkg" / "b.py").write_text("c = 3\n")
+    (root / "main.py").write_text("print('ok')\n")
+
+
+class TestFileMetricsCache:
+    """Tests pour FileMetricsCache et son intégration au collecteur."""
+
+    def test_roundtrip_and_signature_check(self, tmp_path: Path):
+        """Une entrée n'est servie que si la signature est identique."""
+        cache = FileMetricsCache(tmp_path / "cache")
+        cache.put("a.py", (10, 1, 2), {"lines": 3})
+        cache.commit()
+
+        reopened = FileMetricsCache(tmp_path / "cache")
+
+        assert reopened.get("a.py", (10, 1, 2)) == {"lines": 3}
+        assert reopened.get("a.py", (11, 1, 2)) is None
+        assert reopened.get("a.py", None) is None
+
+    def test_stat_signature(self, tmp_path: Path):
+        """La signature combine taille, mtime_ns et inode."""
+        path = tmp_path / "f.py"
+        path.write_text("x\n")
+        st = os.stat(path)
+
+        assert stat_signature(st) == (2, st.st_mtime_ns, st.st_ino)
+        assert stat_signature(None) is None
+
+    def test_second_run_hits_cache(self, tmp_path: Path):
+        """Un second run ne relit aucun fichier inchangé."""
+        _make_project(tmp_path)
+
+        first = MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+        second = MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+
+        assert first["collection_info"]["cache"]["misses"] == 3
+        assert second["collection_info"]["cache"]["hits"] == 3
+        assert second["collection_info"]["cache"]["misses"] == 0
+        assert second["python_files"] == first["python_files"]
+        # Le dossier du cache n'est jamais compté comme fichier du projet
+        assert not any(
+            ".arkalia_cache" in f
+            for f in second["documentation_metrics"]["documentation_list"]
+        )
+
+    def test_modified_file_is_reanalyzed(self, tmp_path: Path):
+        """Un fichier modifié est relu, les autres restent en cache."""
+        _make_project(tmp_path)
+        MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+
+        target = tmp_path / "pkg" / "b.py"
+        target.write_text("c = 3\nd = 4\ne = 5\n")
+        st = target.stat()
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        metrics = MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+
+        assert metrics["collection_info"]["cache"]["hits"] == 2
+        assert metrics["collection_info"]["cache"]["misses"] == 1
+        assert metrics["python_files"]["total_lines"] == 6
+
+    def test_deleted_file_is_pruned(self, tmp_path: Path):
+        """Les entrées des fichiers supprimés sont retirées du cache."""
+        _make_project(tmp_path)
+        MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+
+        (tmp_path / "main.py").unlink()
+        metrics = MetricsCollector(tmp_path, cache=True).collect_all_metrics()
+
+        assert metrics["collection_info"]["cache"]["deleted"] == 1
+        cache = FileMetricsCache(tmp_path / ".arkalia_cache")
+        assert sorted(cache._entries) == ["pkg/a.py", "pkg/b.py"]
+
+    def test_cache_disabled_by_default(self, tmp_path: Path):
+        """Sans cache=True, aucun dossier de cache n'est créé."""
+        _make_project(tmp_path)
+
+        metrics = MetricsCollector(tmp_path).collect_all_metrics()
+
+        assert metrics["collection_info"]["cache"] == {"enabled": False}
+        assert not (tmp_path / ".arkalia_cache").exists()
@@ -2,6 +2,7 @@
 Tests professionnels avec fixtures et mocks.
 """
 
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -135,6 +136,21 @@ class TestMetricsCollector:
             test_count = collector._collect_pytest_tests()
             assert test_count >= 1  # Au moins le fichier test_main.py
 
+    def test_collect_pytest_tests_verbose_addopts(self, tmp_path: Path):
+        """Un --verbose dans les addopts du projet ne fausse pas le comptage."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.pytest.ini_options]\naddopts = ["--verbose"]\n'
+        )
+        (tmp_path / "test_sample.py").write_text(
+            "import pytest\n\n\n"
+            "@pytest.mark.parametrize('n', [1, 2, 3])\n"
+            "def test_param(n):\n    assert n\n\n\n"
+            "def test_plain():\n    pass\n"
+        )
+        collector = MetricsCollector(tmp_path, test_python=sys.executable)
+
+        assert collector._collect_pytest_tests() == 4
+
     def test_count_test_files_manually(self, temp_project_dir: Path):
         """Test du comptage manuel des fichiers de test."""
         collector = MetricsCollector(temp_project_dir)
@@ -0,0 +1,184 @@
+"""
+Tests de l'exécution concurrente des phases de collecte.
+"""
+
+import subprocess  # nosec B404
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors import file_analysis
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.phases import (
+    Phase,
+    check_cancelled,
+    publishing,
+    run_phases,
+)
+
+
+def _wait_phase_threads(timeout: float = 5) -> None:
+    """Attend la fin des threads de phases abandonnés."""
+    end = time.monotonic() + timeout
+    while any(t.name.startswith("arkalia-phase") for t in threading.enumerate()):
+        assert time.monotonic() < end, "phase hors délai jamais interrompue"
+        time.sleep(0.01)
+
+
+class TestPhaseScheduler:
+    """Tests pour run_phases et son utilisation par MetricsCollector."""
+
+    def test_phases_overlap_and_keep_order(self):
+        """Les phases tournent ensemble ; sous-processus démarrés d'abord."""
+        started: list[str] = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def phase(name: str):
+            def run() -> str:
+                started.append(name)
+                barrier.wait()
+                return name
+
+            return run
+
+        results = run_phases(
+            [Phase("cpu", phase("cpu")), Phase("wait", phase("wait"), "subprocess")]
+        )
+
+        assert list(results) == ["cpu", "wait"]
+        assert [r.value for r in results.values()] == ["cpu", "wait"]
+        assert started[0] == "wait"
+
+    def test_failure_and_timeout_keep_partial_results(self):
+        """Phase en échec ou hors délai : valeur par défaut, autres conservées."""
+        release = threading.Event()
+
+        def fail() -> int:
+            raise RuntimeError("boom")
+
+        results = run_phases(
+            [
+                Phase("ok", lambda: 1),
+                Phase("failed", fail, default=-1),
+                Phase("slow", lambda: release.wait(5), timeout=0.05, default=0),
+            ]
+        )
+        release.set()
+
+        assert results["ok"].to_dict()["status"] == "ok"
+        assert results["ok"].value == 1
+        assert (results["failed"].status, results["failed"].value) == ("failed", -1)
+        assert results["failed"].error == "boom"
+        assert (results["slow"].status, results["slow"].value) == ("timeout", 0)
+
+    def test_timed_out_phase_is_cancelled(self):
+        """Une phase hors délai s'arrête au point d'arrêt et ne publie rien."""
+        published: list[int] = []
+        daemons: list[bool] = []
+
+        def slow() -> int:
+            daemons.append(threading.current_thread().daemon)
+            for step in range(500):
+                check_cancelled()
+                time.sleep(0.01)
+                with publishing():
+                    published.append(step)
+            return len(published)
+
+        results = run_phases(
+            [Phase("ok", lambda: 1), Phase("slow", slow, timeout=0.05, default=0)]
+        )
+        seen = len(published)
+        _wait_phase_threads()
+
+        assert (results["slow"].status, results["slow"].value) == ("timeout", 0)
+        assert daemons == [True]
+        # Au plus une publication en cours au moment de l'annulation
+        assert len(published) <= seen + 1 < 50
+
+    def test_sequential_mode(self):
+        """concurrent=False exécute tout dans le thread appelant."""
+        threads: set[int] = set()
+
+        def phase() -> None:
+            threads.add(threading.get_ident())
+
+        run_phases([Phase("a", phase), Phase("b", phase)], concurrent=False)
+
+        assert threads == {threading.get_ident()}
+
+    def test_pytest_phase_overlaps_scan(self, tmp_path: Path, monkeypatch):
+        """Le sous-processus pytest recouvre l'analyse ; délai respecté."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "test_app.py").write_text("def test_a():\n    pass\n")
+        real_run = subprocess.run
+
+        def slow_pytest(args, **kwargs):
+            if "pytest" not in args:
+                return real_run(args, **kwargs)
+            time.sleep(1)
+            return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+        monkeypatch.setattr(subprocess, "run", slow_pytest)
+        collector = MetricsCollector(
+            tmp_path, test_counter="pytest", phase_timeouts={"tests": 0.1}
+        )
+
+        start = time.perf_counter()
+        metrics = collector.collect_all_metrics()
+
+        assert time.perf_counter() - start < 0.9
+        phases = metrics["collection_info"]["phases"]
+        assert phases["tests"]["status"] == "timeout"
+        assert phases["python"]["status"] == "ok"
+        assert metrics["python_files"]["total_lines"] == 3
+        assert metrics["test_metrics"]["collected_tests_count"] == 0
+        assert metrics["test_metrics"]["test_files_count"] == 1
+        assert metrics["test_metrics"]["incomplete"] is True
+        assert metrics["summary"]["incomplete_fields"] == ["collected_tests"]
+
+    def test_unknown_phase_timeout(self, tmp_path: Path):
+        """Un délai pour une phase inconnue est refusé."""
+        with pytest.raises(ValueError, match="Phases inconnues"):
+            MetricsCollector(tmp_path, phase_timeouts={"lint": 1.0})
+
+    def test_timed_out_phase_does_not_change_later_results(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Les résultats tardifs d'une phase hors délai sont écartés."""
+        project = tmp_path / "project"
+        (project / "pkg").mkdir(parents=True)
+        for i in range(40):
+            (project / "pkg" / f"m{i}.py").write_text("x = 1\n" * (i + 1))
+        count_lines = file_analysis.ANALYZERS["lines"]
+
+        def slow_lines(path, counter):
+            time.sleep(0.02)
+            return count_lines(path, counter)
+
+        monkeypatch.setitem(file_analysis.ANALYZERS, "lines", slow_lines)
+        collector = MetricsCollector(
+            project,
+            cache=True,
+            cache_dir=tmp_path / "cache",
+            phase_timeouts={"python": 0.1},
+        )
+        start = time.perf_counter()
+        timed_out = collector.collect_all_metrics()
+
+        assert time.perf_counter() - start < 0.6
+        assert timed_out["collection_info"]["phases"]["python"]["status"] == "timeout"
+        assert "directories" not in timed_out
+        _wait_phase_threads()
+        assert collector._rollup is None
+
+        monkeypatch.setitem(file_analysis.ANALYZERS, "lines", count_lines)
+        collector.phase_timeouts = {}
+        later = collector.collect_all_metrics()
+        fresh = MetricsCollector(project).collect_all_metrics()
+
+        assert later["python_files"] == fresh["python_files"]
+        assert later["directories"] == fresh["directories"]
+        assert later["summary"] == fresh["summary"]
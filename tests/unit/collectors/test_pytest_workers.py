@@ -0,0 +1,154 @@
+"""
+Tests du pool persistant de workers pytest.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors import pytest_workers
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.pytest_workers import (
+    PytestWorkerPool,
+    detect_project_python,
+)
+from arkalia_metrics_collector.instrumentation import hooks
+
+GENERATED_TESTS = """
+def pytest_generate_tests(metafunc):
+    if "n" in metafunc.fixturenames:
+        metafunc.parametrize("n", range(4))
+
+
+def test_generated(n):
+    pass
+
+
+def test_plain():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Projet dont une partie des tests est générée dynamiquement."""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_dynamic.py").write_text(GENERATED_TESTS)
+    (tmp_path / "tests" / "test_broken.py").write_text(
+        "import missing_dependency\n\ndef test_a():\n    pass\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def pool():
+    workers = PytestWorkerPool()
+    yield workers
+    workers.close()
+
+
+class TestPytestWorkers:
+    """Tests pour PytestWorkerPool et le moteur pytest-pool."""
+
+    def test_exact_counts_per_file(self, project: Path, pool: PytestWorkerPool):
+        """Comptes exacts par fichier ; échec de collecte signalé par None."""
+        counts = pool.collect(
+            sys.executable,
+            project,
+            ["tests/test_dynamic.py", "tests/test_broken.py"],
+            jobs=2,
+        )
+
+        assert counts == {"tests/test_dynamic.py": 5, "tests/test_broken.py": None}
+
+    def test_worker_is_reused_and_sees_changes(
+        self, project: Path, pool: PytestWorkerPool
+    ):
+        """Le même worker resert et relit les modules modifiés."""
+        files = ["tests/test_dynamic.py"]
+        pool.collect(sys.executable, project, files)
+        worker = pool._workers[sys.executable][0]
+
+        (project / "tests" / "test_dynamic.py").write_text(
+            "def test_only():\n    pass\n"
+        )
+        counts = pool.collect(sys.executable, project, files)
+
+        assert pool._workers[sys.executable][0] is worker
+        assert counts == {"tests/test_dynamic.py": 1}
+
+    def test_worker_lifetime_emits_on_subprocess(self, project: Path):
+        """L'arrêt d'un worker émet on_subprocess une seule fois."""
+        received: list[dict] = []
+
+        def hook(**kwargs) -> None:
+            received.append(kwargs)
+
+        hooks.register("on_subprocess", hook)
+        try:
+            worker = pytest_workers.PytestWorker(sys.executable)
+            assert "counts" in worker.collect(str(project), ["tests/test_dynamic.py"])
+            assert received == []
+            worker.close()
+            worker.close()
+        finally:
+            hooks.unregister("on_subprocess", hook)
+
+        (event,) = received
+        assert event["command"][0] == sys.executable
+        assert event["returncode"] is not None and event["seconds"] > 0
+
+    def test_collector_uses_cache(self, project: Path, pool, monkeypatch):
+        """Second run servi par le cache ; repli statique pour les échecs."""
+        monkeypatch.setattr(pytest_workers, "_shared_pool", pool)
+
+        first = MetricsCollector(project, test_counter="pytest-pool")
+        assert first.collect_test_metrics()["collected_tests_count"] == 6
+
+        def no_collect(*args, **kwargs):
+            raise AssertionError("aucune recollecte attendue")
+
+        monkeypatch.setattr(pool, "collect", no_collect)
+        # Le module en échec n'est pas mis en cache : seul lui est réanalysé
+        (project / "tests" / "test_broken.py").unlink()
+        second = MetricsCollector(project, test_counter="pytest-pool")
+
+        assert second.collect_test_metrics()["collected_tests_count"] == 5
+
+    def test_project_addopts(self, project: Path, pool, monkeypatch):
+        """--cache-clear est accepté ; un lot en erreur d'usage n'est pas mis
+        en cache et passe par l'analyse statique."""
+        monkeypatch.setattr(pytest_workers, "_shared_pool", pool)
+        config = project / "pyproject.toml"
+        config.write_text('[tool.pytest.ini_options]\naddopts = ["--cache-clear"]\n')
+
+        counts = pool.collect(sys.executable, project, ["tests/test_dynamic.py"])
+        assert counts == {"tests/test_dynamic.py": 5}
+
+        config.write_text('[tool.pytest.ini_options]\naddopts = ["--unknown-opt"]\n')
+        counts = pool.collect(sys.executable, project, ["tests/test_dynamic.py"])
+        assert counts == {"tests/test_dynamic.py": None}
+
+        calls = []
+        collect = pool.collect
+        monkeypatch.setattr(
+            pool, "collect", lambda *a, **k: calls.append(a[2]) or collect(*a, **k)
+        )
+        for _ in range(2):
+            collector = MetricsCollector(project, test_counter="pytest-pool")
+            # Comptes statiques : fonctions de test de chaque module (2 + 1)
+            assert collector.collect_test_metrics()["collected_tests_count"] == 3
+        # Rien n'a été mis en cache : le second run recollecte tout
+        assert len(calls) == 2 and calls[0] == calls[1]
+
+    def test_detect_project_python(self, tmp_path: Path):
+        """Le virtualenv du projet est préféré à l'interpréteur courant."""
+        assert detect_project_python(tmp_path) == sys.executable
+
+        venv_python = tmp_path / ".venv" / "bin" / "python"
+        venv_python.parent.mkdir(parents=True)
+        venv_python.write_text("")
+        venv_python.chmod(0o755)
+
+        assert detect_project_python(tmp_path) == str(venv_python)
@@ -0,0 +1,125 @@
+"""
+Tests de la collecte bornée par échantillonnage stratifié.
+"""
+
+import random
+import threading
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.sampling import (
+    StratifiedEstimator,
+    sample_order,
+    size_bucket,
+    stratum_key,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Projet de 200 modules de tailles variées sur deux dossiers."""
+    for package in ("alpha", "beta"):
+        (tmp_path / package).mkdir()
+        for i in range(100):
+            body = "".join(f"x{n} = {n}  # valeur\n" for n in range(1 + i % 17))
+            (tmp_path / package / f"mod_{i}.py").write_text(f'"""Doc."""\n\n{body}')
+    return tmp_path
+
+
+class TestSampling:
+    """Tests pour sampling et l'option deadline de MetricsCollector."""
+
+    def test_strata_and_order(self):
+        """Chaque strate est couverte avant le reste de l'échantillon."""
+        assert [size_bucket(s) for s in (0, 1, 3, 4, 15, 16)] == [0, 1, 1, 2, 2, 3]
+        assert stratum_key("src/pkg/a.py", 100) == ("src", 4)
+        assert stratum_key("setup.py", 100) == ("", 4)
+
+        strata = {"a": list(range(10)), "b": [10, 11], "c": [12]}
+        order = sample_order(strata, random.Random(0))
+
+        assert sorted(order) == list(range(13))
+        assert {0 if i < 10 else 1 if i < 12 else 2 for i in order[:3]} == {0, 1, 2}
+        assert order == sample_order(strata, random.Random(0))
+
+    def test_estimator_interval(self):
+        """Estimation exacte sur un recensement, intervalle sinon."""
+        estimator = StratifiedEstimator(("lines",))
+        for value in (10, 20, 30, 40):
+            estimator.add_population("a", value)
+        estimator.add_population("b", 50)
+        estimator.add_sample("a", {"lines": 10}, 10)
+        estimator.add_sample("a", {"lines": 30}, 30)
+
+        partial = estimator.estimate("lines")
+        # Strate a : 4 × 20 ; strate b extrapolée à 1 ligne par octet
+        assert partial["value"] == 130
+        assert 40 <= partial["low"] < partial["value"] < partial["high"]
+
+        for value in (20, 40):
+            estimator.add_sample("a", {"lines": value}, value)
+        estimator.add_sample("b", {"lines": 7}, 50)
+        census = estimator.estimate("lines")
+        assert census == {"value": 107, "low": 107, "high": 107, "stderr": 0.0}
+
+    def test_deadline_collection(self, project: Path):
+        """Une collecte bornée estime les lignes et l'annonce."""
+        exact = MetricsCollector(project, sloc=True).collect_all_metrics()
+        metrics = MetricsCollector(
+            project, sloc=True, languages=True, deadline=1e-6, sample_seed=7
+        ).collect_all_metrics()
+
+        sampling = metrics["collection_info"]["sampling"]
+        assert sampling["population_files"] == 200
+        assert sampling["sampled_files"] < 200
+        assert not sampling["complete"]
+        python = metrics["python_files"]
+        assert python["count"] == exact["python_files"]["count"]
+        interval = python["estimates"]["total_lines"]
+        assert interval["low"] <= python["total_lines"] <= interval["high"]
+        assert metrics["summary"]["lines_of_code"] == python["total_lines"]
+        assert "sloc" in metrics["summary"]["estimated_fields"]
+        assert metrics["languages"]["Python"]["estimated"] is True
+        assert "directories" not in metrics
+
+        # Un délai confortable analyse tout : valeurs exactes, sans estimation
+        generous = MetricsCollector(
+            project, sloc=True, deadline=60
+        ).collect_all_metrics()
+        assert generous["collection_info"]["sampling"]["complete"]
+        assert "estimates" not in generous["python_files"]
+        assert generous["python_files"]["total_lines"] == (
+            exact["python_files"]["total_lines"]
+        )
+        assert generous["python_files"]["sloc"] == exact["python_files"]["sloc"]
+
+        with pytest.raises(ValueError):
+            MetricsCollector(project, deadline=0)
+
+    def test_timed_out_sections_are_flagged(self, project: Path, monkeypatch):
+        """Une phase coupée par l'échéance ne passe pas pour une mesure."""
+        release = threading.Event()
+        monkeypatch.setattr(
+            MetricsCollector, "_count_tests", lambda self: release.wait(5) and 7
+        )
+        try:
+            metrics = MetricsCollector(
+                project, languages=True, deadline=0.2
+            ).collect_all_metrics()
+        finally:
+            release.set()
+
+        assert metrics["collection_info"]["phases"]["tests"]["status"] == "timeout"
+        assert metrics["test_metrics"]["collected_tests_count"] == 0
+        assert metrics["test_metrics"]["incomplete"] is True
+        summary = metrics["summary"]
+        assert "test_metrics" in summary["incomplete_sections"]
+        assert "collected_tests" in summary["incomplete_fields"]
+        assert "incomplete" not in metrics["python_files"]
+        assert "lines_of_code" not in summary["incomplete_fields"]
+
+        exact = MetricsCollector(project).collect_all_metrics()
+        assert "incomplete_sections" not in exact["summary"]
+        assert "incomplete" not in exact["test_metrics"]
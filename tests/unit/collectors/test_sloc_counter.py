@@ -0,0 +1,101 @@
+"""
+Tests de la répartition des lignes par tokenize.
+"""
+
+import io
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors import file_analysis
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.sloc_counter import (
+    classify_lines,
+    count_sloc_file,
+)
+from arkalia_metrics_collector.exporters.badges_generator import BadgesGenerator
+
+SOURCE = b'''#!/usr/bin/env python3
+"""Docstring du module.
+
+Suite.
+"""
+
+import os  # commentaire en fin de ligne
+
+
+class Service:
+    """Docstring de classe."""
+
+    template = """chaine
+multiligne"""
+
+    def run(self):
+        # commentaire seul
+        "docstring d'une ligne"
+        return os.sep
+
+
+"expression" + "seule"
+def inline(): "pas une docstring"
+'''
+
+
+def _classify(source: bytes) -> dict[str, int]:
+    return classify_lines(io.BytesIO(source).readline)
+
+
+class TestSlocCounter:
+    """Tests pour classify_lines et la répartition collectée."""
+
+    def test_breakdown(self):
+        """Code, commentaires, docstrings et lignes vides."""
+        assert _classify(SOURCE) == {
+            "sloc": 8,
+            "comment_lines": 2,
+            "docstring_lines": 6,
+            "blank_lines": 7,
+        }
+        assert sum(_classify(SOURCE).values()) == SOURCE.count(b"\n")
+
+    def test_edge_cases(self):
+        """Fichier vide, sans saut de ligne final, continuation et if."""
+        assert sum(_classify(b"").values()) == 0
+        assert _classify(b"x = 1")["sloc"] == 1
+        assert _classify(b'x = (\n    "a"\n    # note\n)\n')["sloc"] == 3
+        # Une chaîne en tête d'un bloc if n'est pas une docstring
+        assert _classify(b'if x:\n    "texte"\n')["docstring_lines"] == 0
+
+    def test_untokenizable_file(self, tmp_path: Path):
+        """Un fichier non tokenisable donne None, compté comme du code."""
+        (tmp_path / "ok.py").write_bytes(SOURCE)
+        (tmp_path / "broken.py").write_text('x = """non fermée\n\n')
+        assert count_sloc_file(tmp_path / "broken.py") is None
+
+        summary = MetricsCollector(tmp_path, sloc=True).collect_all_metrics()["summary"]
+
+        assert summary["sloc"] == 8 + 2
+        assert summary["blank_lines"] == 7
+        assert summary["lines_of_code"] == sum(
+            summary[key]
+            for key in ("sloc", "comment_lines", "docstring_lines", "blank_lines")
+        )
+
+    def test_sloc_is_opt_in(self, tmp_path: Path, monkeypatch):
+        """Sans l'option sloc, aucun module n'est tokenisé."""
+        (tmp_path / "ok.py").write_bytes(SOURCE)
+        calls = []
+        monkeypatch.setitem(
+            file_analysis.ANALYZERS, "sloc", lambda *args: calls.append(args)
+        )
+
+        metrics = MetricsCollector(tmp_path).collect_all_metrics()
+
+        assert not calls
+        assert metrics["summary"]["lines_of_code"] == SOURCE.count(b"\n")
+        assert "sloc" not in metrics["summary"]
+        assert "comment_lines" not in metrics["python_files"]
+
+    def test_sloc_badge(self):
+        """Badge SLOC généré quand le résumé contient sloc."""
+        badges = BadgesGenerator().generate_metrics_badges({"summary": {"sloc": 1234}})
+
+        assert "![SLOC](https://img.shields.io/badge/SLOC-1,234-green" in badges
@@ -0,0 +1,159 @@
+"""
+Tests du comptage statique des tests.
+"""
+
+import subprocess  # nosec B404
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.test_counter import (
+    count_tests_in_source,
+    is_test_module,
+)
+
+
+def _count(source: str) -> int:
+    return count_tests_in_source(textwrap.dedent(source))
+
+
+class TestStaticTestCounter:
+    """Tests pour count_tests_in_source."""
+
+    def test_functions_and_classes(self):
+        """Fonctions test*, méthodes des classes Test* et helpers ignorés."""
+        source = """
+            def helper():
+                pass
+
+            def test_a():
+                pass
+
+            async def test_b():
+                pass
+
+            class TestGroup:
+                def test_one(self):
+                    pass
+
+                def setup_method(self):
+                    pass
+
+                class TestNested:
+                    def test_inner(self):
+                        pass
+
+            class Helper:
+                def test_not_collected(self):
+                    pass
+
+            class TestWithInit:
+                def __init__(self):
+                    pass
+
+                def test_skipped(self):
+                    pass
+        """
+        assert _count(source) == 4
+
+    def test_unittest_and_inheritance(self):
+        """Sous-classes de TestCase et méthodes héritées dans le module."""
+        source = """
+            import unittest
+
+            class Base(unittest.TestCase):
+                def test_base(self):
+                    pass
+
+            class Child(Base):
+                def test_child(self):
+                    pass
+
+            class Mixin:
+                def test_mixin(self):
+                    pass
+
+            class TestCombined(Mixin):
+                def test_own(self):
+                    pass
+        """
+        # Base: 1, Child: 2 (héritée + propre), TestCombined: 2
+        assert _count(source) == 5
+
+    def test_parametrize(self):
+        """parametrize littéral multiplié, empilé, sur classe et pytestmark."""
+        source = """
+            import pytest
+
+            pytestmark = [pytest.mark.slow]
+
+            @pytest.mark.parametrize("x", [1, 2, 3])
+            @pytest.mark.parametrize("y", (1, 2))
+            def test_grid(x, y):
+                pass
+
+            @pytest.mark.parametrize("x", VALUES)
+            def test_dynamic(x):
+                pass
+
+            @pytest.mark.parametrize(("a", "b"), [(1, 2), pytest.param(3, 4)])
+            class TestParams:
+                def test_a(self, a, b):
+                    pass
+
+                @pytest.mark.parametrize("c", [1, 2])
+                def test_b(self, a, b, c):
+                    pass
+        """
+        # 6 + 1 + 2 * (1 + 2)
+        assert _count(source) == 13
+
+    def test_disabled_and_invalid(self):
+        """__test__ = False et modules invalides ne comptent pas."""
+        assert (
+            _count("class TestX:\n    __test__ = False\n    def test_a(self): ...") == 0
+        )
+        assert _count("def test_a(:\n") == 0
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("test_core.py", True), ("core_test.py", True), ("conftest.py", False)],
+    )
+    def test_is_test_module(self, name: str, expected: bool):
+        """Noms de modules collectés par pytest."""
+        assert is_test_module(name) is expected
+
+    def test_collector_counts_without_importing(self, tmp_path: Path):
+        """Le collecteur compte sans importer le code (import cassé ici)."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "conftest.py").write_text("def test_fixture(): ...\n")
+        (tmp_path / "tests" / "test_app.py").write_text(
+            "import missing_dependency\n\n"
+            "def test_a():\n    pass\n\n"
+            "def test_b():\n    pass\n"
+        )
+
+        sequential = MetricsCollector(tmp_path).collect_test_metrics()
+        parallel = MetricsCollector(tmp_path, jobs=2).collect_test_metrics()
+
+        assert sequential["collected_tests_count"] == 2
+        assert parallel["collected_tests_count"] == 2
+
+    def test_pytest_counter_counts_node_ids(self, tmp_path: Path, monkeypatch):
+        """Le moteur pytest ne compte que les identifiants de tests."""
+        output = (
+            "tests/test_app.py::test_a\n"
+            "tests/test_app.py::test_b\n"
+            "\n"
+            "2 tests collected in 0.01s\n"
+        )
+
+        def fake_run(*args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        collector = MetricsCollector(tmp_path, test_counter="pytest")
+
+        assert collector._collect_pytest_tests() == 2
@@ -167,6 +167,37 @@ class TestMetricsExporter:
         )  # Votre implémentation utilise "Lignes de Code"
         assert "Tests,2" in content
 
+    def test_export_sloc_breakdown(
+        self, sample_metrics_data: dict, temp_output_dir: Path
+    ):
+        """Test de l'export de la répartition SLOC (CSV et Markdown)."""
+        sample_metrics_data["summary"].update(
+            sloc=100, comment_lines=10, docstring_lines=15, blank_lines=25
+        )
+        exporter = MetricsExporter(sample_metrics_data)
+
+        assert exporter.export_csv(str(temp_output_dir / "metrics.csv")) is True
+        assert exporter.export_markdown_summary(str(temp_output_dir / "m.md")) is True
+
+        content = (temp_output_dir / "metrics.csv").read_text(encoding="utf-8")
+        assert "Code Source (SLOC),100,lignes" in content
+        assert "Lignes de Docstrings,15,lignes" in content
+        assert "Lignes Vides,25,lignes" in content
+        assert "`100 lignes`" in (temp_output_dir / "m.md").read_text(encoding="utf-8")
+
+    def test_export_without_sloc(
+        self, sample_metrics_data: dict, temp_output_dir: Path
+    ):
+        """Sans répartition SLOC collectée, les exports n'affichent pas de zéros."""
+        exporter = MetricsExporter(sample_metrics_data)
+
+        assert exporter.export_csv(str(temp_output_dir / "metrics.csv")) is True
+        assert exporter.export_markdown_summary(str(temp_output_dir / "m.md")) is True
+
+        content = (temp_output_dir / "metrics.csv").read_text(encoding="utf-8")
+        assert "SLOC" not in content
+        assert "SLOC" not in (temp_output_dir / "m.md").read_text(encoding="utf-8")
+
     def test_export_all_formats(self, sample_metrics_data: dict, temp_output_dir: Path):
         """Test de l'export de tous les formats."""
         exporter = MetricsExporter(sample_metrics_data)
@@ -0,0 +1,147 @@
+"""
+Tests des hooks d'instrumentation.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.exporters.metrics_exporter import MetricsExporter
+from arkalia_metrics_collector.instrumentation import TimingRecorder, hooks
+from arkalia_metrics_collector.instrumentation.calls import (
+    http_request,
+    open_command,
+    run_command,
+)
+from arkalia_metrics_collector.notifications.notifiers import (
+    DiscordNotifier,
+    SlackNotifier,
+)
+
+
+@pytest.fixture
+def events():
+    """Abonne un enregistreur à tous les événements le temps du test."""
+    received: list[tuple[str, dict[str, Any]]] = []
+    subscribed = []
+    for event in (
+        "on_phase_start",
+        "on_phase_end",
+        "on_file_analyzed",
+        "on_subprocess",
+        "on_http_request",
+        "on_cache_hit",
+        "on_cache_miss",
+        "on_export",
+    ):
+
+        def hook(_event: str = event, **kwargs: Any) -> None:
+            received.append((_event, kwargs))
+
+        subscribed.append((event, hooks.register(event, hook)))
+    yield received
+    for event, hook in subscribed:
+        hooks.unregister(event, hook)
+
+
+class TestHooks:
+    """Tests pour HookRegistry et les événements émis par les collecteurs."""
+
+    def test_registry(self, events):
+        """Phases, commandes et requêtes émettent leurs événements."""
+        recorder = TimingRecorder()
+        with recorder.phase("python"):
+            pass
+
+        def failing(**kwargs: Any) -> None:
+            raise RuntimeError("hook cassé")
+
+        hooks.register("on_subprocess", failing)
+        try:
+            run_command([sys.executable, "-c", "pass"], timeout=30)
+            with pytest.raises(OSError):
+                run_command(["arkalia-commande-inexistante"])
+            with open_command(
+                [sys.executable, "-c", "print('ok')"], stdout=subprocess.PIPE
+            ) as proc:
+                assert proc.stdout is not None
+                assert proc.stdout.read().strip() == b"ok"
+        finally:
+            hooks.unregister("on_subprocess", failing)
+        with http_request("GET", "https://example.invalid/") as call:
+            call.status = 404
+
+        names = [name for name, _ in events]
+        assert names[:2] == ["on_phase_start", "on_phase_end"]
+        assert events[1][1]["phase"] == "python" and events[1][1]["seconds"] >= 0
+        commands = [kwargs for name, kwargs in events if name == "on_subprocess"]
+        assert [c["returncode"] for c in commands] == [0, None, 0]
+        (request,) = [kwargs for name, kwargs in events if name == "on_http_request"]
+        assert request["status"] == 404 and request["method"] == "GET"
+        with pytest.raises(ValueError):
+            hooks.register("on_inconnu", failing)
+
+    @pytest.mark.parametrize(
+        ("notifier_class", "url", "origin"),
+        [
+            (
+                SlackNotifier,
+                "https://hooks.slack.com/services/T0/B0/secret",
+                "https://hooks.slack.com",
+            ),
+            (
+                DiscordNotifier,
+                "https://discord.com/api/webhooks/1/secret",
+                "https://discord.com",
+            ),
+        ],
+    )
+    def test_webhook_notifiers(self, events, monkeypatch, notifier_class, url, origin):
+        """Les webhooks émettent on_http_request sans leur jeton."""
+        requests = pytest.importorskip("requests")
+
+        class Response:
+            status_code = 204
+
+        monkeypatch.setattr(requests, "post", lambda *args, **kwargs: Response())
+
+        notifier_class(url).send("message")
+
+        (request,) = [kwargs for name, kwargs in events if name == "on_http_request"]
+        assert request["method"] == "POST" and request["status"] == 204
+        assert request["url"] == origin
+
+    def test_collector_files_and_caches(self, events, tmp_path: Path):
+        """Fichiers analysés puis servis par le cache stat au second run."""
+        project = tmp_path / "project"
+        project.mkdir()
+        for i in range(3):
+            (project / f"m{i}.py").write_text("a = 1\n" * (i + 1))
+
+        MetricsCollector(project, cache=True).collect_python_metrics()
+        first = list(events)
+        events.clear()
+        MetricsCollector(project, cache=True).collect_python_metrics()
+
+        def keys(received, name):
+            return sorted(kwargs["key"] for event, kwargs in received if event == name)
+
+        analyzed = [k for e, k in first if e == "on_file_analyzed"]
+        assert sorted(k["path"] for k in analyzed) == ["m0.py", "m1.py", "m2.py"]
+        assert not any(k["cached"] for k in analyzed)
+        assert keys(first, "on_cache_miss") == ["m0.py", "m1.py", "m2.py"]
+        assert keys(events, "on_cache_hit") == ["m0.py", "m1.py", "m2.py"]
+        assert all(k["cache"] == "stat" for e, k in events if e == "on_cache_hit")
+
+    def test_export_hook(self, events, tmp_path: Path):
+        """Chaque export émet on_export avec son succès."""
+        exporter = MetricsExporter({"summary": {}})
+
+        assert exporter.export_json(str(tmp_path / "metrics.json"))
+
+        (export,) = [kwargs for name, kwargs in events if name == "on_export"]
+        assert export["exporter"] == "json" and export["success"] is True
@@ -0,0 +1,79 @@
+"""
+Tests du profilage CPU et mémoire.
+"""
+
+import pstats
+import threading
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.phases import Phase, run_phases
+from arkalia_metrics_collector.instrumentation import TimingRecorder
+from arkalia_metrics_collector.instrumentation.profiling import (
+    CpuProfile,
+    MemoryProfile,
+    _Profile,
+    create_profile,
+    profiling_active,
+)
+
+
+def _busy_function() -> int:
+    return sum(i * i for i in range(20000))
+
+
+class TestProfiling:
+    """Tests pour CpuProfile, MemoryProfile et leurs effets sur les phases."""
+
+    def test_cpu_profile(self, tmp_path: Path):
+        """Le profil CPU écrit un .pstats et résume les fonctions coûteuses."""
+        profile = create_profile("cpu", tmp_path / "run.pstats", top=5)
+        assert isinstance(profile, CpuProfile)
+
+        with profile:
+            assert profiling_active()
+            # Les phases restent dans le thread profilé
+            threads = run_phases(
+                [
+                    Phase("a", lambda: threading.get_ident()),
+                    Phase("b", lambda: _busy_function()),
+                ]
+            )
+        summary = profile.summary()
+
+        assert not profiling_active()
+        assert threads["a"].value == threading.get_ident()
+        stats = pstats.Stats(str(tmp_path / "run.pstats"))
+        assert any(func[2] == "_busy_function" for func in stats.stats)
+        assert "function calls" in summary
+
+    def test_memory_profile_per_phase(self, tmp_path: Path):
+        """Chaque phase reçoit son pic et ses sites d'allocation."""
+        recorder = TimingRecorder()
+        profile = MemoryProfile(tmp_path / "memory.json", top=3)
+
+        with profile:
+            with recorder.phase("outer"):
+                with recorder.phase("alloc"):
+                    kept = [bytearray(1024) for _ in range(512)]
+                del kept
+
+        phases = {phase["phase"]: phase for phase in profile.phases}
+        assert list(phases) == ["alloc", "outer"]
+        assert phases["alloc"]["peak_bytes"] >= 512 * 1024
+        assert phases["outer"]["peak_bytes"] >= phases["alloc"]["peak_bytes"]
+        assert phases["alloc"]["net_bytes"] >= 512 * 1024
+        assert "test_profiling.py" in phases["alloc"]["top"][0]["site"]
+        assert (tmp_path / "memory.json").exists()
+        assert "alloc: pic" in profile.summary()
+
+    def test_profile_base_is_abstract(self, tmp_path: Path):
+        """Un profil doit implémenter démarrage, arrêt, écriture et résumé."""
+
+        class PartialProfile(_Profile):
+            def _start(self) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            PartialProfile(tmp_path / "out")
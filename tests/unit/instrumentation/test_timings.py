@@ -0,0 +1,106 @@
+"""
+Tests du chronométrage des phases de collecte.
+"""
+
+import threading
+from pathlib import Path
+
+from arkalia_metrics_collector.collectors.metrics_collector import MetricsCollector
+from arkalia_metrics_collector.collectors.multi_project_aggregator import (
+    MultiProjectAggregator,
+)
+from arkalia_metrics_collector.instrumentation import TimingRecorder, format_timings
+
+
+def _project(root: Path) -> Path:
+    """Petit projet : deux modules, un test et un README."""
+    (root / "pkg").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    (root / "pkg" / "b.py").write_text("b = 2\nc = 3\n")
+    (root / "tests" / "test_a.py").write_text("def test_a():\n    pass\n")
+    (root / "README.md").write_text("# Projet\n")
+    return root
+
+
+class TestTimingRecorder:
+    """Tests pour TimingRecorder et collection_info.timings."""
+
+    def test_phases_per_thread(self):
+        """add() impute à la phase du thread appelant, cumul par nom."""
+        recorder = TimingRecorder()
+        recorder.add(5, 500)  # hors phase : ignoré
+
+        def worker() -> None:
+            with recorder.phase("io"):
+                recorder.add(2, 20)
+
+        with recorder.phase("cpu"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            recorder.add(1, 10)
+        with recorder.phase("cpu"):
+            recorder.add(1, 10)
+        recorder.record("enumeration", 0.5, files=100)
+        recorder.add_input(100, 1000)
+
+        timings = recorder.to_dict()
+        phases = timings["phases"]
+        assert list(phases) == ["cpu", "io", "enumeration"]
+        assert (phases["cpu"]["files"], phases["cpu"]["bytes"]) == (2, 20)
+        assert (phases["io"]["files"], phases["io"]["bytes"]) == (2, 20)
+        assert phases["enumeration"]["cpu_seconds"] is None
+        assert phases["enumeration"]["files_per_second"] == 200.0
+        # Le total ne somme pas les phases : seulement les entrées uniques
+        assert (timings["total"]["files"], timings["total"]["bytes"]) == (100, 1000)
+        assert (recorder.total_files, recorder.total_bytes) == (100, 1000)
+
+        table = format_timings(timings).splitlines()
+        assert table[0].split() == [
+            "Phase",
+            "Mur",
+            "(s)",
+            "CPU",
+            "(s)",
+            "Fichiers",
+            "Octets",
+            "Fichiers/s",
+        ]
+        assert table[-1].startswith("total")
+
+    def test_running_phase(self):
+        """Une phase non terminée est signalée sans temps CPU."""
+        recorder = TimingRecorder()
+        with recorder.phase("slow"):
+            info = recorder.to_dict()["phases"]["slow"]
+        assert info["running"] is True
+        assert info["cpu_seconds"] is None
+        assert "running" not in recorder.to_dict()["phases"]["slow"]
+
+    def test_collection_timings(self, tmp_path: Path):
+        """collect_all_metrics et l'agrégateur publient leurs mesures."""
+        project = _project(tmp_path / "project")
+        metrics = MetricsCollector(project).collect_all_metrics()
+
+        timings = metrics["collection_info"]["timings"]
+        phases = timings["phases"]
+        assert next(iter(phases)) == "enumeration"
+        assert set(metrics["collection_info"]["phases"]) <= set(phases)
+        assert phases["python"]["files"] == 3
+        assert phases["python"]["bytes"] == sum(
+            path.stat().st_size for path in project.rglob("*.py")
+        )
+        assert phases["documentation"]["files"] == 1
+        assert timings["total"]["wall_seconds"] > 0
+        # Chaque fichier compté une fois, même analysé par plusieurs phases
+        assert timings["total"]["files"] == phases["enumeration"]["files"] == 4
+        assert timings["total"]["bytes"] == sum(
+            path.stat().st_size for path in project.rglob("*") if path.is_file()
+        )
+
+        aggregator = MultiProjectAggregator(enable_history=False)
+        aggregator.collect_project("project", project)
+        aggregated = aggregator.aggregate_metrics()
+        metrics_timing = aggregated["collection_info"]["timings"]["phases"]["metrics"]
+        assert metrics_timing["files"] == timings["total"]["files"]
@@ -0,0 +1,92 @@
+"""
+Tests des traces Chrome (spans locaux).
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from arkalia_metrics_collector.collectors.analysis_pool import AnalysisPool
+from arkalia_metrics_collector.collectors.file_analysis import analyze_batch
+from arkalia_metrics_collector.instrumentation import (
+    TimingRecorder,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+from arkalia_metrics_collector.instrumentation.tracing import current_tracer
+
+
+@traced(category="export")
+def _export() -> str:
+    return "ok"
+
+
+@pytest.fixture
+def tracer():
+    """Trace active le temps du test."""
+    active = start_tracing()
+    yield active
+    stop_tracing()
+
+
+class TestTracing:
+    """Tests pour Tracer, span, traced et les spans des workers."""
+
+    def test_no_tracer_is_noop(self):
+        """Sans trace active, span() renvoie un contexte vide partagé."""
+        assert current_tracer() is None
+        with span("a") as first, span("b") as second:
+            first.set(status=200)
+        assert first is second
+        assert _export() == "ok"
+
+    def test_spans_and_chrome_format(self, tracer, tmp_path: Path):
+        """Phases, spans imbriqués, erreurs et une piste par thread."""
+        recorder = TimingRecorder()
+        with recorder.phase("python"):
+            with span("GET", "http", url="u") as request:
+                request.set(status=404)
+            assert _export() == "ok"
+        with pytest.raises(ValueError), span("boom"):
+            raise ValueError
+
+        worker = threading.Thread(target=_export, name="worker-1")
+        worker.start()
+        worker.join()
+
+        spans = {s["name"]: s for s in tracer.spans}
+        assert spans["python"]["cat"] == "phase"
+        assert spans["GET"]["args"] == {"url": "u", "status": 404}
+        assert spans["boom"]["args"] == {"error": "ValueError"}
+        assert spans["python"]["dur"] >= spans["GET"]["dur"]
+        assert spans["GET"]["ts"] >= spans["python"]["ts"]
+
+        trace = json.loads(tracer.save(tmp_path / "trace.json").read_text())
+        events = trace["traceEvents"]
+        threads = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+        assert {"MainThread", "worker-1"} <= threads
+        assert sum(1 for e in events if e["ph"] == "X") == 5
+
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    def test_pool_batches_on_worker_tracks(self, tracer, tmp_path: Path, kind: str):
+        """Chaque lot du pool est un span sur la piste de son worker."""
+        items = []
+        for i in range(8):
+            path = tmp_path / f"f{i}.py"
+            path.write_text("x\n" * i)
+            items.append((str(path), ("lines",)))
+
+        with AnalysisPool(jobs=2) as pool:
+            results = pool.map_batches(analyze_batch, items, kind=kind)
+
+        assert results == [{"lines": i} for i in range(8)]
+        batches = [s for s in tracer.spans if s["name"] == "analyze_batch"]
+        assert sum(s["args"]["files"] for s in batches) == 8
+        tracks = {(s["pid"], s["tid"]) for s in batches}
+        assert (tracer.pid, threading.get_ident()) not in tracks
+        if kind == "process":
+            assert all(s["pid"] != tracer.pid for s in batches)